@@ -19,6 +19,7 @@ setup(
         "starslayer" : ["json/actions/*.json",
                         "json/profiles/*.json",
                         "json/scores/*.json",
+                        "json/spawns/*.json",
 
                         "textures/icon/*.gif",
                         "textures/player/star_slayer/*.customppm",
@@ -1,8 +1,5 @@
 """
-Start the game.
-"""
-
-from .gamelib import init
-from .main import main
+Star Slayer Package.
 
-init(main)
+The game is started with 'python -m starslayer'.
+"""
@@ -0,0 +1,66 @@
+"""
+Start the game.
+"""
+
+from argparse import ArgumentParser
+from os import getenv
+from time import perf_counter
+
+from .auxiliar import seed_rng
+from .backends import Backend, NullBackend, init, set_backend
+from .consts import BACKEND_ENV, DEFAULT_BACKEND
+from .main import main
+from .replay import InputReplayer
+
+parser = ArgumentParser(prog="python -m starslayer",
+                        description="Plays Star Slayer.")
+parser.add_argument("--backend",
+                    choices=sorted(Backend.types),
+                    help="what to draw the game with (default: the " +
+                         "STARSLAYER_BACKEND environment variable, or 'tk')")
+parser.add_argument("--record-draws",
+                    metavar="PATH",
+                    help="record every draw command into PATH, to be read with " +
+                         "'python -m starslayer.drawlog'")
+parser.add_argument("--frames",
+                    type=int,
+                    metavar="N",
+                    help="with the null backend, stop after N frames (default: as many " +
+                         "as the replay has) and report how fast they were run")
+parser.add_argument("--replay",
+                    metavar="PATH",
+                    help="with the null backend, play the input recorded in PATH")
+arguments = parser.parse_args()
+
+if arguments.backend:
+    set_backend(arguments.backend)
+
+if (arguments.backend or getenv(BACKEND_ENV) or DEFAULT_BACKEND) == NullBackend.name:
+    if arguments.frames is not None and arguments.frames <= 0:
+        parser.error("--frames must be positive")
+
+    replayer = (InputReplayer(arguments.replay) if arguments.replay else None)
+    frames = arguments.frames or (replayer.total_ticks if replayer else None)
+
+    if not frames:
+        parser.error("the null backend has no input of its own, so it needs " +
+                     "--frames or --replay to know when to stop")
+
+    if replayer:
+        seed_rng(replayer.seed)
+
+    null_backend = NullBackend(max_frames=frames, script=(replayer.ticks if replayer else None))
+    set_backend(null_backend)
+
+    start = perf_counter()
+    init(main, [None, arguments.record_draws])
+    elapsed = perf_counter() - start
+
+    print(f"{null_backend.frames} frames in {elapsed:.2f}s " +
+          f"({null_backend.frames / elapsed:.1f} frames per second)")
+
+elif arguments.frames is not None or arguments.replay:
+    parser.error("--frames and --replay can only be used with the null backend")
+
+else:
+    init(main, [None, arguments.record_draws])
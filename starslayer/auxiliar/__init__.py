@@ -3,4 +3,5 @@ Auxiliar Package.
 """
 
 from .func_aux import *
+from .rng import *
 from .singleton import *
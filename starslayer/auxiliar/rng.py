@@ -0,0 +1,51 @@
+"""
+RNG Module. Holds the random number generator that the
+simulation uses, so that a run can be reproduced from its seed.
+"""
+
+from random import Random, SystemRandom
+from typing import Optional
+
+_game_rng: Random = Random()
+
+
+def get_rng() -> Random:
+    """
+    Returns the random number generator used by the simulation.
+
+    Only the game logic should use it. Anything that is purely visual
+    should keep using the `random` module, so that drawing more or less
+    frames does not change the outcome of a run.
+    """
+
+    return _game_rng
+
+
+def set_rng(new_rng: Random) -> Random:
+    """
+    Replaces the random number generator used by the simulation.
+    Returns the one that was being used before.
+    """
+
+    global _game_rng # pylint: disable=global-statement, invalid-name
+
+    old_rng = _game_rng
+    _game_rng = new_rng
+
+    return old_rng
+
+
+def seed_rng(seed: Optional[int]=None) -> int:
+    """
+    Seeds the random number generator of the simulation.
+
+    If `seed` is not provided, a new one is drawn from the system.
+    Either way, the seed used is returned so it can be stored.
+    """
+
+    if seed is None:
+        seed = SystemRandom().randrange(2 ** 32)
+
+    _game_rng.seed(seed)
+
+    return seed
@@ -0,0 +1,9 @@
+"""
+Backends Package. The windows the game can be drawn in,
+and where it takes its input from.
+"""
+
+from .backend import *
+from .null_backend import *
+from .pygame_backend import *
+from .tk_backend import *
@@ -0,0 +1,524 @@
+"""
+Backend Module. Contains the interface every backend implements,
+and the functions the game draws and takes its input through.
+"""
+
+from abc import ABC, abstractmethod
+from os import getenv
+from typing import (TYPE_CHECKING, Any, Callable, Dict, List, Optional,
+                    Sequence, Tuple)
+
+from ..consts import BACKEND_ENV, DEFAULT_BACKEND
+
+if TYPE_CHECKING:
+    from ..gamelib import Event, EventType
+
+DrawOptions = Any
+Shapes = Sequence[Sequence[float]]
+
+
+class Backend(ABC):
+    """
+    Where the game is drawn, and where its input comes from.
+
+    The drawing methods follow the ones of 'gamelib', so
+    the Tk backend is just a thin layer over it.
+    """
+
+    name: str = ""
+    types: Dict[str, "Backend"]
+
+    def __init_subclass__(cls) -> None:
+        """
+        Registers subclasses by their name.
+        """
+
+        try:
+            Backend.types[cls.name] = cls
+
+        except AttributeError:
+            Backend.types = {cls.name: cls}
+
+
+    @abstractmethod
+    def init(self, game_main: Callable[..., Any], args: Optional[Sequence[Any]]=None) -> None:
+        """
+        Opens the window and runs 'game_main' until it returns.
+        """
+
+
+    @abstractmethod
+    def title(self, new_title: str) -> None:
+        """
+        Sets the title of the window.
+        """
+
+
+    @abstractmethod
+    def icon(self, path: str) -> None:
+        """
+        Sets the icon of the window to the image in 'path'.
+        """
+
+
+    @abstractmethod
+    def resize(self, width: int, height: int) -> None:
+        """
+        Changes the size of the window.
+        """
+
+
+    @abstractmethod
+    def is_alive(self) -> bool:
+        """
+        Returns 'True' if the window is still open, or 'False' otherwise.
+        """
+
+
+    @abstractmethod
+    def loop(self, fps: int=30) -> bool:
+        """
+        Waits for the next frame, and returns 'True' if the window is still open.
+        """
+
+
+    @abstractmethod
+    def get_events(self) -> List["Event"]:
+        """
+        Returns the events that happened since the last time it was called.
+        """
+
+
+    @abstractmethod
+    def wait(self, event_type: Optional["EventType"]=None) -> Optional["Event"]:
+        """
+        Waits for the next event (of 'event_type', if given) and returns it,
+        or 'None' if the window was closed.
+        """
+
+
+    @abstractmethod
+    def say(self, message: str) -> None:
+        """
+        Shows a message to the user.
+        """
+
+
+    @abstractmethod
+    def input(self, prompt: str) -> Optional[str]:
+        """
+        Asks the user for some text, and returns it.
+        """
+
+
+    @abstractmethod
+    def play_sound(self, path: str) -> None:
+        """
+        Plays the sound in 'path'.
+        """
+
+
+    @abstractmethod
+    def draw_begin(self) -> None:
+        """
+        Starts a new frame.
+        """
+
+
+    @abstractmethod
+    def draw_end(self) -> None:
+        """
+        Shows the frame drawn since 'draw_begin'.
+        """
+
+
+    def paint_stats(self) -> Tuple[float, int]:
+        """
+        Returns how many seconds were spent painting frames apart from
+        'draw_end', and how many frames were dropped, since the start.
+        Backends that paint within 'draw_end' have nothing to add.
+        """
+
+        return 0.0, 0
+
+
+    @abstractmethod
+    def draw_image(self, path: str, x: float, y: float) -> None: # pylint: disable=invalid-name
+        """
+        Draws the image in 'path' with its top left corner at ('x', 'y').
+        """
+
+
+    @abstractmethod
+    # pylint: disable=invalid-name
+    def draw_image_data(self, name: str, data: bytes, x: float, y: float) -> None:
+        """
+        Draws an image given as the bytes of a binary PPM file.
+        """
+
+
+    def forget_image(self, path: str) -> None:
+        """
+        Frees the image in 'path', if it was kept loaded after being drawn.
+        Backends that keep no images have nothing to free.
+        """
+
+
+    @abstractmethod
+    # pylint: disable=invalid-name, too-many-arguments
+    def draw_text(self,
+                  text: str,
+                  x: float,
+                  y: float,
+                  font: Optional[str]=None,
+                  size: int=12,
+                  bold: bool=False,
+                  italic: bool=False,
+                  **options: DrawOptions) -> None:
+        """
+        Draws some text at ('x', 'y').
+        """
+
+
+    @abstractmethod
+    # pylint: disable=invalid-name
+    def draw_arc(self, x1: float, y1: float, x2: float, y2: float, **options: DrawOptions) -> None:
+        """
+        Draws an arc in the bounding box between two corners.
+        """
+
+
+    @abstractmethod
+    # pylint: disable=invalid-name
+    def draw_line(self, x1: float, y1: float, x2: float, y2: float, **options: DrawOptions) -> None:
+        """
+        Draws a straight line between two points.
+        """
+
+
+    @abstractmethod
+    def draw_polyline(self, points: Sequence[float], **options: DrawOptions) -> None:
+        """
+        Draws a line through every pair of 'points', without closing it.
+        """
+
+
+    @abstractmethod
+    def draw_lines(self, segments: Shapes, **options: DrawOptions) -> None:
+        """
+        Draws many straight lines with the same options, each
+        given as 'x1', 'y1', 'x2' and 'y2'.
+        """
+
+
+    @abstractmethod
+    # pylint: disable=invalid-name
+    def draw_oval(self, x1: float, y1: float, x2: float, y2: float, **options: DrawOptions) -> None:
+        """
+        Draws an ellipse in the bounding box between two corners.
+        """
+
+
+    @abstractmethod
+    def draw_ovals(self, boxes: Shapes, **options: DrawOptions) -> None:
+        """
+        Draws many ellipses with the same options, each in its bounding box.
+        """
+
+
+    @abstractmethod
+    def draw_polygon(self, points: Sequence[float], **options: DrawOptions) -> None:
+        """
+        Draws a polygon whose vertices are each pair of 'points'.
+        """
+
+
+    @abstractmethod
+    # pylint: disable=invalid-name
+    def draw_rectangle(self,
+                       x1: float,
+                       y1: float,
+                       x2: float,
+                       y2: float,
+                       **options: DrawOptions) -> None:
+        """
+        Draws a rectangle between two corners.
+        """
+
+
+    @abstractmethod
+    def draw_rectangles(self, boxes: Shapes, **options: DrawOptions) -> None:
+        """
+        Draws many rectangles with the same options, each between two corners.
+        """
+
+
+_backend: Optional[Backend] = None
+
+
+def backend_named(name: str) -> Backend:
+    """
+    Creates the backend registered under 'name'.
+    """
+
+    if name not in Backend.types:
+        raise ValueError(f"There is no backend named '{name}'. " +
+                         f"The available ones are: {', '.join(sorted(Backend.types))}.")
+
+    return Backend.types[name]()
+
+
+def get_backend() -> Backend:
+    """
+    Returns the backend in use. If none was set, it is the one named in
+    the environment variable 'BACKEND_ENV', or else 'DEFAULT_BACKEND'.
+    """
+
+    global _backend # pylint: disable=global-statement
+
+    if _backend is None:
+        _backend = backend_named(getenv(BACKEND_ENV) or DEFAULT_BACKEND)
+
+    return _backend
+
+
+def set_backend(new_backend: Backend | str) -> Optional[Backend]:
+    """
+    Changes the backend in use, by itself or by its name, and returns the old one.
+    """
+
+    global _backend # pylint: disable=global-statement
+
+    old_backend = _backend
+    _backend = (backend_named(new_backend) if isinstance(new_backend, str) else new_backend)
+
+    return old_backend
+
+
+def init(game_main: Callable[..., Any], args: Optional[Sequence[Any]]=None) -> None:
+    """
+    Opens the window of the backend in use and runs 'game_main' in it.
+    """
+
+    get_backend().init(game_main, args)
+
+
+def title(new_title: str) -> None:
+    """
+    Sets the title of the window.
+    """
+
+    get_backend().title(new_title)
+
+
+def icon(path: str) -> None:
+    """
+    Sets the icon of the window.
+    """
+
+    get_backend().icon(path)
+
+
+def resize(width: int, height: int) -> None:
+    """
+    Changes the size of the window.
+    """
+
+    get_backend().resize(width, height)
+
+
+def is_alive() -> bool:
+    """
+    Returns 'True' if the window is still open.
+    """
+
+    return get_backend().is_alive()
+
+
+def loop(fps: int=30) -> bool:
+    """
+    Waits for the next frame, and returns 'True' if the window is still open.
+    """
+
+    return get_backend().loop(fps)
+
+
+def get_events() -> List["Event"]:
+    """
+    Returns the events that happened since the last frame.
+    """
+
+    return get_backend().get_events()
+
+
+def wait(event_type: Optional["EventType"]=None) -> Optional["Event"]:
+    """
+    Waits for the next event, of 'event_type' if given.
+    """
+
+    return get_backend().wait(event_type)
+
+
+def say(message: str) -> None:
+    """
+    Shows a message to the user.
+    """
+
+    get_backend().say(message)
+
+
+def input(prompt: str) -> Optional[str]: # pylint: disable=redefined-builtin
+    """
+    Asks the user for some text.
+    """
+
+    return get_backend().input(prompt)
+
+
+def play_sound(path: str) -> None:
+    """
+    Plays the sound in 'path'.
+    """
+
+    get_backend().play_sound(path)
+
+
+def draw_begin() -> None:
+    """
+    Starts a new frame.
+    """
+
+    get_backend().draw_begin()
+
+
+def draw_end() -> None:
+    """
+    Shows the frame drawn since 'draw_begin'.
+    """
+
+    get_backend().draw_end()
+
+
+def paint_stats() -> Tuple[float, int]:
+    """
+    Returns the seconds spent painting frames apart from
+    'draw_end', and the frames dropped, since the start.
+    """
+
+    return get_backend().paint_stats()
+
+
+def draw_image(path: str, x: float, y: float) -> None: # pylint: disable=invalid-name
+    """
+    Draws the image in 'path'.
+    """
+
+    get_backend().draw_image(path, x, y)
+
+
+def forget_image(path: str) -> None:
+    """
+    Frees the image in 'path'.
+    """
+
+    get_backend().forget_image(path)
+
+
+def draw_image_data(name: str, data: bytes, x: float, y: float) -> None: # pylint: disable=invalid-name
+    """
+    Draws an image given as the bytes of a binary PPM file.
+    """
+
+    get_backend().draw_image_data(name, data, x, y)
+
+
+# pylint: disable=invalid-name, too-many-arguments
+def draw_text(text: str,
+              x: float,
+              y: float,
+              font: Optional[str]=None,
+              size: int=12,
+              bold: bool=False,
+              italic: bool=False,
+              **options: DrawOptions) -> None:
+    """
+    Draws some text.
+    """
+
+    get_backend().draw_text(text, x, y, font, size, bold, italic, **options)
+
+
+# pylint: disable=invalid-name
+def draw_arc(x1: float, y1: float, x2: float, y2: float, **options: DrawOptions) -> None:
+    """
+    Draws an arc.
+    """
+
+    get_backend().draw_arc(x1, y1, x2, y2, **options)
+
+
+# pylint: disable=invalid-name
+def draw_line(x1: float, y1: float, x2: float, y2: float, **options: DrawOptions) -> None:
+    """
+    Draws a straight line.
+    """
+
+    get_backend().draw_line(x1, y1, x2, y2, **options)
+
+
+def draw_polyline(points: Sequence[float], **options: DrawOptions) -> None:
+    """
+    Draws a line through many points.
+    """
+
+    get_backend().draw_polyline(points, **options)
+
+
+def draw_lines(segments: Shapes, **options: DrawOptions) -> None:
+    """
+    Draws many straight lines at once.
+    """
+
+    get_backend().draw_lines(segments, **options)
+
+
+# pylint: disable=invalid-name
+def draw_oval(x1: float, y1: float, x2: float, y2: float, **options: DrawOptions) -> None:
+    """
+    Draws an ellipse.
+    """
+
+    get_backend().draw_oval(x1, y1, x2, y2, **options)
+
+
+def draw_ovals(boxes: Shapes, **options: DrawOptions) -> None:
+    """
+    Draws many ellipses at once.
+    """
+
+    get_backend().draw_ovals(boxes, **options)
+
+
+def draw_polygon(points: Sequence[float], **options: DrawOptions) -> None:
+    """
+    Draws a polygon.
+    """
+
+    get_backend().draw_polygon(points, **options)
+
+
+# pylint: disable=invalid-name
+def draw_rectangle(x1: float, y1: float, x2: float, y2: float, **options: DrawOptions) -> None:
+    """
+    Draws a rectangle.
+    """
+
+    get_backend().draw_rectangle(x1, y1, x2, y2, **options)
+
+
+def draw_rectangles(boxes: Shapes, **options: DrawOptions) -> None:
+    """
+    Draws many rectangles at once.
+    """
+
+    get_backend().draw_rectangles(boxes, **options)
@@ -0,0 +1,261 @@
+"""
+Null Backend Module. A backend without a window, that draws nothing.
+"""
+
+from collections import deque
+from typing import (TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional,
+                    Sequence)
+
+from .backend import Backend, DrawOptions, Shapes
+
+if TYPE_CHECKING:
+    from ..gamelib import Event, EventType
+
+
+# pylint: disable=unused-argument
+class NullBackend(Backend):
+    """
+    A backend that draws nothing and never waits between frames, so the
+    game runs as fast as it can. Useful for measuring how fast it is.
+
+    Its only input are the events given to 'push_event', and those of
+    'script', which holds the events to read each time by how many times
+    they were read before, as an input log does by tick.
+    """
+
+    name: str = "null"
+
+    def __init__(self,
+                 *,
+                 max_frames: Optional[int]=None,
+                 script: Optional[Dict[int, List["Event"]]]=None) -> None:
+        """
+        Initializes an instance of type 'NullBackend'.
+
+        If 'max_frames' is given, the window counts as closed once
+        that many frames are drawn, so the game loop ends on its own.
+        """
+
+        if max_frames is not None and max_frames <= 0:
+            raise ValueError(f"max_frames must be positive, not {max_frames}.")
+
+        self.events: Deque["Event"] = deque()
+        self.script: Dict[int, List["Event"]] = script or {}
+        self.max_frames: Optional[int] = max_frames
+        self.closed: bool = False
+        self.frames: int = 0
+        self.reads: int = 0
+
+
+    def push_event(self, event: "Event") -> None:
+        """
+        Adds an event for the game to read.
+        """
+
+        self.events.append(event)
+
+
+    def close(self) -> None:
+        """
+        Makes the window count as closed, so the game loop ends.
+        """
+
+        self.closed = True
+
+
+    def init(self, game_main: Callable[..., Any], args: Optional[Sequence[Any]]=None) -> None:
+        """
+        Runs 'game_main' right away.
+        """
+
+        game_main(*(args or ()))
+
+
+    def title(self, new_title: str) -> None:
+        """
+        There is no window to name.
+        """
+
+
+    def icon(self, path: str) -> None:
+        """
+        There is no window to set the icon of.
+        """
+
+
+    def resize(self, width: int, height: int) -> None:
+        """
+        There is no window to resize.
+        """
+
+
+    def is_alive(self) -> bool:
+        """
+        Returns 'True' unless 'close' was called.
+        """
+
+        return not self.closed
+
+
+    def loop(self, fps: int=30) -> bool:
+        """
+        Returns right away, without waiting for the frame to pass.
+        """
+
+        return self.is_alive()
+
+
+    def get_events(self) -> List["Event"]:
+        """
+        Returns the events pushed since the last call, and those
+        the script has for this one.
+        """
+
+        events = list(self.events) + self.script.get(self.reads, [])
+        self.events.clear()
+        self.reads += 1
+
+        return events
+
+
+    def wait(self, event_type: Optional["EventType"]=None) -> Optional["Event"]:
+        """
+        Returns the next pushed event (of 'event_type', if given), or
+        'None' if there are no more, as if the window was closed.
+        """
+
+        while self.events:
+            event = self.events.popleft()
+
+            if event_type is None or event.type == event_type:
+                return event
+
+        return None
+
+
+    def say(self, message: str) -> None:
+        """
+        There is no one to show the message to.
+        """
+
+
+    def input(self, prompt: str) -> Optional[str]:
+        """
+        Returns 'None', as if the user cancelled.
+        """
+
+        return None
+
+
+    def play_sound(self, path: str) -> None:
+        """
+        Plays nothing.
+        """
+
+
+    def draw_begin(self) -> None:
+        """
+        Starts a frame that is never shown.
+        """
+
+
+    def draw_end(self) -> None:
+        """
+        Counts the frame, closing the window if it was the last one.
+        """
+
+        self.frames += 1
+
+        if self.max_frames is not None and self.frames >= self.max_frames:
+            self.close()
+
+
+    def draw_image(self, path: str, x: float, y: float) -> None: # pylint: disable=invalid-name
+        """
+        Draws nothing.
+        """
+
+
+    # pylint: disable=invalid-name
+    def draw_image_data(self, name: str, data: bytes, x: float, y: float) -> None:
+        """
+        Draws nothing.
+        """
+
+
+    # pylint: disable=invalid-name, too-many-arguments
+    def draw_text(self,
+                  text: str,
+                  x: float,
+                  y: float,
+                  font: Optional[str]=None,
+                  size: int=12,
+                  bold: bool=False,
+                  italic: bool=False,
+                  **options: DrawOptions) -> None:
+        """
+        Draws nothing.
+        """
+
+
+    # pylint: disable=invalid-name
+    def draw_arc(self, x1: float, y1: float, x2: float, y2: float, **options: DrawOptions) -> None:
+        """
+        Draws nothing.
+        """
+
+
+    # pylint: disable=invalid-name
+    def draw_line(self, x1: float, y1: float, x2: float, y2: float, **options: DrawOptions) -> None:
+        """
+        Draws nothing.
+        """
+
+
+    def draw_polyline(self, points: Sequence[float], **options: DrawOptions) -> None:
+        """
+        Draws nothing.
+        """
+
+
+    def draw_lines(self, segments: Shapes, **options: DrawOptions) -> None:
+        """
+        Draws nothing.
+        """
+
+
+    # pylint: disable=invalid-name
+    def draw_oval(self, x1: float, y1: float, x2: float, y2: float, **options: DrawOptions) -> None:
+        """
+        Draws nothing.
+        """
+
+
+    def draw_ovals(self, boxes: Shapes, **options: DrawOptions) -> None:
+        """
+        Draws nothing.
+        """
+
+
+    def draw_polygon(self, points: Sequence[float], **options: DrawOptions) -> None:
+        """
+        Draws nothing.
+        """
+
+
+    # pylint: disable=invalid-name
+    def draw_rectangle(self,
+                       x1: float,
+                       y1: float,
+                       x2: float,
+                       y2: float,
+                       **options: DrawOptions) -> None:
+        """
+        Draws nothing.
+        """
+
+
+    def draw_rectangles(self, boxes: Shapes, **options: DrawOptions) -> None:
+        """
+        Draws nothing.
+        """
@@ -0,0 +1,470 @@
+"""
+Pygame Backend Module. Draws the game in a window made with pygame,
+which has to be installed for this backend to be used.
+"""
+
+from importlib import import_module
+from io import BytesIO
+from math import cos, radians, sin
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..gamelib import EventType
+from ..logger import GameLogger
+from .backend import Backend, DrawOptions, Shapes
+
+if TYPE_CHECKING:
+    from ..gamelib import Event
+    from ..replay import RecordedEvent
+
+RGBColor = Tuple[int, int, int]
+
+PYGAME_KEYSYMS = {"up": "Up",
+                  "down": "Down",
+                  "left": "Left",
+                  "right": "Right",
+                  "escape": "Escape",
+                  "return": "Return",
+                  "space": "space",
+                  "tab": "Tab",
+                  "backspace": "BackSpace",
+                  "delete": "Delete",
+                  "left shift": "Shift_L",
+                  "right shift": "Shift_R",
+                  "left ctrl": "Control_L",
+                  "right ctrl": "Control_R",
+                  "left alt": "Alt_L",
+                  "right alt": "Alt_R"}
+"""
+The Tk names of the keys whose pygame names are different, so
+that the key bindings work the same with both backends.
+"""
+
+ARC_STEPS = 24
+"""
+How many segments a whole circle is made of when drawing arcs.
+"""
+
+
+class PygameBackend(Backend):
+    """
+    A backend that draws with pygame, in the same thread the game runs.
+
+    pygame has no dialog boxes, so messages are only logged,
+    and asking for text always returns 'None'.
+    """
+
+    name: str = "pygame"
+
+    def __init__(self) -> None:
+        """
+        Initializes an instance of type 'PygameBackend'.
+        """
+
+        try:
+            self.pygame = import_module("pygame")
+
+        except ImportError as err:
+            raise ImportError("The 'pygame' backend needs pygame to be installed " +
+                              "(python -m pip install pygame).") from err
+
+        self.screen: Any = None
+        self.clock: Any = None
+        self.closed: bool = False
+        self.size: Tuple[int, int] = (300, 300)
+        self.colors: Dict[str, Optional[RGBColor]] = {}
+        self.fonts: Dict[Tuple[Optional[str], int, bool, bool], Any] = {}
+        self.images: Dict[str, Any] = {}
+        self.sounds: Dict[str, Any] = {}
+
+
+    def init(self, game_main: Callable[..., Any], args: Optional[Sequence[Any]]=None) -> None:
+        """
+        Opens the window and runs 'game_main' until it returns.
+        """
+
+        self.pygame.init()
+        self.screen = self.pygame.display.set_mode(self.size)
+        self.clock = self.pygame.time.Clock()
+
+        try:
+            game_main(*(args or ()))
+
+        finally:
+            self.closed = True
+            self.pygame.quit()
+
+
+    def color(self, name: str) -> Optional[RGBColor]:
+        """
+        Returns a Tk color as RGB, or 'None' if it is transparent.
+        """
+
+        if name not in self.colors:
+            if not name:
+                self.colors[name] = None
+
+            elif name.startswith('#') and len(name) == 4:
+                self.colors[name] = tuple(int(digit * 2, 16) for digit in name[1:])
+
+            else:
+                self.colors[name] = tuple(self.pygame.Color(name))[:3]
+
+        return self.colors[name]
+
+
+    def title(self, new_title: str) -> None:
+        """
+        Sets the title of the window.
+        """
+
+        self.pygame.display.set_caption(new_title)
+
+
+    def icon(self, path: str) -> None:
+        """
+        Sets the icon of the window.
+        """
+
+        self.pygame.display.set_icon(self.pygame.image.load(path))
+
+
+    def resize(self, width: int, height: int) -> None:
+        """
+        Changes the size of the window.
+        """
+
+        self.size = (width, height)
+
+        if self.screen is not None:
+            self.screen = self.pygame.display.set_mode(self.size)
+
+
+    def is_alive(self) -> bool:
+        """
+        Returns 'True' if the window is still open.
+        """
+
+        return not self.closed
+
+
+    def loop(self, fps: int=30) -> bool:
+        """
+        Waits for the next frame.
+        """
+
+        self.clock.tick(fps)
+        return self.is_alive()
+
+
+    def _translate(self, pg_event: Any) -> Optional["RecordedEvent"]:
+        """
+        Turns a pygame event into one like those of 'gamelib',
+        or returns 'None' if the game does not use it.
+        """
+
+        # the replay package needs the game state, which needs the backends
+        from ..replay import RecordedEvent # pylint: disable=import-outside-toplevel
+
+        pygame = self.pygame
+
+        if pg_event.type == pygame.QUIT:
+            self.closed = True
+            return None
+
+        if pg_event.type in (pygame.KEYDOWN, pygame.KEYUP):
+            key = pygame.key.name(pg_event.key)
+            key = PYGAME_KEYSYMS.get(key, (key.upper() if key.startswith('f') and key[1:].isdigit()
+                                           else key))
+            return RecordedEvent((EventType.KeyPress if pg_event.type == pygame.KEYDOWN
+                                  else EventType.KeyRelease),
+                                 key=key)
+
+        if pg_event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            x, y = pg_event.pos # pylint: disable=invalid-name
+            return RecordedEvent((EventType.ButtonPress if pg_event.type == pygame.MOUSEBUTTONDOWN
+                                  else EventType.ButtonRelease),
+                                 x=x,
+                                 y=y,
+                                 mouse_button=pg_event.button)
+
+        if pg_event.type == pygame.MOUSEMOTION:
+            x, y = pg_event.pos # pylint: disable=invalid-name
+            return RecordedEvent(EventType.Motion, x=x, y=y)
+
+        return None
+
+
+    def get_events(self) -> List["Event"]:
+        """
+        Returns the events since the last frame.
+        """
+
+        events = []
+
+        for pg_event in self.pygame.event.get():
+            event = self._translate(pg_event)
+
+            if event is not None:
+                events.append(event)
+
+        return events
+
+
+    def wait(self, event_type: Optional[EventType]=None) -> Optional["Event"]:
+        """
+        Waits for the next event.
+        """
+
+        while not self.closed:
+            event = self._translate(self.pygame.event.wait())
+
+            if event is not None and (event_type is None or event.type == event_type):
+                return event
+
+        return None
+
+
+    def say(self, message: str) -> None:
+        """
+        Logs the message, as there are no dialog boxes.
+        """
+
+        GameLogger().info(message)
+
+
+    def input(self, prompt: str) -> Optional[str]:
+        """
+        Returns 'None', as if the user cancelled.
+        """
+
+        GameLogger().warning(f"Text input is not available with pygame: {prompt}")
+        return None
+
+
+    def play_sound(self, path: str) -> None:
+        """
+        Plays a sound.
+        """
+
+        if path not in self.sounds:
+            self.sounds[path] = self.pygame.mixer.Sound(path)
+
+        self.sounds[path].play()
+
+
+    def draw_begin(self) -> None:
+        """
+        Clears the window.
+        """
+
+        self.screen.fill((0, 0, 0))
+
+
+    def draw_end(self) -> None:
+        """
+        Shows the frame.
+        """
+
+        self.pygame.display.flip()
+
+
+    def draw_image(self, path: str, x: float, y: float) -> None: # pylint: disable=invalid-name
+        """
+        Draws an image from a file.
+        """
+
+        if path not in self.images:
+            self.images[path] = self.pygame.image.load(path)
+
+        self.screen.blit(self.images[path], (x, y))
+
+
+    # pylint: disable=invalid-name
+    def draw_image_data(self, name: str, data: bytes, x: float, y: float) -> None:
+        """
+        Draws an image from the bytes of a PPM file.
+        """
+
+        self.screen.blit(self.pygame.image.load(BytesIO(data), f"{name}.ppm"), (x, y))
+
+
+    def forget_image(self, path: str) -> None:
+        """
+        Frees the surface loaded from a file.
+        """
+
+        self.images.pop(path, None)
+
+
+    # pylint: disable=invalid-name, too-many-arguments
+    def draw_text(self,
+                  text: str,
+                  x: float,
+                  y: float,
+                  font: Optional[str]=None,
+                  size: int=12,
+                  bold: bool=False,
+                  italic: bool=False,
+                  **options: DrawOptions) -> None:
+        """
+        Draws some text, anchored as Tk anchors it.
+        """
+
+        color = self.color(options.get("fill", "white"))
+        if color is None:
+            return
+
+        key = (font, size, bold, italic)
+        if key not in self.fonts:
+            self.fonts[key] = self.pygame.font.SysFont(font, size, bold, italic)
+
+        lines = [self.fonts[key].render(line, True, color) for line in str(text).split('\n')]
+        width = max(line.get_width() for line in lines)
+        height = sum(line.get_height() for line in lines)
+
+        anchor = options.get("anchor", 'c')
+        left = (x if 'w' in anchor else x - width if 'e' in anchor else x - width / 2)
+        top = (y if 'n' in anchor else y - height if 's' in anchor else y - height / 2)
+
+        for line in lines:
+            self.screen.blit(line, (left + (width - line.get_width()) / 2, top))
+            top += line.get_height()
+
+
+    # pylint: disable=invalid-name
+    def draw_arc(self, x1: float, y1: float, x2: float, y2: float, **options: DrawOptions) -> None:
+        """
+        Draws an arc as a polygon: a pie slice, a chord or just the arc.
+        """
+
+        start = options.get("start", 0.0)
+        extent = options.get("extent", 90.0)
+        style = options.get("style", "pieslice")
+
+        cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
+        rx, ry = (x2 - x1) / 2, (y2 - y1) / 2
+        steps = max(2, int(ARC_STEPS * abs(extent) / 360) + 1)
+
+        points = [(cx + rx * cos(radians(start + extent * step / (steps - 1))),
+                   cy - ry * sin(radians(start + extent * step / (steps - 1))))
+                  for step in range(steps)]
+
+        if style == "arc":
+            color = self.color(options.get("outline", "black"))
+            if color is not None:
+                self.pygame.draw.lines(self.screen, color, False, points, options.get("width", 1))
+            return
+
+        if style == "pieslice":
+            points.append((cx, cy))
+
+        self._draw_shape(self.pygame.draw.polygon, (points,), options)
+
+
+    # pylint: disable=invalid-name
+    def draw_line(self, x1: float, y1: float, x2: float, y2: float, **options: DrawOptions) -> None:
+        """
+        Draws a line.
+        """
+
+        color = self.color(options.get("fill", "white"))
+
+        if color is not None:
+            self.pygame.draw.line(self.screen, color, (x1, y1), (x2, y2),
+                                  max(1, int(options.get("width", 1))))
+
+
+    def draw_polyline(self, points: Sequence[float], **options: DrawOptions) -> None:
+        """
+        Draws a line through many points.
+        """
+
+        color = self.color(options.get("fill", "white"))
+
+        if color is not None and len(points) >= 4:
+            self.pygame.draw.lines(self.screen, color, False,
+                                   list(zip(points[::2], points[1::2])),
+                                   max(1, int(options.get("width", 1))))
+
+
+    def draw_lines(self, segments: Shapes, **options: DrawOptions) -> None:
+        """
+        Draws many straight lines at once.
+        """
+
+        for segment in segments:
+            self.draw_line(*segment, **options)
+
+
+    def _draw_shape(self,
+                    draw_func: Callable[..., Any],
+                    shape: Tuple[Any, ...],
+                    options: DrawOptions) -> None:
+        """
+        Draws a shape filled and outlined, as Tk does by default.
+        """
+
+        fill = self.color(options.get("fill", "white"))
+        outline = self.color(options.get("outline", "black"))
+        width = int(options.get("width", 1))
+
+        if fill is not None:
+            draw_func(self.screen, fill, *shape)
+
+        if outline is not None and width > 0:
+            draw_func(self.screen, outline, *shape, width)
+
+
+    # pylint: disable=invalid-name
+    def draw_oval(self, x1: float, y1: float, x2: float, y2: float, **options: DrawOptions) -> None:
+        """
+        Draws an ellipse.
+        """
+
+        self._draw_shape(self.pygame.draw.ellipse,
+                         (self.pygame.Rect(x1, y1, x2 - x1, y2 - y1),),
+                         options)
+
+
+    def draw_ovals(self, boxes: Shapes, **options: DrawOptions) -> None:
+        """
+        Draws many ellipses at once.
+        """
+
+        for box in boxes:
+            self.draw_oval(*box, **options)
+
+
+    def draw_polygon(self, points: Sequence[float], **options: DrawOptions) -> None:
+        """
+        Draws a polygon.
+        """
+
+        self._draw_shape(self.pygame.draw.polygon,
+                         (list(zip(points[::2], points[1::2])),),
+                         {"outline": '', **options}) # Tk polygons have no outline by default
+
+
+    # pylint: disable=invalid-name
+    def draw_rectangle(self,
+                       x1: float,
+                       y1: float,
+                       x2: float,
+                       y2: float,
+                       **options: DrawOptions) -> None:
+        """
+        Draws a rectangle.
+        """
+
+        self._draw_shape(self.pygame.draw.rect,
+                         (self.pygame.Rect(x1, y1, x2 - x1, y2 - y1),),
+                         options)
+
+
+    def draw_rectangles(self, boxes: Shapes, **options: DrawOptions) -> None:
+        """
+        Draws many rectangles at once.
+        """
+
+        for box in boxes:
+            self.draw_rectangle(*box, **options)
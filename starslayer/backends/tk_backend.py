@@ -0,0 +1,254 @@
+"""
+Tk Backend Module. Draws the game in a Tk window, through 'gamelib'.
+"""
+
+from typing import (TYPE_CHECKING, Any, Callable, List, Optional, Sequence,
+                    Tuple)
+
+from .. import gamelib
+from .backend import Backend, DrawOptions, Shapes
+
+if TYPE_CHECKING:
+    from ..gamelib import Event, EventType
+
+
+class TkBackend(Backend):
+    """
+    The backend of 'gamelib', which draws in a Tk canvas.
+    """
+
+    name: str = "tk"
+
+    def init(self, game_main: Callable[..., Any], args: Optional[Sequence[Any]]=None) -> None:
+        """
+        Opens the window and runs 'game_main' in another thread.
+        """
+
+        gamelib.init(game_main, args)
+
+
+    def title(self, new_title: str) -> None:
+        """
+        Sets the title of the window.
+        """
+
+        gamelib.title(new_title)
+
+
+    def icon(self, path: str) -> None:
+        """
+        Sets the icon of the window.
+        """
+
+        gamelib.icon(path)
+
+
+    def resize(self, width: int, height: int) -> None:
+        """
+        Changes the size of the window.
+        """
+
+        gamelib.resize(width, height)
+
+
+    def is_alive(self) -> bool:
+        """
+        Returns 'True' if the window is still open.
+        """
+
+        return gamelib.is_alive()
+
+
+    def loop(self, fps: int=30) -> bool:
+        """
+        Waits for the next frame.
+        """
+
+        return gamelib.loop(fps)
+
+
+    def get_events(self) -> List["Event"]:
+        """
+        Returns the events since the last frame.
+        """
+
+        return gamelib.get_events()
+
+
+    def wait(self, event_type: Optional["EventType"]=None) -> Optional["Event"]:
+        """
+        Waits for the next event.
+        """
+
+        return gamelib.wait(event_type)
+
+
+    def say(self, message: str) -> None:
+        """
+        Shows a message in a dialog box.
+        """
+
+        gamelib.say(message)
+
+
+    def input(self, prompt: str) -> Optional[str]:
+        """
+        Asks for some text in a dialog box.
+        """
+
+        return gamelib.input(prompt)
+
+
+    def play_sound(self, path: str) -> None:
+        """
+        Plays a sound.
+        """
+
+        gamelib.play_sound(path)
+
+
+    def draw_begin(self) -> None:
+        """
+        Starts a new frame.
+        """
+
+        gamelib.draw_begin()
+
+
+    def draw_end(self) -> None:
+        """
+        Hands the frame to the Tk thread.
+        """
+
+        gamelib.draw_end()
+
+
+    def paint_stats(self) -> Tuple[float, int]:
+        """
+        Returns the time the Tk thread spent painting, and the frames it dropped.
+        """
+
+        return gamelib.paint_stats()
+
+
+    def draw_image(self, path: str, x: float, y: float) -> None: # pylint: disable=invalid-name
+        """
+        Draws an image from a file.
+        """
+
+        gamelib.draw_image(path, x, y)
+
+
+    # pylint: disable=invalid-name
+    def draw_image_data(self, name: str, data: bytes, x: float, y: float) -> None:
+        """
+        Draws an image from the bytes of a PPM file.
+        """
+
+        gamelib.draw_image_data(name, data, x, y)
+
+
+    def forget_image(self, path: str) -> None:
+        """
+        Frees the Tk image of a file.
+        """
+
+        gamelib.forget_image(path)
+
+
+    # pylint: disable=invalid-name, too-many-arguments
+    def draw_text(self,
+                  text: str,
+                  x: float,
+                  y: float,
+                  font: Optional[str]=None,
+                  size: int=12,
+                  bold: bool=False,
+                  italic: bool=False,
+                  **options: DrawOptions) -> None:
+        """
+        Draws some text.
+        """
+
+        gamelib.draw_text(text, x, y, font, size, bold, italic, **options)
+
+
+    # pylint: disable=invalid-name
+    def draw_arc(self, x1: float, y1: float, x2: float, y2: float, **options: DrawOptions) -> None:
+        """
+        Draws an arc.
+        """
+
+        gamelib.draw_arc(x1, y1, x2, y2, **options)
+
+
+    # pylint: disable=invalid-name
+    def draw_line(self, x1: float, y1: float, x2: float, y2: float, **options: DrawOptions) -> None:
+        """
+        Draws a line.
+        """
+
+        gamelib.draw_line(x1, y1, x2, y2, **options)
+
+
+    def draw_polyline(self, points: Sequence[float], **options: DrawOptions) -> None:
+        """
+        Draws a line through many points.
+        """
+
+        gamelib.draw_polyline(points, **options)
+
+
+    def draw_lines(self, segments: Shapes, **options: DrawOptions) -> None:
+        """
+        Draws many straight lines at once.
+        """
+
+        gamelib.draw_lines(segments, **options)
+
+
+    # pylint: disable=invalid-name
+    def draw_oval(self, x1: float, y1: float, x2: float, y2: float, **options: DrawOptions) -> None:
+        """
+        Draws an ellipse.
+        """
+
+        gamelib.draw_oval(x1, y1, x2, y2, **options)
+
+
+    def draw_ovals(self, boxes: Shapes, **options: DrawOptions) -> None:
+        """
+        Draws many ellipses at once.
+        """
+
+        gamelib.draw_ovals(boxes, **options)
+
+
+    def draw_polygon(self, points: Sequence[float], **options: DrawOptions) -> None:
+        """
+        Draws a polygon.
+        """
+
+        gamelib.draw_polygon(points, **options)
+
+
+    # pylint: disable=invalid-name
+    def draw_rectangle(self,
+                       x1: float,
+                       y1: float,
+                       x2: float,
+                       y2: float,
+                       **options: DrawOptions) -> None:
+        """
+        Draws a rectangle.
+        """
+
+        gamelib.draw_rectangle(x1, y1, x2, y2, **options)
+
+
+    def draw_rectangles(self, boxes: Shapes, **options: DrawOptions) -> None:
+        """
+        Draws many rectangles at once.
+        """
+
+        gamelib.draw_rectangles(boxes, **options)
@@ -0,0 +1,8 @@
+"""
+Benchmarks Package.
+"""
+
+from .baseline import *
+from .benchmark import *
+from .import_time import *
+from .suites import *
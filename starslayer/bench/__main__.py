@@ -0,0 +1,91 @@
+"""
+Runs the microbenchmarks, and compares them against a baseline.
+
+Usage: python -m starslayer.bench --save baseline.json
+       python -m starslayer.bench --compare baseline.json
+       python -m starslayer.bench --imports
+"""
+
+from argparse import ArgumentParser
+from typing import List, Optional
+
+from .baseline import (REGRESSION_THRESHOLD, find_regressions, load_baseline,
+                       save_baseline)
+from .benchmark import Benchmark, measure
+from .import_time import IMPORT_TIME_BUDGET, check_imports
+
+
+def main(args: Optional[List[str]]=None) -> int:
+    """
+    Parses the command line and runs the benchmarks.
+
+    It returns 1 if any of them regressed against the baseline,
+    or if the import check failed.
+    """
+
+    parser = ArgumentParser(prog="python -m starslayer.bench",
+                            description="Measures how fast the building blocks " +
+                                        "of the game are.")
+    parser.add_argument("names", nargs='*', metavar="NAME",
+                        help="the benchmarks to run (all of them by default): " +
+                             ", ".join(sorted(Benchmark.types)))
+    parser.add_argument("-r", "--rounds", type=int, default=5,
+                        help="how many times each benchmark is timed; the fastest counts")
+    parser.add_argument("-s", "--save", default=None,
+                        help="file to write the results to, as a baseline")
+    parser.add_argument("-c", "--compare", default=None,
+                        help="baseline file to compare the results against")
+    parser.add_argument("-t", "--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="how much slower than the baseline counts as a regression " +
+                             f"(default: {REGRESSION_THRESHOLD * 100:.0f}%%)")
+    parser.add_argument("--imports", action="store_true",
+                        help="instead, check that the simulation core is imported in less " +
+                             f"than {IMPORT_TIME_BUDGET * 1000:.0f}ms and without Tk")
+    parsed = parser.parse_args(args)
+
+    if parsed.imports:
+        problems = check_imports()
+
+        for problem in problems:
+            print(f"IMPORT: {problem}")
+
+        return (1 if problems else 0)
+
+    unknown = set(parsed.names) - set(Benchmark.types)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    baseline = (load_baseline(parsed.compare) if parsed.compare else {})
+    names = parsed.names or sorted(Benchmark.types)
+    width = max(len(name) for name in names)
+    results = []
+
+    print(f"{'benchmark':<{width}}  {'ns/op':>12}  {'peak B':>10}  {'kept B/op':>10}" +
+          ("  vs baseline" if baseline else ''))
+
+    for name in names:
+        result = measure(name, rounds=parsed.rounds)
+        results.append(result)
+
+        line = (f"{name:<{width}}  {result.ns_per_op:>12.1f}  {result.peak_bytes:>10}  " +
+                f"{result.retained_bytes:>10.1f}")
+
+        if name in baseline:
+            line += f"  {result.ns_per_op / baseline[name]['ns_per_op'] - 1:>+11.1%}"
+
+        print(line, flush=True)
+
+    if parsed.save:
+        save_baseline(results, parsed.save)
+
+    regressions = find_regressions(results, baseline, parsed.threshold)
+
+    for name, old_ns, new_ns in regressions:
+        print(f"REGRESSION: {name} went from {old_ns:.1f} to {new_ns:.1f} ns/op")
+
+    return (1 if regressions else 0)
+
+
+if __name__ == "__main__":
+
+    raise SystemExit(main())
@@ -0,0 +1,73 @@
+"""
+Baseline Module. Stores benchmark results as JSON, and
+compares new results against them.
+"""
+
+from json import dump, load
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
+
+if TYPE_CHECKING:
+    from .benchmark import BenchResult
+
+BaselineDict = Dict[str, Dict[str, float]]
+Regression = Tuple[str, float, float] # (name, baseline ns/op, new ns/op)
+
+BASELINE_VERSION = 1
+"""
+The version of the baseline format.
+"""
+
+REGRESSION_THRESHOLD = 0.10
+"""
+How much slower than its baseline an operation can get before it is
+considered a regression, as a fraction of the baseline.
+"""
+
+
+def save_baseline(results: Iterable["BenchResult"], path: str) -> None:
+    """
+    Writes the results into a JSON file, to be compared against later.
+    """
+
+    with open(path, mode='w', encoding="utf-8") as file:
+        dump({"version": BASELINE_VERSION,
+              "results": {result.name: result.as_dict() for result in results}},
+             file,
+             indent=4)
+
+
+def load_baseline(path: str) -> BaselineDict:
+    """
+    Reads the results of a baseline file.
+    """
+
+    with open(path, mode='r', encoding="utf-8") as file:
+        baseline = load(file)
+
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(f"'{path}' has version {baseline.get('version')}, " +
+                         f"but only version {BASELINE_VERSION} is supported.")
+
+    return baseline["results"]
+
+
+def find_regressions(results: Iterable["BenchResult"],
+                     baseline: BaselineDict,
+                     threshold: float=REGRESSION_THRESHOLD) -> List[Regression]:
+    """
+    Returns the results that are slower than their baseline by more than
+    'threshold'. Benchmarks that are not in the baseline are skipped.
+    """
+
+    regressions = []
+
+    for result in results:
+        if result.name not in baseline:
+            continue
+
+        old_ns = baseline[result.name]["ns_per_op"]
+
+        if result.ns_per_op > old_ns * (1 + threshold):
+            regressions.append((result.name, old_ns, result.ns_per_op))
+
+    return regressions
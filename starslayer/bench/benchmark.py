@@ -0,0 +1,181 @@
+"""
+Benchmark Module. Contains the base of the microbenchmarks,
+and how they are measured.
+"""
+
+import tracemalloc
+from abc import ABC, abstractmethod
+from random import Random
+from time import perf_counter_ns
+from typing import Dict, List, Optional, Tuple
+
+BENCH_SEED = 12345
+"""
+The seed the fixtures of every benchmark are made with, so
+that they are the same each time the suite is run.
+"""
+
+MIN_ROUND_TIME = 0.05
+"""
+The least time, in seconds, a round of a benchmark should take. The
+operation is repeated as many times as needed in a round to reach it.
+"""
+
+
+class Benchmark(ABC):
+    """
+    A microbenchmark of a single operation.
+
+    Each call to 'run' does the operation once for each of its
+    'ops' fixtures, so the timer overhead is spread over all of them.
+    """
+
+    name: str = ""
+    types: Dict[str, "Benchmark"]
+
+    def __init_subclass__(cls) -> None:
+        """
+        Registers subclasses by their name.
+        """
+
+        try:
+            Benchmark.types[cls.name] = cls
+
+        except AttributeError:
+            Benchmark.types = {cls.name: cls}
+
+
+    def __init__(self, seed: int=BENCH_SEED) -> None:
+        """
+        Initializes an instance of type 'Benchmark'.
+        """
+
+        self.rng: Random = Random(seed)
+        self.ops: int = 1
+        self.setup()
+
+
+    def setup(self) -> None:
+        """
+        Builds the fixtures of the benchmark, and sets 'ops'.
+        """
+
+
+    @abstractmethod
+    def run(self) -> None:
+        """
+        Does the operation once for each fixture.
+        """
+
+        raise NotImplementedError
+
+
+class BenchResult:
+    """
+    How long an operation took, and how much memory it allocated.
+    """
+
+    def __init__(self, name: str, ns_per_op: float, peak_bytes: int, retained_bytes: float) -> None:
+        """
+        Initializes an instance of type 'BenchResult'.
+
+        'peak_bytes' is the most memory a call to 'run' had in use at once,
+        and 'retained_bytes' how much of it was still in use after it,
+        divided by its operations.
+        """
+
+        self.name: str = name
+        self.ns_per_op: float = ns_per_op
+        self.peak_bytes: int = peak_bytes
+        self.retained_bytes: float = retained_bytes
+
+
+    def __repr__(self) -> str:
+        """
+        Represents the result.
+        """
+
+        return f"BenchResult({self.name}: {self.ns_per_op:.1f} ns/op)"
+
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Returns the result as it is stored in a baseline.
+        """
+
+        return {"ns_per_op": self.ns_per_op,
+                "peak_bytes": self.peak_bytes,
+                "retained_bytes": self.retained_bytes}
+
+
+def time_rounds(benchmark: Benchmark, rounds: int) -> float:
+    """
+    Times 'rounds' rounds of a benchmark, and returns the nanoseconds per
+    operation of the fastest one, which is the least disturbed by noise.
+    """
+
+    calls = 1
+
+    while True: # Find how many calls a round needs
+        start = perf_counter_ns()
+        for _ in range(calls):
+            benchmark.run()
+        elapsed = perf_counter_ns() - start
+
+        if elapsed >= MIN_ROUND_TIME * 1e9:
+            break
+
+        calls *= 2
+
+    best = elapsed
+
+    for _ in range(rounds - 1):
+        start = perf_counter_ns()
+        for _ in range(calls):
+            benchmark.run()
+        best = min(best, perf_counter_ns() - start)
+
+    return best / (calls * benchmark.ops)
+
+
+def trace_memory(benchmark: Benchmark) -> Tuple[int, float]:
+    """
+    Calls a benchmark once while tracing its memory, and returns the most
+    bytes it had in use at once and the ones it kept per operation.
+    """
+
+    tracemalloc.start()
+
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        benchmark.run()
+        after, peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    return peak - before, (after - before) / benchmark.ops
+
+
+def measure(name: str, *, rounds: int=5, seed: int=BENCH_SEED) -> BenchResult:
+    """
+    Measures the benchmark registered under 'name'.
+    """
+
+    if name not in Benchmark.types:
+        raise ValueError(f"There is no benchmark named '{name}'.")
+
+    benchmark = Benchmark.types[name](seed)
+    benchmark.run() # Warm up caches before measuring anything
+    peak_bytes, retained_bytes = trace_memory(benchmark)
+
+    return BenchResult(name, time_rounds(benchmark, rounds), peak_bytes, retained_bytes)
+
+
+def measure_all(names: Optional[List[str]]=None, *, rounds: int=5) -> List[BenchResult]:
+    """
+    Measures the benchmarks in 'names', or all of them if not given.
+    """
+
+    return [measure(name, rounds=rounds) for name in (names or sorted(Benchmark.types))]
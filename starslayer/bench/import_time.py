@@ -0,0 +1,86 @@
+"""
+Import Time Module. Checks that the simulation core can be imported
+quickly and without pulling in the window, the audio or the assets.
+"""
+
+from json import loads
+from os import environ, pathsep
+from os.path import abspath, dirname
+from subprocess import run
+from sys import executable
+from typing import List, Tuple
+
+CORE_MODULES = ("starslayer.state",
+                "starslayer.utils.shapes",
+                "starslayer.bullets",
+                "starslayer.enemies")
+"""
+The modules a headless tool (the simulator, the benchmarks) needs, which
+should be cheap to import.
+"""
+
+FORBIDDEN_MODULES = ("tkinter", "starslayer.gamelib.gamelib", "starslayer.graphics.graphics")
+"""
+Modules that importing the simulation core should never import.
+"""
+
+IMPORT_TIME_BUDGET = 0.25
+"""
+How many seconds importing each of the core modules can take,
+in a new interpreter.
+"""
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+print(json.dumps([time.perf_counter() - start, sorted(sys.modules)]))
+"""
+
+
+def time_import(module: str, runs: int=3) -> Tuple[float, List[str]]:
+    """
+    Imports 'module' in 'runs' new interpreters, and returns the fastest
+    time it took and the forbidden modules it imported.
+    """
+
+    env = dict(environ)
+    root = dirname(dirname(dirname(abspath(__file__))))
+    env["PYTHONPATH"] = pathsep.join(filter(None, (root, env.get("PYTHONPATH"))))
+
+    best = None
+    forbidden = []
+
+    for _ in range(runs):
+        process = run([executable, "-c", IMPORT_SCRIPT.format(module=module)],
+                      capture_output=True,
+                      check=True,
+                      env=env,
+                      text=True)
+        elapsed, modules = loads(process.stdout.splitlines()[-1])
+
+        best = (elapsed if best is None else min(best, elapsed))
+        forbidden = [name for name in FORBIDDEN_MODULES if name in modules]
+
+    return best, forbidden
+
+
+def check_imports(budget: float=IMPORT_TIME_BUDGET, runs: int=3) -> List[str]:
+    """
+    Imports every core module apart, and returns what went wrong, if anything.
+    """
+
+    problems = []
+
+    for module in CORE_MODULES:
+        elapsed, forbidden = time_import(module, runs)
+        print(f"{module:<30} {elapsed * 1000:>8.1f} ms", flush=True)
+
+        if elapsed > budget:
+            problems.append(f"importing {module} took {elapsed * 1000:.1f} ms, " +
+                            f"over the budget of {budget * 1000:.0f} ms")
+
+        if forbidden:
+            problems.append(f"importing {module} also imported {', '.join(forbidden)}")
+
+    return problems
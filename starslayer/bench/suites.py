@@ -0,0 +1,382 @@
+"""
+Suites Module. Contains the microbenchmarks of the building
+blocks of the game: shapes, sprites, colors and timers.
+"""
+
+from math import pi
+from random import Random
+from typing import List, Tuple
+
+from ..auxiliar import get_closest_coordinates
+from ..color import Color
+from ..consts import HEIGHT, PLAYABLE_WIDTH
+from ..sprites import Sprite, load_frames, sprite_realpath
+from ..utils import HitBox, HitCircle, Timer
+from .benchmark import Benchmark
+
+FIXTURES = 256
+"""
+How many fixtures most benchmarks are made of.
+"""
+
+BENCH_SPRITE = "enemies/common_a"
+"""
+The sprite the sprite benchmarks load.
+"""
+
+
+def random_box(rng: Random) -> HitBox:
+    """
+    Returns a hitbox of random size somewhere in the screen.
+    """
+
+    x1 = rng.uniform(0, PLAYABLE_WIDTH - 60) # pylint: disable=invalid-name
+    y1 = rng.uniform(0, HEIGHT - 60) # pylint: disable=invalid-name
+
+    return HitBox(x1=x1,
+                  y1=y1,
+                  x2=x1 + rng.uniform(5, 60),
+                  y2=y1 + rng.uniform(5, 60))
+
+
+def random_circle(rng: Random) -> HitCircle:
+    """
+    Returns a hitcircle of random size somewhere in the screen.
+    """
+
+    radius = rng.uniform(3, 30)
+
+    return HitCircle(cx=rng.uniform(radius, PLAYABLE_WIDTH - radius),
+                     cy=rng.uniform(radius, HEIGHT - radius),
+                     radius=radius)
+
+
+class BoxWithBox(Benchmark):
+    """
+    'HitBox.collides_with_box'.
+    """
+
+    name: str = "hitbox.collides_with_box"
+
+    def setup(self) -> None:
+        """
+        Makes pairs of hitboxes.
+        """
+
+        self.pairs: List[Tuple[HitBox, HitBox]] = [(random_box(self.rng), random_box(self.rng))
+                                                   for _ in range(FIXTURES)]
+        self.ops = len(self.pairs)
+
+
+    def run(self) -> None:
+        """
+        Checks every pair.
+        """
+
+        for box, other in self.pairs:
+            box.collides_with_box(other)
+
+
+class CircleWithBox(Benchmark):
+    """
+    'HitCircle.collides_with_box'.
+    """
+
+    name: str = "hitcircle.collides_with_box"
+
+    def setup(self) -> None:
+        """
+        Makes pairs of a hitcircle and a hitbox.
+        """
+
+        self.pairs: List[Tuple[HitCircle, HitBox]] = [(random_circle(self.rng),
+                                                       random_box(self.rng))
+                                                      for _ in range(FIXTURES)]
+        self.ops = len(self.pairs)
+
+
+    def run(self) -> None:
+        """
+        Checks every pair.
+        """
+
+        for circle, box in self.pairs:
+            circle.collides_with_box(box)
+
+
+class CircleWithCircle(Benchmark):
+    """
+    'HitCircle.collides_with_circle'.
+    """
+
+    name: str = "hitcircle.collides_with_circle"
+
+    def setup(self) -> None:
+        """
+        Makes pairs of hitcircles.
+        """
+
+        self.pairs: List[Tuple[HitCircle, HitCircle]] = [(random_circle(self.rng),
+                                                          random_circle(self.rng))
+                                                         for _ in range(FIXTURES)]
+        self.ops = len(self.pairs)
+
+
+    def run(self) -> None:
+        """
+        Checks every pair.
+        """
+
+        for circle, other in self.pairs:
+            circle.collides_with_circle(other)
+
+
+class MoveRad(Benchmark):
+    """
+    'BoundingShape.move_rad', on hitboxes and hitcircles.
+    """
+
+    name: str = "shape.move_rad"
+
+    def setup(self) -> None:
+        """
+        Makes the shapes, and the radial move of each one.
+        """
+
+        self.moves: List[Tuple[HitBox | HitCircle, float, float]] = []
+
+        for i in range(FIXTURES):
+            shape = (random_box(self.rng) if i % 2 else random_circle(self.rng))
+            self.moves.append((shape, self.rng.uniform(1, 10), self.rng.uniform(0, 2 * pi)))
+
+        self.ops = len(self.moves) * 2
+
+
+    def run(self) -> None:
+        """
+        Moves every shape, and then back to where it was, so that
+        they never leave the screen.
+        """
+
+        for shape, drad, dtheta in self.moves:
+            shape.move_rad(drad, dtheta)
+            shape.move_rad(-drad, dtheta)
+
+
+class MoveOrbit(Benchmark):
+    """
+    'BoundingShape.move_orbit', on hitcircles around others.
+    """
+
+    name: str = "shape.move_orbit"
+
+    def setup(self) -> None:
+        """
+        Makes the satellites, the shapes they orbit and their angles.
+        """
+
+        self.orbits: List[Tuple[HitCircle, HitCircle, float]] = [(random_circle(self.rng),
+                                                                  random_circle(self.rng),
+                                                                  self.rng.uniform(0, 2 * pi))
+                                                                 for _ in range(FIXTURES)]
+        self.ops = len(self.orbits)
+
+
+    def run(self) -> None:
+        """
+        Moves every satellite around its center.
+        """
+
+        for satellite, center, theta in self.orbits:
+            satellite.move_orbit(center, theta, 50)
+
+
+class ClosestCoordinates(Benchmark):
+    """
+    'get_closest_coordinates', among as many shapes as a busy screen has.
+    """
+
+    name: str = "get_closest_coordinates"
+
+    def setup(self) -> None:
+        """
+        Makes the origins and the shapes to search among.
+        """
+
+        self.origins: List[HitBox] = [random_box(self.rng) for _ in range(16)]
+        self.shapes: List[HitBox] = [random_box(self.rng) for _ in range(50)]
+        self.ops = len(self.origins)
+
+
+    def run(self) -> None:
+        """
+        Finds the closest shape to every origin.
+        """
+
+        for origin in self.origins:
+            get_closest_coordinates(origin, self.shapes)
+
+
+class SpriteParse(Benchmark):
+    """
+    Reading the frames of a sprite from its files, as it is done the
+    first time it is loaded.
+    """
+
+    name: str = "sprite.parse"
+
+    def setup(self) -> None:
+        """
+        Finds the folder of the sprite.
+        """
+
+        self.realpath: str = sprite_realpath(BENCH_SPRITE)
+
+
+    def run(self) -> None:
+        """
+        Reads the sprite, skipping the cache.
+        """
+
+        load_frames.__wrapped__(self.realpath)
+
+
+class SpriteInit(Benchmark):
+    """
+    'Sprite.__init__' of an already loaded sprite, as it is done
+    every time an enemy spawns.
+    """
+
+    name: str = "sprite.init"
+
+    def setup(self) -> None:
+        """
+        Sets how many sprites are made per run.
+        """
+
+        self.ops = FIXTURES
+
+
+    def run(self) -> None:
+        """
+        Makes the sprites.
+        """
+
+        for _ in range(self.ops):
+            Sprite(BENCH_SPRITE)
+
+
+class ColorFromHSV(Benchmark):
+    """
+    'Color.from_hsv'.
+    """
+
+    name: str = "color.from_hsv"
+
+    def setup(self) -> None:
+        """
+        Makes the HSV values.
+        """
+
+        self.values: List[Tuple[int, int, int]] = [(self.rng.randrange(360),
+                                                    self.rng.randrange(101),
+                                                    self.rng.randrange(101))
+                                                   for _ in range(FIXTURES)]
+        self.ops = len(self.values)
+
+
+    def run(self) -> None:
+        """
+        Makes every color.
+        """
+
+        for hue, saturation, value in self.values:
+            Color.from_hsv(hue, saturation, value)
+
+
+class ColorFromHex(Benchmark):
+    """
+    'Color.from_hex', in every format it takes.
+    """
+
+    name: str = "color.from_hex"
+
+    def setup(self) -> None:
+        """
+        Makes the hexadecimal values, in every format.
+        """
+
+        formats = ("#{:01x}{:01x}{:01x}", "#{:02x}{:02x}{:02x}")
+        limits = (16, 256)
+
+        self.values: List[str] = []
+
+        for i in range(FIXTURES):
+            limit = limits[i % 2]
+            self.values.append(formats[i % 2].format(self.rng.randrange(limit),
+                                                     self.rng.randrange(limit),
+                                                     self.rng.randrange(limit)))
+
+        self.ops = len(self.values)
+
+
+    def run(self) -> None:
+        """
+        Makes every color.
+        """
+
+        for value in self.values:
+            Color.from_hex(value)
+
+
+class ColorHex(Benchmark):
+    """
+    'Color.hex'.
+    """
+
+    name: str = "color.hex"
+
+    def setup(self) -> None:
+        """
+        Makes the colors.
+        """
+
+        self.colors: List[Color] = [Color(self.rng.randrange(256),
+                                          self.rng.randrange(256),
+                                          self.rng.randrange(256))
+                                    for _ in range(FIXTURES)]
+        self.ops = len(self.colors)
+
+
+    def run(self) -> None:
+        """
+        Gets the hexadecimal value of every color.
+        """
+
+        for color in self.colors:
+            color.hex # pylint: disable=pointless-statement
+
+
+class TimerCount(Benchmark):
+    """
+    'Timer.count', restarting the timers when they are up.
+    """
+
+    name: str = "timer.count"
+
+    def setup(self) -> None:
+        """
+        Makes the timers.
+        """
+
+        self.timers: List[Timer] = [Timer(self.rng.randrange(1, 100)) for _ in range(FIXTURES)]
+        self.ops = len(self.timers)
+
+
+    def run(self) -> None:
+        """
+        Counts every timer once.
+        """
+
+        for timer in self.timers:
+            timer.count(1.0, reset=True)
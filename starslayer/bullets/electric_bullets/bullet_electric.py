@@ -4,11 +4,10 @@ Bullets with an electric aura.
 
 from math import pi as PI
 from math import radians
-from random import choices
-from random import uniform as rand_uniform
 from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from ...utils import HitCircle, Timer
+from ...auxiliar import get_rng
+from ...utils import HitCircle, WheelTimer
 from ..bullet import BulletKwargs, BulletSprites, Bullet
 
 if TYPE_CHECKING:
@@ -46,7 +45,7 @@ class BulletElectric(Bullet):
             raise ValueError(f"Damage chance value {dmg_chance} should be on range (0.0, 100.0]")
 
         self.angle: float = angle
-        self.accel_timer: Timer = Timer(accel_time)
+        self.accel_timer: WheelTimer = WheelTimer(accel_time)
         self.radar_pool: List["Enemy"] = radar_pool
         self.dmg: int = damage
         self.dmg_chance: float = dmg_chance
@@ -137,6 +136,7 @@ class BulletElectric(Bullet):
         """
 
         pivots = []
+        rng = get_rng()
 
         for threat in self.radar_pool:
             shape_arcs = []
@@ -147,15 +147,15 @@ class BulletElectric(Bullet):
                 angle = self.angle_towards(threat)
                 pivot_augment = distance / self.arcs_amount
 
-                dmg =choices([0,                       self.dmg],           # Damage dealt
-                             [100.0 - self.dmg_chance, self.dmg_chance])[0] # Chances
+                dmg = rng.choices([0,                       self.dmg],           # Damage dealt
+                                  [100.0 - self.dmg_chance, self.dmg_chance])[0] # Chances
                 threat.take_damage(dmg)
                 self._modify_actual_angle(self.deviation_speed, angle)
 
                 for pivot in range(self.pivots_amount):
                     rad = pivot * pivot_augment
-                    theta = rand_uniform(angle - self.arcs_angle_variance,
-                                         angle + self.arcs_angle_variance)
+                    theta = rng.uniform(angle - self.arcs_angle_variance,
+                                        angle + self.arcs_angle_variance)
 
                     shape_arcs.append(self.polar_to_cart(rad, -theta))
 
@@ -173,8 +173,6 @@ class BulletElectric(Bullet):
 
         self.update_pivots()
 
-        self.accel_timer.count(1)
-
         if not self.accel_timer.time_is_up():
             self.accel += 0.2
 
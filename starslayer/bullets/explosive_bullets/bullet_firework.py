@@ -4,10 +4,10 @@ Bullets that explode into anothers.
 
 from math import pi as PI
 from math import radians
-from random import randrange
 from typing import TYPE_CHECKING, List
 
-from ...utils import Timer
+from ...auxiliar import get_rng
+from ...utils import WheelTimer
 from ..bullet import BulletKwargs
 from ..normal_bullets import BulletRadial
 
@@ -41,7 +41,7 @@ class BulletFirework(BulletRadial):
                          angle=angle,
                          **kwargs)
 
-        self.time_until_boom: Timer = Timer(time_until_boom)
+        self.time_until_boom: WheelTimer = WheelTimer(time_until_boom, repeat=reset)
         self.bullets_pool: List["Bullet"] = bullets_pool
         self.children: int = how_many_children
         self.initial_phase: float = initial_phase
@@ -55,8 +55,6 @@ class BulletFirework(BulletRadial):
         Defines the trajectory of a firework bullet.
         """
 
-        self.time_until_boom.count(1, reset=self.reset)
-
         if not self.time_until_boom.time_is_up():
             super().trajectory()
             return
@@ -64,7 +62,7 @@ class BulletFirework(BulletRadial):
         augment = (2 * PI) / self.children
         self.divisions -= 1
         type_to_use: "Bullet" = (__class__ if self.divisions > 0 else self.child_type)
-        self.initial_phase += radians(randrange(45, 91, 1))
+        self.initial_phase += radians(get_rng().randrange(45, 91, 1))
         self.speed *= 1.2
 
         for child in range(self.children):
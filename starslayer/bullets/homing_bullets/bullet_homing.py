@@ -6,7 +6,7 @@ from math import pi as PI
 from typing import TYPE_CHECKING, List, Optional
 
 from ...auxiliar import get_closest_coordinates
-from ...utils import Timer
+from ...utils import WheelTimer
 from ..bullet import Bullet, BulletKwargs
 
 if TYPE_CHECKING:
@@ -39,7 +39,7 @@ class BulletHoming(Bullet):
         self.target: "BoundingShape" = homing_target or get_closest_coordinates(self,
                                                                                 target_pool)
         self.target_pool: Optional[List["BoundingShape"]] = target_pool or [self.target]
-        self.homing_time: Timer = Timer(homing_time)
+        self.homing_time: WheelTimer = WheelTimer(homing_time)
         self.nominal_angle: float = self.angle_towards(self.target)
         self.actual_angle: float = self.nominal_angle
 
@@ -125,8 +125,6 @@ class BulletHoming(Bullet):
             else:
                 self.homing_time.drop()
 
-        self.homing_time.count(1.0)
-
         if not self.homing_time.time_is_up():
             self.nominal_angle = self.angle_towards(self.target)
 
@@ -4,7 +4,7 @@ A bullet that transforms into another.
 
 from typing import List
 
-from ...utils import Timer
+from ...utils import WheelTimer
 from ..bullet import Bullet, BulletKwargs
 
 
@@ -12,6 +12,8 @@ class BulletMorph(Bullet):
     """
     A bullet that changes its form of trajectory,
     imitating other bullets.
+
+    The timers of a form only count down while it is the current one.
     """
 
     def __init__(self,
@@ -32,12 +34,15 @@ class BulletMorph(Bullet):
         if not shapes:
             ValueError("shapes list must contain at least 1 value.")
 
-        self.morphing: Timer = Timer(morphing_time)
+        self.morphing: WheelTimer = WheelTimer(morphing_time, repeat=True)
         self.chances: int = ((len(shapes) * loops) - 1 if loops > 0 else morph_chances)
         self.times_morphed: int = 0
         self.forms: List[Bullet] = [shape(**kwargs) for shape in shapes]
         self.current_form: Bullet = self.forms[0]
 
+        for form in self.forms[1:]:
+            self.pause_form(form)
+
 
     def can_transform(self) -> bool:
         """
@@ -47,13 +52,42 @@ class BulletMorph(Bullet):
         return self.chances > 0 and self.times_morphed < self.chances
 
 
+    @staticmethod
+    def form_timers(form: Bullet) -> List[WheelTimer]:
+        """
+        Returns the timers of a form that are driven by a timer wheel.
+        """
+
+        return [timer for timer in vars(form).values() if isinstance(timer, WheelTimer)]
+
+
+    def pause_form(self, form: Bullet) -> None:
+        """
+        Stops the timers of a form while it is not the current one.
+        """
+
+        for timer in self.form_timers(form):
+            timer.pause()
+
+
+    def resume_form(self, form: Bullet) -> None:
+        """
+        Lets the timers of a form count again.
+        """
+
+        for timer in self.form_timers(form):
+            timer.resume()
+
+
     def next_form(self) -> None:
         """
         Changes into the next form.
         """
 
         ind = self.forms.index(self.current_form)
+        self.pause_form(self.current_form)
         self.current_form = self.forms[(ind + 1) % len(self.forms)]
+        self.resume_form(self.current_form)
 
 
     def trajectory(self) -> None:
@@ -64,8 +98,6 @@ class BulletMorph(Bullet):
         self.current_form.trajectory()
         self.cx, self.cy = self.current_form.center
 
-        self.morphing.count(1.0, reset=True)
-
         if self.morphing.time_is_up() and self.can_transform():
             self.next_form()
             self.current_form.cx, self.current_form.cy = self.center
@@ -4,7 +4,7 @@ Bullet with radial movement.
 
 from math import pi as PI
 
-from ...utils import Timer
+from ...utils import WheelTimer
 from ..bullet import Bullet, BulletKwargs
 
 
@@ -25,7 +25,7 @@ class BulletRadial(Bullet):
         super().__init__(**kwargs)
 
         self.angle: float = angle
-        self.accel_timer: Timer = Timer(accel_time)
+        self.accel_timer: WheelTimer = WheelTimer(accel_time)
 
 
     def trajectory(self) -> None:
@@ -33,8 +33,6 @@ class BulletRadial(Bullet):
         Defines the trajectory of a normal radial bullet.
         """
 
-        self.accel_timer.count(1)
-
         if not self.accel_timer.time_is_up():
             self.accel += 0.3
 
@@ -4,7 +4,7 @@ Bullets with orbiting trajectory.
 
 from typing import TYPE_CHECKING
 
-from ...utils import Timer
+from ...utils import WheelTimer
 from ..bullet import BulletKwargs
 from .bullet_spiral import BulletSpiralSimple
 
@@ -38,7 +38,7 @@ class BulletOrbiting(BulletSpiralSimple):
                          initial_radius=initial_radius,
                          **kwargs)
 
-        self.until_orbit: Timer = Timer(time_until_orbit)
+        self.until_orbit: WheelTimer = WheelTimer(time_until_orbit)
         self.orbit_center: "BoundingShape" = orbit_center
         self.trajectory_radius: float = initial_radius
 
@@ -48,8 +48,6 @@ class BulletOrbiting(BulletSpiralSimple):
         Defines the trajectory of an orbiting bullet.
         """
 
-        self.until_orbit.count(1.0)
-
         if not self.until_orbit.time_is_up():
             super().trajectory()
             self.trajectory_radius: float = self.distance_to(self.orbit_center)
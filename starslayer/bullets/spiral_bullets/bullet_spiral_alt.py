@@ -4,7 +4,7 @@ Bullets with alternating spiral trajectory.
 
 from math import radians
 
-from ...utils import Timer
+from ...utils import WheelTimer
 from ..bullet import Bullet, BulletKwargs
 
 
@@ -34,7 +34,7 @@ class BulletSpiralAlt(Bullet):
         if radius_speed <= 0:
             raise ValueError("radius speed must be of value above zero.")
 
-        self.alternating: Timer = Timer(alternating_time)
+        self.alternating: WheelTimer = WheelTimer(alternating_time, repeat=True)
         self.direction_coefficient: int = (-1 if first_to_right else 1)
         self.curvature_speed: float = curvature_speed
         self.angle: float = starting_angle
@@ -56,8 +56,6 @@ class BulletSpiralAlt(Bullet):
         Defines the trajectory of a simple spiral bullet.
         """
 
-        self.alternating.count(1.0, reset=True)
-
         self.move_rad(self.trajectory_radius + self.speed * self.accel,
                       self.angle,
                       freely=True)
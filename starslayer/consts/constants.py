@@ -47,6 +47,11 @@ PLAYABLE_WIDTH = WIDTH - GUI_SPACE
 How much space in the X axis is actually playable.
 """
 
+CULL_AREA = (-(WIDTH * 0.2), -(HEIGHT * 0.15), WIDTH * 1.2, HEIGHT * 1.15)
+"""
+The area (left, top, right, bottom) outside of which entities are removed.
+"""
+
 CUSTOMEXT = "customppm"
 """
 The custom extension to use in sprites.
@@ -89,6 +94,17 @@ USED_CHEATS_LINES = ["You used cheats. As such, your score doesn't count.",
 Lines to say if the user used cheats in a run.
 """
 
+SCOREBOARD_SIZE = 10
+"""
+How many scores are kept in each scoreboard.
+"""
+
+SETTINGS_SAVE_DELAY = 0.5
+"""
+How many seconds the settings wait without changes before being
+written, so that many quick edits are written only once.
+"""
+
 PLAYER_HEALTH_BAR_ANIM = "player_health"
 """
 Player health's animation template name.
@@ -104,11 +120,162 @@ EXITING_DELAY = 150
 How much time the game waits when the 'EXIT' action is left pressed.
 """
 
+RECORD_INPUT_ENV = "STARSLAYER_RECORD_INPUT"
+"""
+Environment variable that, if set, holds the path of the log where
+the input of the run is recorded, so it can be replayed later.
+"""
+
+RECORD_DRAWS_ENV = "STARSLAYER_RECORD_DRAWS"
+"""
+Environment variable that, if set, holds the path of the log where
+every draw command of the run is recorded, along with where it was
+drawn from.
+"""
+
+BACKEND_ENV = "STARSLAYER_BACKEND"
+"""
+Environment variable that, if set, holds the name of the backend
+the game is drawn with and takes its input from.
+"""
+
+DEFAULT_BACKEND = "tk"
+"""
+The backend used if no other is chosen.
+"""
+
+LOG_MAX_BYTES = 1024 * 1024
+"""
+How big the log file can get, in bytes, before it is rotated.
+"""
+
+LOG_BACKUP_COUNT = 3
+"""
+How many rotated log files are kept.
+"""
+
+LOG_SUBSYSTEM_LEVELS = {}
+"""
+The log level of each subsystem that should not use the default one,
+as in '{"snapshot": "DEBUG"}'.
+"""
+
 DEBUG_LINES = True
 """
 Adds additional information on DEBUG action in process_action function (main module).
 """
 
+TEXT_LAYOUT_CACHE_SIZE = 256
+"""
+How many mutable text layouts are kept in cache before discarding the oldest ones.
+"""
+
+PALETTE_CACHE_SIZE = 8
+"""
+How many palette images of the color selector are kept, along with their files,
+before discarding the least recently drawn ones.
+"""
+
+SPRITE_LOD_FACTORS = (1, 2, 4)
+"""
+How many pixels of a sprite are merged into one, for each of its levels of detail.
+"""
+
+SPRITE_LOD_MIN_TEXEL = 3
+"""
+The least size, in screen pixels, that a pixel of a sprite should be drawn with.
+Smaller than that, a coarser level of detail is used.
+"""
+
+SPRITE_TEXELS_BUDGET = 1500
+"""
+How many sprite pixels can be drawn each frame, before sprites are drawn
+with less detail, or as a single solid shape.
+"""
+
+FRAMEBUFFER_RENDERING = False
+"""
+If 'True', the bullets and sprites of the playable area are drawn into a
+buffer of pixels, shown as a single image, instead of one canvas item each.
+"""
+
+QUALITY_STEPS = ("arc jitter",
+                 "lifebars",
+                 "rear animations",
+                 "front animations",
+                 "sprite detail",
+                 "bullet outlines")
+"""
+The optional effects the quality governor turns off when frames take
+too long, in the order they are turned off. The quality tier is how
+many of them are off.
+"""
+
+QUALITY_SMOOTHING = 0.1
+"""
+How much each new frame weighs in the average frame time of the quality governor.
+"""
+
+QUALITY_DOWN_RATIO = 1.0
+"""
+The share of the frame budget the average frame time must exceed to lower the quality.
+"""
+
+QUALITY_UP_RATIO = 0.6
+"""
+The share of the frame budget the average frame time must stay under to raise the quality.
+"""
+
+QUALITY_DOWN_FRAMES = 30
+"""
+For how many frames in a row the frame time must be too long to lower the quality one tier.
+"""
+
+QUALITY_UP_FRAMES = 180
+"""
+For how many frames in a row there must be headroom to raise the quality one tier.
+"""
+
+QUALITY_SPRITE_BUDGET = 0.3
+"""
+The share of SPRITE_TEXELS_BUDGET that is drawn once sprite detail is lowered.
+"""
+
+SPAWN_BUDGETS = {"player_bullets": 400,
+                 "enemies_bullets": 300}
+"""
+How many entities each container of the game can hold at once. Past
+that, the ones farthest out of the screen, or else the oldest, are evicted.
+"""
+
+SPAWN_RATES = {"player_bullets": 80,
+               "enemies_bullets": 60}
+"""
+How many entities can be added to each container of the game in a
+single tick. The rest wait for the next ticks.
+"""
+
+MEMORY_SAMPLE_INTERVAL = 600
+"""
+How many ticks in game pass between two samples of the memory telemetry.
+"""
+
+MEMORY_GROWTH_SAMPLES = 10
+"""
+For how many samples in a row a count must grow before it is logged as a leak.
+"""
+
+MEMORY_TRACE_ENV = "STARSLAYER_TRACE_MEMORY"
+"""
+If this environment variable is set, every memory sample also traces the
+allocations of the game, and logs which lines grew the most since the last one.
+"""
+
+MEMORY_TRACE_TOP = 5
+"""
+How many of the lines that grew the most are kept of each allocations trace.
+"""
+
 SPECIAL_CHARS = '<', "/\\", "\\/", '^', 'v', '+'
 """
 These chars will have their name mangled when processed.
@@ -135,6 +302,18 @@ Visible on Screen:
 Enemies: {enemies}
 Bullets: {bullets}
 Loot Drops: {drops}
+Held Back Spawns: {spawns}
+
+Text Layouts:
+Hits: {layout_hits}
+Misses: {layout_misses}
+
+Sprite Pixels: {sprite_texels}
+Degraded Sprites: {degraded_sprites}
+Quality: {quality}
+
+Memory:
+{memory}
 """
 
 STAR_SLAYER_INFO = """Standard stats,
@@ -270,6 +449,7 @@ GAME_ICON = abs_path("game_icon.gif", "textures.icon")
 ACTIONS_PATH = abs_path("actions.json", "json.actions")
 PROFILES_PATH = abs_path("color_profiles.json", "json.profiles")
 SCORES_PATH = abs_path("game_scores.json", "json.scores")
+SPAWNS_PATH = abs_path("spawn_waves.json", "json.spawns")
 LOG_PATH = abs_path("thestarthatslays.log")
 ## Hooks
 HOOKS_GROUPS_PATH = abs_path("groups", "hooks")
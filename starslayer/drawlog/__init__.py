@@ -0,0 +1,7 @@
+"""
+Draw Log Package.
+"""
+
+from .draw_recorder import *
+from .draw_replayer import *
+from .draw_report import *
@@ -0,0 +1,64 @@
+"""
+Reports or replays the draw commands recorded in a draw log.
+
+Usage: python -m starslayer.drawlog report draws.jsonl.gz
+       python -m starslayer.drawlog replay draws.jsonl.gz --repeat 5
+"""
+
+from argparse import ArgumentParser
+from statistics import mean
+from sys import stdout
+from typing import List, Optional
+
+from .draw_recorder import load_draw_log
+from .draw_replayer import replay_draws
+from .draw_report import write_report
+
+
+def main(args: Optional[List[str]]=None) -> int:
+    """
+    Parses the command line and reports or replays the log.
+    """
+
+    parser = ArgumentParser(prog="python -m starslayer.drawlog",
+                            description="Shows what a recorded run drew, and how long " +
+                                        "the Tk canvas takes to draw it.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    report_parser = subparsers.add_parser("report",
+                                          help="count the commands per frame by call " +
+                                               "site and by primitive")
+    report_parser.add_argument("log", help="the draw log to read")
+    report_parser.add_argument("-t", "--top", type=int, default=20,
+                               help="how many call sites to show (0 for all of them)")
+
+    replay_parser = subparsers.add_parser("replay",
+                                          help="paint the frames again and time them")
+    replay_parser.add_argument("log", help="the draw log to read")
+    replay_parser.add_argument("-r", "--repeat", type=int, default=1,
+                               help="how many times to paint every frame")
+    parsed = parser.parse_args(args)
+
+    size, frames = load_draw_log(parsed.log)
+
+    if parsed.command == "report":
+        write_report(frames, stdout, top=parsed.top)
+        return 0
+
+    if not frames:
+        print("There are no frames in the log.")
+        return 1
+
+    times = sorted(replay_draws(frames, size, repeat=parsed.repeat))
+    print(f"{len(times)} frames painted in {sum(times):.3f}s: " +
+          f"mean {mean(times) * 1000:.2f}ms, " +
+          f"median {times[len(times) // 2] * 1000:.2f}ms, " +
+          f"p95 {times[int(len(times) * 0.95)] * 1000:.2f}ms, " +
+          f"max {times[-1] * 1000:.2f}ms")
+
+    return 0
+
+
+if __name__ == "__main__":
+
+    raise SystemExit(main())
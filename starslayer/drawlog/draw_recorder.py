@@ -0,0 +1,200 @@
+"""
+Draw Recorder Module. Writes every draw command of a run, frame by
+frame, along with the function that drew it.
+"""
+
+import gzip
+from base64 import b64decode, b64encode
+from json import dumps, loads
+from sys import _getframe
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .. import gamelib
+from ..consts import HEIGHT, WIDTH
+
+if TYPE_CHECKING:
+    from types import FrameType
+
+DRAW_LOG_VERSION = 1
+"""
+The version of the draw log format.
+"""
+
+SKIPPED_MODULES = ("starslayer.gamelib", "starslayer.backends", __name__)
+"""
+Modules that only pass draw commands along, so they are not
+counted as where a command was drawn from.
+"""
+
+Command = Tuple[Any, ...]
+CapturedCommand = Tuple[str, Command] # (call site, command)
+
+
+def encode_value(value: Any) -> Dict[str, str]:
+    """
+    Turns the bytes of an image into something JSON can hold.
+    """
+
+    if isinstance(value, bytes):
+        return {"b64": b64encode(value).decode("ascii")}
+
+    raise TypeError(f"A value of type '{type(value).__name__}' cannot be recorded.")
+
+
+def decode_value(value: Dict[str, Any]) -> Any:
+    """
+    Turns back what 'encode_value' made into bytes.
+    """
+
+    if len(value) == 1 and "b64" in value:
+        return b64decode(value["b64"])
+
+    return value
+
+
+def call_site(frame: Optional["FrameType"]) -> str:
+    """
+    Returns the module and function of the first frame in the stack,
+    from 'frame' upwards, that is not from a module in 'SKIPPED_MODULES'.
+    """
+
+    while frame is not None:
+        module = frame.f_globals.get("__name__", '')
+
+        if not module.startswith(SKIPPED_MODULES):
+            return f"{module.removeprefix('starslayer.')}:{frame.f_code.co_name}"
+
+        frame = frame.f_back
+
+    return "?"
+
+
+class DrawRecorder:
+    """
+    Records the draw commands 'gamelib' sends, into a gzipped JSONL log.
+
+    The first line of the log holds the format version and the size of
+    the window. Then, there is one line per frame with its commands,
+    and a last line with how many frames were recorded.
+    """
+
+    def __init__(self, log_path: str, *, width: int=WIDTH, height: int=HEIGHT) -> None:
+        """
+        Initializes an instance of type 'DrawRecorder'.
+
+        Nothing is recorded until 'start' is called.
+        """
+
+        self.log_path: str = log_path
+        self.frames: int = 0
+        self._frame_commands: List[CapturedCommand] = []
+        self._file = gzip.open(log_path, mode="wt", encoding="utf-8") # pylint: disable=consider-using-with
+
+        self._write_line({"version": DRAW_LOG_VERSION, "width": width, "height": height})
+
+
+    def __enter__(self) -> "DrawRecorder":
+        """
+        Starts recording, to be used in a `with` block.
+        """
+
+        self.start()
+        return self
+
+
+    def __exit__(self, *_exc_info) -> None:
+        """
+        Stops recording and closes the log when leaving the `with` block.
+        """
+
+        self.close()
+
+
+    @property
+    def closed(self) -> bool:
+        """
+        Checks if the log is already closed.
+        """
+
+        return self._file.closed
+
+
+    def _write_line(self, line_dict: dict) -> None:
+        """
+        Writes a single line into the log.
+        """
+
+        self._file.write(dumps(line_dict, separators=(',', ':'), default=encode_value) + '\n')
+
+
+    def start(self) -> None:
+        """
+        Starts capturing the draw commands of 'gamelib'.
+        """
+
+        gamelib.capture(self.capture)
+
+
+    def capture(self, command: Optional[Command]) -> None:
+        """
+        Stores a draw command of the current frame,
+        or ends the frame if 'command' is 'None'.
+        """
+
+        if command is None:
+            self.end_frame()
+            return
+
+        self._frame_commands.append((call_site(_getframe(1)), command))
+
+
+    def end_frame(self) -> None:
+        """
+        Writes the commands of the current frame and moves on to the next one.
+        """
+
+        self._write_line({"frame": self.frames, "commands": self._frame_commands})
+        self._frame_commands.clear()
+        self.frames += 1
+
+
+    def close(self) -> None:
+        """
+        Stops capturing, writes how many frames were recorded and closes the log.
+        """
+
+        if self.closed:
+            return
+
+        gamelib.capture(None)
+        self._write_line({"end": self.frames})
+        self._file.close()
+
+
+def load_draw_log(log_path: str) -> Tuple[Tuple[int, int], List[List[CapturedCommand]]]:
+    """
+    Reads a draw log, and returns the size of the window
+    and the commands of each frame.
+    """
+
+    frames = []
+
+    with gzip.open(log_path, mode="rt", encoding="utf-8") as file:
+
+        header = loads(file.readline())
+
+        if header.get("version") != DRAW_LOG_VERSION:
+            raise ValueError(f"'{log_path}' has version {header.get('version')}, " +
+                             f"but only version {DRAW_LOG_VERSION} is supported.")
+
+        for line in file:
+            if not line.strip():
+                continue
+
+            line_dict = loads(line, object_hook=decode_value)
+
+            if "frame" in line_dict:
+                frames.append([(site, tuple(command))
+                               for site, command in line_dict["commands"]])
+
+    return (header["width"], header["height"]), frames
@@ -0,0 +1,29 @@
+"""
+Draw Replayer Module. Paints the frames of a draw log again on a
+Tk canvas, to measure how long drawing them takes by itself.
+"""
+
+from typing import TYPE_CHECKING, List, Sequence, Tuple
+
+from .. import gamelib
+
+if TYPE_CHECKING:
+    from .draw_recorder import CapturedCommand
+
+
+def replay_draws(frames: Sequence[Sequence["CapturedCommand"]],
+                 size: Tuple[int, int],
+                 *,
+                 repeat: int=1) -> List[float]:
+    """
+    Paints every frame 'repeat' times in a new window of 'size', as fast as
+    possible and without running the game, and returns how many seconds
+    each one took.
+    """
+
+    if repeat < 1:
+        raise ValueError(f"Frames cannot be painted {repeat} times.")
+
+    commands = [tuple(command for _, command in frame) for frame in frames]
+
+    return gamelib.paint_frames(commands * repeat, *size)
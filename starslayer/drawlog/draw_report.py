@@ -0,0 +1,87 @@
+"""
+Draw Report Module. Counts the draw commands of a draw log by
+where they were drawn from and by which primitive they draw.
+"""
+
+from collections import Counter
+from typing import TYPE_CHECKING, List, Sequence, TextIO, Tuple
+
+if TYPE_CHECKING:
+    from .draw_recorder import CapturedCommand, Command
+
+
+def primitive_of(command: "Command") -> str:
+    """
+    Returns what a command draws: 'rectangle', 'text', 'image', etc.
+    Commands that draw many shapes at once count as a batch of them.
+    """
+
+    method = command[0]
+
+    if method == "draw":
+        return command[1]
+
+    if method == "draw_many":
+        return f"{command[1]} batch"
+
+    return method.removeprefix("draw_")
+
+
+def count_commands(frames: Sequence[Sequence["CapturedCommand"]]) -> Tuple[Counter, Counter]:
+    """
+    Counts the commands of every frame by call site and by primitive.
+    """
+
+    by_site = Counter()
+    by_primitive = Counter()
+
+    for frame in frames:
+        for site, command in frame:
+            by_site[site] += 1
+            by_primitive[primitive_of(command)] += 1
+
+    return by_site, by_primitive
+
+
+def write_table(title: str, counts: Counter, frame_count: int, file: TextIO, top: int) -> None:
+    """
+    Writes the 'top' most common entries of 'counts', with how many
+    there are in total, per frame and as a share of all of them.
+    """
+
+    total = sum(counts.values())
+    rows: List[Tuple[str, int]] = counts.most_common(top or None)
+    width = max([len(title)] + [len(name) for name, _ in rows])
+
+    print(f"{title:<{width}}  {'total':>10}  {'per frame':>10}  {'share':>6}", file=file)
+
+    for name, count in rows:
+        print(f"{name:<{width}}  {count:>10}  {count / frame_count:>10.1f}  " +
+              f"{count / total:>6.1%}", file=file)
+
+    if len(counts) > len(rows):
+        print(f"... and {len(counts) - len(rows)} more", file=file)
+
+
+def write_report(frames: Sequence[Sequence["CapturedCommand"]],
+                 file: TextIO,
+                 *,
+                 top: int=20) -> None:
+    """
+    Writes how many commands each call site and each primitive
+    sent, in total and per frame.
+    """
+
+    if not frames:
+        print("There are no frames in the log.", file=file)
+        return
+
+    by_site, by_primitive = count_commands(frames)
+    per_frame = sorted(len(frame) for frame in frames)
+
+    print(f"{len(frames)} frames, {sum(per_frame)} commands " +
+          f"({sum(per_frame) / len(frames):.1f} per frame, " +
+          f"median {per_frame[len(per_frame) // 2]}, max {per_frame[-1]})\n", file=file)
+    write_table("call site", by_site, len(frames), file, top)
+    print(file=file)
+    write_table("primitive", by_primitive, len(frames), file, top)
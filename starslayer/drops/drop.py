@@ -64,6 +64,7 @@ class Drop(HitBox, ABC):
 
         self.accel: float = accel
         self.chrono: Chronometer = Chronometer()
+        self.collected: bool = False
 
 
     @abstractmethod
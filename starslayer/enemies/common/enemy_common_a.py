@@ -8,7 +8,7 @@ from ...bullets import BulletAccel
 from ...consts import ENEMY_COMMON_A_REL_PATH, HEIGHT, WIDTH
 from ...drops import MedKit
 from ...entity import EntityDict
-from ...utils import Timer
+from ...utils import WheelTimer
 from ..enemy import Enemy
 
 if TYPE_CHECKING:
@@ -40,21 +40,24 @@ class EnemyCommonA(Enemy):
                          texture_path=ENEMY_COMMON_A_REL_PATH,
                          **kwargs)
 
-        self.internal_timer: Timer = Timer(internal_timer_initial)
+        self.internal_timer: WheelTimer = WheelTimer(internal_timer_initial,
+                                                     on_expire=self._change_direction,
+                                                     repeat=True)
         self.direction: int = initial_direction
 
 
-    def trajectory(self) -> None:
+    def _change_direction(self) -> None:
         """
-        Defines the movement of a common enemy (A version).
+        Changes to the next direction.
         """
 
-        if self.internal_timer.time_is_up():
-            self.direction = (self.direction + 1) % 3
-            self.internal_timer.reset()
+        self.direction = (self.direction + 1) % 3
 
-        else:
-            self.internal_timer.count(1.0)
+
+    def trajectory(self) -> None:
+        """
+        Defines the movement of a common enemy (A version).
+        """
 
         self.transfer((self.speed * (self.direction - 1)), # from 0..1..2 to -1..0..1
                       ((self.speed // 2) if self.direction == 1 else 0))
@@ -3,13 +3,13 @@ Generic Enemy class module.
 """
 
 from abc import ABC, abstractmethod
-from random import choices
 from typing import TYPE_CHECKING, Dict, List, Optional
 
+from ..auxiliar import get_rng
 from ..consts import HEIGHT, WIDTH
 from ..drops import DropsList
 from ..entity import Entity
-from ..utils import HitBox, Timer
+from ..utils import HitBox, WheelTimer
 
 if TYPE_CHECKING:
     from ..drops import Drop
@@ -50,7 +50,7 @@ class Enemy(Entity, HitBox, ABC):
 
         super().__init__(**kwargs)
 
-        self._shooting_cooldown: int = Timer(shooting_cooldown)
+        self._shooting_cooldown: WheelTimer = WheelTimer(shooting_cooldown)
 
 
     def __contains__(self, enemy: "Enemy") -> bool:
@@ -71,7 +71,7 @@ class Enemy(Entity, HitBox, ABC):
 
 
     @property
-    def shooting_cooldown(self) -> Timer:
+    def shooting_cooldown(self) -> WheelTimer:
         """
         The shooting cooldown of the enemy.
         """
@@ -121,7 +121,7 @@ class Enemy(Entity, HitBox, ABC):
                 for _ in range(drops_amount - weights_amount):
                     weights_to_use.append(1)
 
-        drop = choices(self.loot_drops, weights_to_use)[0] # we only want one element
+        drop = get_rng().choices(self.loot_drops, weights_to_use)[0] # we only want one element
 
         if drop is not None:
             enemy_cx, enemy_cy = self.center
@@ -139,7 +139,6 @@ class Enemy(Entity, HitBox, ABC):
         Tries to fire bullets.
         """
 
-        self.shooting_cooldown.deduct(1)
         self.shoot_extra_bullets(bullets)
 
         if not self.shooting_cooldown.time_is_up():
@@ -9,7 +9,7 @@ from ...bullets import BulletHoming
 from ...consts import ENEMY_SWIFT_REL_PATH, HEIGHT, PLAYABLE_WIDTH, WIDTH
 from ...drops import MedKit, RadialBomb, SpiralBomb
 from ...entity import EntityDict
-from ...utils import Timer
+from ...utils import WheelTimer
 from ..enemy import Enemy
 
 if TYPE_CHECKING:
@@ -46,7 +46,7 @@ class EnemySwift(Enemy):
         self.target: "BoundingShape" = homing_target
         self.clockwise: bool = clockwise
         self.trajectory_radius: float = trajectory_radius
-        self.angle_timer: Timer = Timer(350)
+        self.angle_timer: WheelTimer = WheelTimer(350)
         self.angle: float = PI # 180 degrees
 
 
@@ -55,8 +55,6 @@ class EnemySwift(Enemy):
         Defines the movement of a swift enemy.
         """
 
-        self.angle_timer.count(1.0)
-
         if self.angle_timer.time_is_up():
             self.move(0.0, -self.speed,
                       freely=True)
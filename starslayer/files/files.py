@@ -5,10 +5,12 @@ variables in the behaviour of the game.
 
 
 from json import dump, load
-from os import listdir
-from os.path import isfile
+from os import chmod, fdopen, fsync, listdir, remove, replace, umask
+from os.path import dirname, isfile
 from os.path import join as path_join
 from os.path import splitext
+from shutil import copymode
+from tempfile import mkstemp
 from typing import Dict, List, Optional, Tuple
 
 from ..consts import DEFAULT_THEME
@@ -19,6 +21,13 @@ ProfilesDict = Dict[str, StrDict]
 
 GameDict = StrDict | ProfilesDict | ActionsDict
 
+_UMASK = umask(0o022)
+umask(_UMASK)
+"""
+The permissions the user masks out of new files. It can only be read by
+changing it, so it is read once here rather than while others write files.
+"""
+
 
 def load_json(file_name: str) -> GameDict:
     """
@@ -37,11 +46,33 @@ def load_json(file_name: str) -> GameDict:
 def dump_json(dump_dict: GameDict, file_name: str) -> None:
     """
     Dumps a python dictionary into a JSON file.
+
+    It is first written into a temporary file, synced to the disk, that
+    then replaces the original one, so a crash or a power loss while
+    writing never leaves it half done. The new file keeps the permissions
+    of the original one, or those the umask allows if there was none.
     """
 
-    with open(file_name, mode='w', encoding="utf-8") as file:
+    file_descriptor, temp_name = mkstemp(suffix=".tmp", dir=(dirname(file_name) or None))
+
+    try:
+        with fdopen(file_descriptor, mode='w', encoding="utf-8") as file:
+
+            dump(dump_dict, file, indent=4)
+            file.flush()
+            fsync(file.fileno())
+
+        if isfile(file_name):
+            copymode(file_name, temp_name)
+
+        else:
+            chmod(temp_name, 0o666 & ~_UMASK) # mkstemp only lets the owner read it
 
-        dump(dump_dict, file, indent=4)
+        replace(temp_name, file_name)
+
+    except BaseException:
+        remove(temp_name)
+        raise
 
 
 def get_action_from_key(key: str, actions_dict: ActionsDict) -> Optional[str]:
@@ -139,3 +170,19 @@ def count_files(dir_path: str, preferred_ext: Optional[str]=None) -> List[str]:
             files.append(elem)
 
     return files
+
+
+def write_ppm(file_name: str, width: int, height: int, pixels: bytes) -> None:
+    """
+    Writes an image in the binary PPM format, given its
+    pixels as consecutive red, green and blue bytes.
+    """
+
+    if len(pixels) != width * height * 3:
+        raise ValueError(f"There are {len(pixels)} bytes of pixels for an image " +
+                         f"of {width}x{height}. There should be {width * height * 3}.")
+
+    with open(file_name, mode="wb") as file:
+
+        file.write(f"P6\n{width} {height}\n255\n".encode("ascii"))
+        file.write(pixels)
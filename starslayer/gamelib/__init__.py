@@ -1,5 +1,25 @@
 """
 Gamelib Package.
+
+Only the events are imported right away. The rest of gamelib, which
+needs Tk, is imported the first time any of it is used.
 """
 
-from .gamelib import *
+from importlib import import_module
+from typing import Any
+
+from .events import *
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports gamelib when one of its functions is first asked for.
+    """
+
+    if name.startswith("__"):
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    value = getattr(import_module(".gamelib", __name__), name)
+    globals()[name] = value
+
+    return value
@@ -0,0 +1,52 @@
+"""
+The events of gamelib. They are apart from the rest of it, so they
+can be used without importing Tk.
+"""
+
+from enum import Enum
+
+class EventType(Enum):
+    "An enumeration of the different types of `Event`s supported by gamelib."
+
+    KeyPress = 'KeyPress'
+    "The user pressed a key."
+    KeyRelease = 'KeyRelease'
+    "The user released a key."
+    Motion = 'Motion'
+    "The user moved the mouse over the window."
+    ButtonPress = 'ButtonPress'
+    "The user pressed a mouse button."
+    ButtonRelease = 'ButtonRelease'
+    "The user released a mouse button."
+
+class Event:
+    """
+    Represents an event generated by the user.
+
+    Attributes:
+        type: An `EventType`.
+        key: A key that has been pressed/released.
+        mouse_button: 0, 1 or 2 for left, right and middle mouse buttons respectively.
+        x: The current mouse horizontal position, in pixels.
+        y: The current mouse vertical position, in pixels.
+
+    This is actually a wrapper for the
+    [Tkinter Event class](https://anzeljg.github.io/rin2/book2/2405/docs/tkinter/event-handlers.html).
+    Any of the `tk.Event` attributes can be accessed through this object.
+
+    ## See also
+
+    `wait`, `get_events`
+    """
+
+    def __init__(self, tkevent):
+        self.tkevent = tkevent
+
+    def __getattr__(self, k):
+        if k == 'type': return EventType[self.tkevent.type.name]
+        if k == 'key': return self.tkevent.keysym
+        if k == 'mouse_button': return self.tkevent.num
+        return getattr(self.tkevent, k)
+
+    def __repr__(self):
+        return repr(self.tkevent)
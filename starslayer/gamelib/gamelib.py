@@ -9,13 +9,14 @@ import tkinter as tk
 from tkinter.font import Font
 from tkinter import simpledialog, messagebox
 from queue import Queue, Empty
-from enum import Enum
 import threading
 import time
 import signal
 import os
 import sys
 
+from .events import Event, EventType
+
 class _TkWindow(tk.Tk):
     instance = None
     initialized = threading.Event()
@@ -25,6 +26,13 @@ class _TkWindow(tk.Tk):
     idle = threading.Event()
     idle.set()
 
+    # latest complete frame drawn by the game thread, not yet painted
+    frame = None
+    frame_lock = threading.Lock()
+    frames_dropped = 0
+    # seconds spent painting frames so far
+    paint_time = 0.0
+
     def __init__(self):
         super().__init__()
 
@@ -65,11 +73,27 @@ class _TkWindow(tk.Tk):
                     getattr(self, method)(*args)
                 except Empty:
                     break
+            self.paint_frame()
         finally:
             _TkWindow.busy_count -= 1
             if _TkWindow.busy_count == 0:
                 _TkWindow.idle.set()
 
+    def paint_frame(self):
+        with _TkWindow.frame_lock:
+            frame, _TkWindow.frame = _TkWindow.frame, None
+        if frame is None:
+            return
+        start = time.perf_counter()
+        self.paint(frame)
+        _TkWindow.paint_time += time.perf_counter() - start
+
+    def paint(self, frame):
+        self.clear()
+        for method, *args in frame:
+            getattr(self, method)(*args)
+        self.update_idletasks()
+
     def handle_event(self, tkevent):
         _GameThread.events.put(Event(tkevent))
 
@@ -85,11 +109,28 @@ class _TkWindow(tk.Tk):
     def draw_image(self, path, x, y):
         self.canvas.create_image(x, y, anchor='nw', image=self.get_image(path))
 
+    def draw_image_data(self, name, data, x, y):
+        key = f'data-{name}'
+        if key not in self.assets:
+            self.assets[key] = tk.PhotoImage()
+        self.assets[key].configure(data=data, format='ppm')
+        self.canvas.create_image(x, y, anchor='nw', image=self.assets[key])
+
+    def forget_image(self, path):
+        self.assets.pop(path, None)
+
     def draw(self, type, args, kwargs):
         options = {'fill': 'white'}
         options.update(kwargs)
         getattr(self.canvas, f'create_{type}')(*args, **options)
 
+    def draw_many(self, type, shapes, kwargs):
+        options = {'fill': 'white'}
+        options.update(kwargs)
+        create = getattr(self.canvas, f'create_{type}')
+        for coords in shapes:
+            create(*coords, **options)
+
     def draw_text(self, text, x, y, font, size, bold, italic, kwargs):
         options = {'fill': 'white'}
         options.update(kwargs)
@@ -241,6 +282,12 @@ class _GameThread(threading.Thread):
     initialized = threading.Event()
     events = Queue()
 
+    # commands of the frame being drawn, between `draw_begin` and `draw_end`
+    frame = None
+
+    # called with every draw command, and with `None` at the end of each frame
+    capturer = None
+
     def start(self, game_main, args):
         self.game_main = game_main
         self.args = args
@@ -272,6 +319,21 @@ class _GameThread(threading.Thread):
         if notify:
             self.notify_tk()
 
+    def send_draw_command(self, *args):
+        if self.capturer is not None:
+            self.capturer(args)
+        if self.frame is None:
+            self.send_command_to_tk(*args)
+        else:
+            self.frame.append(args)
+
+    def publish_frame(self, frame):
+        with _TkWindow.frame_lock:
+            if _TkWindow.frame is not None:
+                _TkWindow.frames_dropped += 1
+            _TkWindow.frame = frame
+        self.notify_tk()
+
     def wait(self, event_type=None):
         """
         Wait until the next `Event`: a key is pressed/released, the mouse is moved, etc,
@@ -351,7 +413,7 @@ class _GameThread(threading.Thread):
 
     def draw_begin(self):
         """
-        Clear the window.
+        Start a new frame. The window is cleared when the frame is painted.
 
         Any call to `draw_*` should be between `draw_begin` and `draw_end`.
 
@@ -362,8 +424,7 @@ class _GameThread(threading.Thread):
             gamelib.draw_end()
             ```
         """
-        _TkWindow.idle.wait()
-        self.send_command_to_tk('clear')
+        self.frame = []
 
     def draw_image(self, path, x, y):
         """
@@ -378,7 +439,36 @@ class _GameThread(threading.Thread):
             The only image formats that are supported accross all platforms (Windows/Mac/Linux)
             are GIF and PPM/PGM/PBM.
         """
-        self.send_command_to_tk('draw_image', path, x, y)
+        self.send_draw_command('draw_image', path, x, y)
+
+    def draw_image_data(self, name, data, x, y):
+        """
+        Draw an image given as the bytes of a binary PPM file in the coordinates `x, y`.
+
+        Images drawn with the same `name` reuse the same Tk image, so an image
+        that changes every frame (e.g. one drawn pixel by pixel) is cheap to update.
+
+        Example:
+            ```
+            gamelib.draw_image_data('noise', b'P6\\n1 1\\n255\\n\\xff\\x00\\x00', 10, 10)
+            ```
+        """
+        self.send_draw_command('draw_image_data', name, data, x, y)
+
+    def forget_image(self, path):
+        """
+        Free the image located at `path`, which `draw_image` keeps loaded after
+        drawing it once. Drawing it again loads it anew.
+
+        It is not part of the frame being drawn, so that it is not lost if that
+        frame is dropped; frames drawn before may not draw the image anymore.
+
+        Example:
+            ```
+            gamelib.forget_image('images/player.gif')
+            ```
+        """
+        self.send_command_to_tk('forget_image', path)
 
     def draw_text(self, text, x, y, font=None, size=12, bold=False, italic=False, **options):
         """
@@ -411,7 +501,7 @@ class _GameThread(threading.Thread):
             gamelib.draw_text('Hello world!', 10, 10, fill='red', anchor='nw')
             ```
         """
-        self.send_command_to_tk('draw_text', text, x, y, font, size, bold, italic, options)
+        self.send_draw_command('draw_text', text, x, y, font, size, bold, italic, options)
 
     def draw_arc(self, x1, y1, x2, y2, **options):
         """
@@ -426,7 +516,7 @@ class _GameThread(threading.Thread):
             gamelib.draw_arc(10, 10, 20, 20, outline='white', fill='red')
             ```
         """
-        self.send_command_to_tk('draw', 'arc', [x1, y1, x2, y2], options)
+        self.send_draw_command('draw', 'arc', [x1, y1, x2, y2], options)
 
     def draw_line(self, x1, y1, x2, y2, **options):
         """
@@ -440,7 +530,36 @@ class _GameThread(threading.Thread):
             gamelib.draw_line(10, 10, 30, 20, fill='blue', width=2)
             ```
         """
-        self.send_command_to_tk('draw', 'line', [x1, y1, x2, y2], options)
+        self.send_draw_command('draw', 'line', [x1, y1, x2, y2], options)
+
+    def draw_polyline(self, points, **options):
+        """
+        Draw a line through all the given `points`, as a single item. The list must have
+        an even amount of numbers; each pair determines a point. Unlike `draw_polygon`,
+        the last point is not joined with the first one.
+
+        It takes the same options as `draw_line`.
+
+        Example:
+            ```
+            gamelib.draw_polyline([10, 10, 30, 20, 0, 40], fill='blue', width=2)
+            ```
+        """
+        self.send_draw_command('draw', 'line', points, options)
+
+    def draw_lines(self, segments, **options):
+        """
+        Draw many straight lines with the same options in a single command. Each
+        segment is a sequence of four numbers `x1, y1, x2, y2`.
+
+        It takes the same options as `draw_line`.
+
+        Example:
+            ```
+            gamelib.draw_lines([(10, 10, 30, 20), (0, 40, 10, 50)], fill='blue')
+            ```
+        """
+        self.send_draw_command('draw_many', 'line', segments, options)
 
     def draw_oval(self, x1, y1, x2, y2, **options):
         """
@@ -454,7 +573,21 @@ class _GameThread(threading.Thread):
             gamelib.draw_oval(10, 10, 30, 20, outline='white', fill='red')
             ```
         """
-        self.send_command_to_tk('draw', 'oval', [x1, y1, x2, y2], options)
+        self.send_draw_command('draw', 'oval', [x1, y1, x2, y2], options)
+
+    def draw_ovals(self, boxes, **options):
+        """
+        Draw many ellipses with the same options in a single command. Each bounding
+        box is a sequence of four numbers `x1, y1, x2, y2`.
+
+        It takes the same options as `draw_oval`.
+
+        Example:
+            ```
+            gamelib.draw_ovals([(10, 10, 30, 20), (0, 40, 10, 50)], outline='red', fill='')
+            ```
+        """
+        self.send_draw_command('draw_many', 'oval', boxes, options)
 
     def draw_polygon(self, points, **options):
         """
@@ -470,7 +603,7 @@ class _GameThread(threading.Thread):
             gamelib.draw_polygon([10, 10, 30, 20, 0, 40], outline='white', fill='red')
             ```
         """
-        self.send_command_to_tk('draw', 'polygon', points, options)
+        self.send_draw_command('draw', 'polygon', points, options)
 
     def draw_rectangle(self, x1, y1, x2, y2, **options):
         """
@@ -484,11 +617,29 @@ class _GameThread(threading.Thread):
             gamelib.draw_rectangle(10, 10, 30, 20, outline='white', fill='red')
             ```
         """
-        self.send_command_to_tk('draw', 'rectangle', [x1, y1, x2, y2], options)
+        self.send_draw_command('draw', 'rectangle', [x1, y1, x2, y2], options)
+
+    def draw_rectangles(self, boxes, **options):
+        """
+        Draw many rectangles with the same options in a single command. Each bounding
+        box is a sequence of four numbers `x1, y1, x2, y2`.
+
+        It takes the same options as `draw_rectangle`.
+
+        Example:
+            ```
+            gamelib.draw_rectangles([(10, 10, 30, 20), (0, 40, 10, 50)], outline='red', fill='')
+            ```
+        """
+        self.send_draw_command('draw_many', 'rectangle', boxes, options)
 
     def draw_end(self):
         """
-        Refresh the window.
+        Refresh the window with the frame drawn since `draw_begin`.
+
+        It does not wait for the frame to be painted, so the next one can be
+        computed meanwhile. If frames are drawn faster than they are painted,
+        only the newest one is painted and the older ones are dropped.
 
         Any call to `draw_*` should be between `draw_begin` and `draw_end`.
 
@@ -499,7 +650,39 @@ class _GameThread(threading.Thread):
             gamelib.draw_end()
             ```
         """
-        self.send_command_to_tk('update', notify=True)
+        if self.capturer is not None:
+            self.capturer(None)
+        frame, self.frame = self.frame, None
+        if frame is None:
+            self.send_command_to_tk('update', notify=True)
+        else:
+            self.publish_frame(tuple(frame))
+
+    def capture(self, capturer):
+        """
+        Call `capturer` with every draw command as it is sent, and with `None`
+        at the end of each frame. Pass `None` to stop capturing.
+
+        Each command is a tuple of the window method that draws it and its
+        arguments, so the frames can be painted again with `paint_frames`.
+
+        Example:
+            ```
+            commands = []
+            gamelib.capture(commands.append)
+            ```
+        """
+        _GameThread.capturer = capturer
+
+    def paint_stats(self):
+        """
+        Return how many seconds the window spent painting frames so far, and
+        how many frames were dropped because they were not painted in time.
+
+        Since `draw_end` does not wait for the frame to be painted, this is the
+        only way to know how long painting takes.
+        """
+        return _TkWindow.paint_time, _TkWindow.frames_dropped
 
     def resize(self, w, h):
         """Resize the window to be `w` pixels wide and `h` pixels tall."""
@@ -574,13 +757,21 @@ title = _GameThread.instance.title
 icon = _GameThread.instance.icon
 draw_begin = _GameThread.instance.draw_begin
 draw_image = _GameThread.instance.draw_image
+draw_image_data = _GameThread.instance.draw_image_data
+forget_image = _GameThread.instance.forget_image
 draw_text = _GameThread.instance.draw_text
 draw_arc = _GameThread.instance.draw_arc
 draw_line = _GameThread.instance.draw_line
+draw_polyline = _GameThread.instance.draw_polyline
+draw_lines = _GameThread.instance.draw_lines
 draw_oval = _GameThread.instance.draw_oval
+draw_ovals = _GameThread.instance.draw_ovals
 draw_polygon = _GameThread.instance.draw_polygon
 draw_rectangle = _GameThread.instance.draw_rectangle
+draw_rectangles = _GameThread.instance.draw_rectangles
 draw_end = _GameThread.instance.draw_end
+capture = _GameThread.instance.capture
+paint_stats = _GameThread.instance.paint_stats
 resize = _GameThread.instance.resize
 say = _GameThread.instance.say
 input = _GameThread.instance.input
@@ -625,51 +816,26 @@ def init(game_main, args=None):
             os._exit(1)
         os._exit(0)
 
-class EventType(Enum):
-    "An enumeration of the different types of `Event`s supported by gamelib."
-
-    KeyPress = 'KeyPress'
-    "The user pressed a key."
-    KeyRelease = 'KeyRelease'
-    "The user released a key."
-    Motion = 'Motion'
-    "The user moved the mouse over the window."
-    ButtonPress = 'ButtonPress'
-    "The user pressed a mouse button."
-    ButtonRelease = 'ButtonRelease'
-    "The user released a mouse button."
-
-class Event:
+def paint_frames(frames, w, h):
     """
-    Represents an event generated by the user.
-
-    Attributes:
-        type: An `EventType`.
-        key: A key that has been pressed/released.
-        mouse_button: 0, 1 or 2 for left, right and middle mouse buttons respectively.
-        x: The current mouse horizontal position, in pixels.
-        y: The current mouse vertical position, in pixels.
-
-    This is actually a wrapper for the
-    [Tkinter Event class](https://anzeljg.github.io/rin2/book2/2405/docs/tkinter/event-handlers.html).
-    Any of the `tk.Event` attributes can be accessed through this object.
-
-    ## See also
+    Paint each frame of draw commands got from `capture` in a new window of
+    `w` x `h` pixels, as fast as possible, without a game thread.
 
-    `wait`, `get_events`
+    Returns:
+        How many seconds each frame took to be painted.
     """
-
-    def __init__(self, tkevent):
-        self.tkevent = tkevent
-
-    def __getattr__(self, k):
-        if k == 'type': return EventType[self.tkevent.type.name]
-        if k == 'key': return self.tkevent.keysym
-        if k == 'mouse_button': return self.tkevent.num
-        return getattr(self.tkevent, k)
-
-    def __repr__(self):
-        return repr(self.tkevent)
+    window = _TkWindow()
+    window.resize(w, h)
+    window.update()
+    times = []
+    try:
+        for frame in frames:
+            start = time.perf_counter()
+            window.paint(frame)
+            times.append(time.perf_counter() - start)
+    finally:
+        window.destroy()
+    return times
 
 if __name__ == '__main__':
     def interactive_main(_locals):
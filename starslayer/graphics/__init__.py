@@ -1,6 +1,28 @@
 """
 Graphics Package.
+
+Its modules are imported the first time one of their names is asked for,
+so that the animations can be imported without the rest of the drawing.
 """
 
-from .graphics import draw_screen
-from .scene import SceneDrawer
+from importlib import import_module
+from typing import Any
+
+_LAZY_NAMES = {"draw_screen": ".graphics",
+               "PaletteImages": ".color_selector",
+               "QualityGovernor": ".quality",
+               "SceneDrawer": ".scene"}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports the module of a name when it is first asked for.
+    """
+
+    if name not in _LAZY_NAMES:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    value = getattr(import_module(_LAZY_NAMES[name], __name__), name)
+    globals()[name] = value
+
+    return value
@@ -7,7 +7,7 @@ from math import pi as PI
 from math import sin
 from typing import List, Optional, Tuple
 
-from ...gamelib import draw_oval
+from ...backends import draw_oval
 from ...utils import SpringTimer
 from .animation import Animation
 
@@ -41,7 +41,6 @@ class Circumference(Animation):
                          cy + initial_radius,
                          is_text=False,
                          **kwargs)
-        self.dot_coords: List[Tuple[float, float]] = [] # polar coordinates, mind you
         self.radius: float = initial_radius
         self.initial_angle: float = self._degrees_to_radians(initial_angle)
         self.max_radius: float = None
@@ -66,6 +65,12 @@ class Circumference(Animation):
                                                         where_to_start=self.where_to_start))
         self.variance_speed: float = abs(variance_speed)
 
+        # All the dots share the same distance to the center and rotate together
+        self.dot_distance: float = self.radius
+        self.angle_offset: float = 0.0
+        self.dot_cosines: Tuple[float, ...] = ()
+        self.dot_sines: Tuple[float, ...] = ()
+
         self.generate_circumference()
 
 
@@ -103,6 +108,16 @@ class Circumference(Animation):
         return (0.0 if not self.radius_timer else self.radius_timer.current_time)
 
 
+    @property
+    def dot_coords(self) -> List[Tuple[float, float]]:
+        """
+        Returns the POLAR coordinates of all the dots.
+        """
+
+        return [(self.dot_distance, theta + self.angle_offset)
+                for _, theta in map(self.generate_dot_coordinates, range(self.dot_density))]
+
+
     def polar_to_cartesian(self, radius: float, theta: float) -> Tuple[float, float]:
         """
         Converts polar coordinates to cartesian ones.
@@ -121,12 +136,17 @@ class Circumference(Animation):
 
     def generate_circumference(self) -> None:
         """
-        Generates the dots coordinates.
+        Generates the tables with the starting direction of each dot.
+
+        As the dots only rotate around the center, every frame just rotates
+        these once by the same angle, instead of calling 'cos' and 'sin' for
+        every dot.
         """
 
-        for dot_num in range(self.dot_density):
-            radius, theta = self.generate_dot_coordinates(dot_num)
-            self.dot_coords.append((radius, theta))
+        thetas = [theta for _, theta in map(self.generate_dot_coordinates, range(self.dot_density))]
+
+        self.dot_cosines = tuple(cos(theta) for theta in thetas)
+        self.dot_sines = tuple(sin(theta) for theta in thetas)
 
 
     def get_hitcircles(self, dot_x: float, dot_y: float) -> Tuple[float, float, float, float]:
@@ -147,8 +167,16 @@ class Circumference(Animation):
         Proceeds with the animation.
         """
 
-        for x, y in self.dot_coords:
-            x1, y1, x2, y2 = self.get_hitcircles(x, y)
+        rot_cos = self.dot_distance * cos(self.angle_offset)
+        rot_sin = self.dot_distance * sin(self.angle_offset)
+        center_x = self.center_x
+        center_y = self.center_y
+        radius = self.dot_raidus
+
+        for dot_cos, dot_sin in zip(self.dot_cosines, self.dot_sines):
+            cart_x = dot_cos * rot_cos - dot_sin * rot_sin + center_x
+            cart_y = dot_sin * rot_cos + dot_cos * rot_sin + center_y
+            x1, y1, x2, y2 = cart_x - radius, cart_y - radius, cart_x + radius, cart_y + radius
             draw_oval(x1=x1,
                       y1=y1,
                       x2=x2,
@@ -161,13 +189,9 @@ class Circumference(Animation):
         Moves each dot into its next coords.
         """
 
-        new_dots = []
-
-        for _, theta in self.dot_coords:
-            new_dots.append((self.radius + self.current_radius,
-                             theta + self.dot_speed))
+        self.dot_distance = self.radius + self.current_radius
+        self.angle_offset += self.dot_speed
 
-        self.dot_coords = new_dots
         if self.radius_timer:
             speed = (1.0 - (abs(self.current_radius) / self.radius_distance)) * self.variance_speed
             bottom_limit = 0.4
@@ -5,8 +5,8 @@ Coords traveler Animation Module.
 from math import sqrt
 from typing import List, Tuple
 
+from ...backends import draw_oval
 from ...consts import HEIGHT, WIDTH
-from ...gamelib import draw_oval
 from .animation import Animation
 
 DotsList = List[Tuple[Tuple[float, float], int]]
@@ -4,7 +4,7 @@ Moving Text Animation Module.
 
 from typing import Tuple
 
-from ...gamelib import draw_text
+from ...backends import draw_text
 from .animation import Animation
 
 
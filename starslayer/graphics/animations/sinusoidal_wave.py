@@ -2,11 +2,12 @@
 Sinusoidal Wave Animation Module.
 """
 
+from math import cos
 from math import pi as MATH_PI
 from math import sin
-from typing import List, Optional, Tuple
+from typing import Generator, List, Optional, Tuple
 
-from ...gamelib import draw_oval
+from ...backends import draw_oval
 from ...utils import SpringTimer
 from .animation import Animation
 
@@ -48,7 +49,6 @@ class SinusoidalWave(Animation):
 
         self.is_vertical: bool = vertical
         self.is_horizontal: bool = not self.is_vertical
-        self.dot_coords: List[Tuple[float, float, float, float]] = []
         self.bulge_frequency: int = bulge_frequency
         self.initial_phase: float = initial_phase
         self.dot_radius: int = dot_radius
@@ -60,6 +60,14 @@ class SinusoidalWave(Animation):
                                                           where_to_start=0)
         self.crop_after: float = self._validate_crop_value(crop_after)
 
+        # Tables for one period of the wave. See 'generate_wave'.
+        self.dot_spacing: float = self.longitude_space_between(self.dot_density)
+        self.long_offset: float = 0.0
+        self.wave_time: float = self.translation_coefficient
+        self.long_steps: Tuple[float, ...] = ()
+        self.phase_sines: Tuple[float, ...] = ()
+        self.phase_cosines: Tuple[float, ...] = ()
+
         self.generate_wave()
 
 
@@ -168,6 +176,41 @@ class SinusoidalWave(Animation):
         return self.translation_timer.current_time
 
 
+    @property
+    def phase_per_long(self) -> float:
+        """
+        Returns how much the phase of the wave changes for each
+        unit in the LONGITUDE axis.
+        """
+
+        return 1 / (MATH_PI * (34 / self.bulge_frequency))
+
+
+    @property
+    def visible_dots(self) -> int:
+        """
+        Returns how many dots, counting from the origin of the LONGITUDE
+        axis, are not cropped.
+        """
+
+        crop_limit = self.get_coord_by_percentage(self.crop_after) + self.origin_long
+        first_end = self.origin_long + self.long_offset + self.dot_radius
+
+        if first_end > crop_limit:
+            return 0
+
+        return min(self.dot_density, int((crop_limit - first_end) // self.dot_spacing) + 1)
+
+
+    @property
+    def dot_coords(self) -> List[Tuple[float, float, float, float]]:
+        """
+        Returns the hitboxes of all the dots of the wave.
+        """
+
+        return list(self.generate_hitboxes(self.dot_density))
+
+
     def change_crop(self, new_crop_value: float) -> None:
         """
         Changes the crop value to a new one.
@@ -234,28 +277,53 @@ class SinusoidalWave(Animation):
 
     def generate_wave(self) -> None:
         """
-        Generates the wave and all the dot coords.
+        Generates the tables for one period of the wave.
+
+        The dots are evenly spaced, so the phase of the dot 'k' is always the
+        phase of the first one plus 'k' times the same step. Storing the sine
+        and cosine of those steps means that each frame only needs the ones of
+        the first dot, instead of calling 'sin' for every dot.
         """
 
-        long_aux = (self.y1 if self.is_vertical else self.x1)
-        space_between = self.longitude_space_between(self.dot_density)
+        phase_step = self.dot_spacing * self.phase_per_long
 
-        for dot_num in range(self.dot_density):
-            dot_x, dot_y = self.calculate_coords(dot_num * space_between + long_aux) # long, ampl
-            self.dot_coords.append(self.get_hitbox(dot_x, dot_y))
+        self.long_steps = tuple(dot_num * self.dot_spacing for dot_num in range(self.dot_density))
+        self.phase_sines = tuple(sin(dot_num * phase_step) for dot_num in range(self.dot_density))
+        self.phase_cosines = tuple(cos(dot_num * phase_step) for dot_num in range(self.dot_density))
 
 
-    def animate(self, **_kwargs) -> None:
+    def generate_hitboxes(self,
+                          how_many: int) -> Generator[Tuple[float, float, float, float], None, None]:
         """
-        Proceeds with the animation.
+        Yields the hitboxes of the first 'how_many' dots in the LONGITUDE axis.
         """
 
-        for x1, y1, x2, y2 in self.dot_coords: # pylint: disable=invalid-name
+        ampl_aux = ((self.x1 + self.x2) / 2 if self.is_vertical else (self.y1 + self.y2) / 2)
+        first_long = self.origin_long + self.long_offset
+        first_phase = (first_long * self.phase_per_long + ampl_aux + self.initial_phase
+                       - (self.wave_time * self.translation_speed))
+        first_sin = sin(first_phase)
+        first_cos = cos(first_phase)
+        half_ampl = self.amplitude / 2
+
+        for dot_num in range(how_many):
+
+            dot_long = first_long + self.long_steps[dot_num]
+            dot_ampl = (half_ampl * (first_sin * self.phase_cosines[dot_num]
+                                     + first_cos * self.phase_sines[dot_num])
+                        + ampl_aux)
 
-            _, long_2 = self.longitude_coords(x1, y1, x2, y2)
+            yield (self.get_hitbox(dot_ampl, dot_long)
+                   if self.is_vertical
+                   else self.get_hitbox(dot_long, dot_ampl))
 
-            if long_2 > (self.get_coord_by_percentage(self.crop_after) + self.origin_long):
-                continue
+
+    def animate(self, **_kwargs) -> None:
+        """
+        Proceeds with the animation.
+        """
+
+        for x1, y1, x2, y2 in self.generate_hitboxes(self.visible_dots): # pylint: disable=invalid-name
 
             draw_oval(x1=x1,
                       y1=y1,
@@ -269,30 +337,7 @@ class SinusoidalWave(Animation):
         Moves each dot into its next coords.
         """
 
-        new_dots = []
-
-        for coords in self.dot_coords:
-
-            dot_x1, dot_y1, dot_x2, dot_y2 = coords
-            dot_y_center = (dot_y1 + dot_y2) / 2
-            dot_x_center = (dot_x1 + dot_x2) / 2
-
-            if dot_y1 > self.y2:
-                dot_y_center = self.y1
-
-            elif dot_y2 < self.y1:
-                dot_y_center = self.y2
-
-            if dot_x1 > self.x2:
-                dot_x_center = self.x1
-
-            elif dot_x2 < self.x1:
-                dot_x_center = self.x2
-
-            which_to_use = (dot_y_center if self.is_vertical else dot_x_center)
-
-            dot_x, dot_y = self.calculate_coords(which_to_use + self.wave_speed)
-            new_dots.append(self.get_hitbox(dot_x, dot_y))
-
-        self.dot_coords = new_dots
+        # The dots that go past one end come back from the other one
+        self.long_offset = (self.long_offset + self.wave_speed) % self.dot_spacing
+        self.wave_time = self.translation_coefficient
         self.translation_timer.count(0.001)
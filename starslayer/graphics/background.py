@@ -6,8 +6,8 @@ from sys import version_info
 from typing import TYPE_CHECKING
 
 from ..auxiliar import get_color
+from ..backends import draw_rectangle, draw_text
 from ..consts import HEIGHT, WIDTH
-from ..gamelib import draw_rectangle, draw_text
 
 if TYPE_CHECKING:
     from ..state import Game
@@ -2,16 +2,162 @@
 Color selector Graphics Module.
 """
 
-from typing import TYPE_CHECKING
-
-from ..auxiliar import get_color
-from ..consts import HEIGHT, SPECIAL_CHARS, WIDTH
-from ..gamelib import draw_line, draw_oval, draw_rectangle, draw_text
+from atexit import register
+from os import remove
+from shutil import rmtree
+from tempfile import mkdtemp
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from ..auxiliar import Singleton, get_color
+from ..backends import (draw_image, draw_line, draw_oval, draw_rectangle,
+                        draw_text, forget_image)
+from ..consts import HEIGHT, PALETTE_CACHE_SIZE, SPECIAL_CHARS, WIDTH
+from ..files import path_join, write_ppm
 from .gui import draw_button_hitbox
 
 if TYPE_CHECKING:
+    from ..color import RGBTuple
+    from ..selector import ColorSelector
     from ..state import Game
 
+ImageKey = Tuple[str, int] # (what it is, hue index)
+
+
+class PaletteImages(metaclass=Singleton):
+    """
+    The palette and the hue bar of the color selector, each rendered
+    into an image the first time it is drawn, so that they are later
+    drawn all at once instead of cell by cell.
+
+    The images are kept in a temporary folder, which 'remove' deletes.
+    Only the palettes of the last few hues drawn are kept; older ones are
+    deleted, both their files and the images loaded from them.
+    """
+
+    def __init__(self, max_palettes: int=PALETTE_CACHE_SIZE) -> None:
+        """
+        Initializes an instance of type 'PaletteImages'.
+        """
+
+        self.max_palettes: int = max_palettes
+        self.folder: Optional[str] = None
+        self.paths: Dict[ImageKey, str] = {}
+
+
+    def _new_path(self, key: ImageKey) -> str:
+        """
+        Returns where to write the image of 'key'.
+        """
+
+        if self.folder is None:
+            self.folder = mkdtemp(prefix="starslayer-palettes-")
+            register(rmtree, self.folder, ignore_errors=True)
+
+        name, hue_index = key
+        return path_join(self.folder, f"{name}_{hue_index:03d}.ppm")
+
+
+    def remove(self) -> None:
+        """
+        Deletes the folder of the images, if any. It should be called
+        before the game exits, as some ways out of it skip the exit handlers.
+        """
+
+        if self.folder is not None:
+            rmtree(self.folder, ignore_errors=True)
+
+        self.folder = None
+        self.paths.clear()
+
+
+    def palette(self, selector: "ColorSelector") -> str:
+        """
+        Returns the path of the image of the palette of the selected hue.
+        """
+
+        key = ("palette", selector.hue_index)
+
+        if key in self.paths:
+            self.paths[key] = self.paths.pop(key) # It is now the most recently drawn
+
+        else:
+            palettes = [other for other in self.paths if other[0] == "palette"]
+
+            if len(palettes) >= self.max_palettes:
+                self._forget(palettes[0])
+
+            self.paths[key] = self._render(key, selector.palette_area, selector.palette_rgb())
+
+        return self.paths[key]
+
+
+    def _forget(self, key: ImageKey) -> None:
+        """
+        Deletes the image of 'key', and frees what was loaded from it.
+        """
+
+        path = self.paths.pop(key)
+        forget_image(path)
+
+        try:
+            remove(path)
+
+        except OSError:
+            pass
+
+
+    def hue_bar(self, selector: "ColorSelector") -> str:
+        """
+        Returns the path of the image of the hue bar.
+        """
+
+        key = ("hue_bar", 0)
+
+        if key not in self.paths:
+            self.paths[key] = self._render(key,
+                                           selector.hue_bar_area,
+                                           [[color.rgb for _, color in selector.hue_bar]])
+
+        return self.paths[key]
+
+
+    def _render(self,
+                key: ImageKey,
+                area: Tuple[float, float, float, float],
+                cells: List[List["RGBTuple"]]) -> str:
+        """
+        Writes an image filling 'area' with a grid of colored cells,
+        given as a list of rows, and returns its path.
+        """
+
+        x1, y1, x2, y2 = area # pylint: disable=invalid-name
+        col_edges = cell_edges(x1, x2, len(cells[0]))
+        row_edges = cell_edges(y1, y2, len(cells))
+        pixels = bytearray()
+
+        for row, row_rgb in enumerate(cells):
+
+            line = b''.join(bytes(rgb) * (col_edges[col + 1] - col_edges[col])
+                            for col, rgb in enumerate(row_rgb))
+            pixels += line * (row_edges[row + 1] - row_edges[row])
+
+        path = self._new_path(key)
+        write_ppm(path, col_edges[-1], row_edges[-1], bytes(pixels))
+
+        return path
+
+
+def cell_edges(start: float, end: float, cells: int) -> List[int]:
+    """
+    Returns where each of the cells between 'start' and 'end' begins, in
+    pixels and counting from 'start', followed by where the last one ends.
+    """
+
+    origin = round(start)
+    augment = (end - start) / cells
+
+    return [round(start + (cell * augment)) - origin for cell in range(cells + 1)]
+
 
 def draw_color_table(game: "Game") -> None:
     """
@@ -22,16 +168,7 @@ def draw_color_table(game: "Game") -> None:
     p_x1, p_y1, _, _ = selector.palette_area
     selection_width = (WIDTH // 160)
 
-    for row in range(selector.rows):
-
-        for col in range(selector.cols):
-
-            draw_rectangle(p_x1 + (col * selector.augment_x),
-                           p_y1 + (row * selector.augment_y),
-                           p_x1 + ((col + 1) * selector.augment_x),
-                           p_y1 + ((row + 1) * selector.augment_y),
-                           outline='',
-                           fill=selector.color_palette[(col, row)].hex)
+    draw_image(PaletteImages().palette(selector), round(p_x1), round(p_y1))
 
     extra_x = (WIDTH // 200)
     extra_y = (HEIGHT // 180)
@@ -58,14 +195,7 @@ def draw_hue_bar(game: "Game") -> None:
     hue_x1, hue_y1, _, hue_y2 = selector.hue_bar_area
     hue_augment = selector.hue_augment
 
-    for i, (_, hue_col) in enumerate(selector.hue_bar):
-
-        draw_rectangle(hue_x1 + (i * hue_augment),
-                       hue_y1,
-                       hue_x1 + ((i + 1) * hue_augment),
-                       hue_y2,
-                       outline='',
-                       fill=hue_col.hex)
+    draw_image(PaletteImages().hue_bar(selector), round(hue_x1), round(hue_y1))
 
     hue_i = selector.hue_index
     _, hue_color = selector.hue_bar[hue_i]
@@ -0,0 +1,338 @@
+"""
+Framebuffer Graphics Module. Draws the playable area into a buffer of
+pixels in memory, which is then shown as a single image.
+"""
+
+from functools import lru_cache
+from math import ceil, sqrt
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from ..auxiliar import get_color
+from ..backends import draw_image_data
+from ..bullets import BulletElectric, BulletSprites
+from ..consts import HEIGHT, PLAYABLE_WIDTH
+from ..sprites import load_frames
+from .gameplay import draw_electric_bullets_arcs, electric_color
+from .quality import QualityGovernor
+
+if TYPE_CHECKING:
+    from ..sprites import Sprite
+    from ..state import Game
+
+Run = Tuple[int, bytes] # (column where it starts, pixels)
+RasterRows = Tuple[Tuple[Run, ...], ...]
+
+
+@lru_cache(maxsize=None)
+def rgb_bytes(hex_color: str) -> Optional[bytes]:
+    """
+    Returns a color in the '#rgb' or '#rrggbb' format as three bytes,
+    or 'None' if it is not one of them, such as a transparent color.
+    """
+
+    if not hex_color.startswith('#'):
+        return None
+
+    digits = hex_color[1:]
+
+    if len(digits) == 3:
+        digits = ''.join(digit * 2 for digit in digits)
+
+    if len(digits) != 6:
+        return None
+
+    try:
+        return bytes.fromhex(digits)
+
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def rasterize_frame(sprite_path: str, frame_index: int, width: int, height: int) -> RasterRows:
+    """
+    Scales a sprite frame to 'width' x 'height' pixels, and returns each of
+    its rows as the runs of opaque pixels in it. It is only done once for
+    each frame and size, so that drawing it later is just copying bytes.
+    """
+
+    sprite_width, sprite_height, frames = load_frames(sprite_path)
+    frame = frames[frame_index]
+    rows = []
+
+    for y in range(height):
+        src_y = y * sprite_height // height
+        runs = []
+        start = None
+        pixels = bytearray()
+
+        for x in range(width):
+            color = frame.get((x * sprite_width // width, src_y))
+
+            if color is None:
+                if start is not None:
+                    runs.append((start, bytes(pixels)))
+                    start = None
+                    pixels.clear()
+
+                continue
+
+            if start is None:
+                start = x
+
+            pixels += bytes(color.rgb)
+
+        if start is not None:
+            runs.append((start, bytes(pixels)))
+
+        rows.append(tuple(runs))
+
+    return tuple(rows)
+
+
+class FrameBuffer:
+    """
+    A buffer of RGB pixels, one 'bytearray' per row.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """
+        Initializes an instance of type 'FrameBuffer'.
+        """
+
+        if width < 1 or height < 1:
+            raise ValueError(f"A framebuffer of {width}x{height} pixels cannot be made.")
+
+        self.width: int = width
+        self.height: int = height
+        self.rows: List[bytearray] = [bytearray(width * 3) for _ in range(height)]
+        self._header: bytes = f"P6\n{width} {height}\n255\n".encode("ascii")
+
+
+    def clear(self, rgb: bytes) -> None:
+        """
+        Paints every pixel with the same color.
+        """
+
+        blank = rgb * self.width
+
+        for row in self.rows:
+            row[:] = blank
+
+
+    def _span(self, y: int, x1: int, x2: int, rgb: bytes) -> None:
+        """
+        Paints the pixels of row 'y' from 'x1' up to (but not including) 'x2'.
+        """
+
+        x1 = max(x1, 0)
+        x2 = min(x2, self.width)
+
+        if 0 <= y < self.height and x1 < x2:
+            self.rows[y][x1 * 3:x2 * 3] = rgb * (x2 - x1)
+
+
+    # pylint: disable=invalid-name
+    def fill_rectangle(self, x1: float, y1: float, x2: float, y2: float, rgb: bytes) -> None:
+        """
+        Paints a rectangle given by two of its corners.
+        """
+
+        left, right = round(x1), round(x2)
+
+        for y in range(max(round(y1), 0), min(round(y2), self.height)):
+            self._span(y, left, right, rgb)
+
+
+    # pylint: disable=invalid-name
+    def fill_oval(self, x1: float, y1: float, x2: float, y2: float, rgb: bytes) -> None:
+        """
+        Paints an ellipse inside the bounding box given by two of its corners.
+        """
+
+        radius_x = (x2 - x1) / 2
+        radius_y = (y2 - y1) / 2
+
+        if radius_x <= 0 or radius_y <= 0:
+            return
+
+        cx = x1 + radius_x
+        cy = y1 + radius_y
+
+        for y in range(max(ceil(y1 - 0.5), 0), min(ceil(y2 - 0.5), self.height)):
+            dy = (y + 0.5 - cy) / radius_y
+            if dy * dy >= 1:
+                continue
+
+            half = radius_x * sqrt(1 - dy * dy)
+            self._span(y, round(cx - half), round(cx + half), rgb)
+
+
+    def blit(self, raster: RasterRows, x: int, y: int) -> None:
+        """
+        Copies the opaque pixels of a rasterized sprite,
+        with its top left corner at ('x', 'y').
+        """
+
+        for row_num, runs in enumerate(raster, start=y):
+            if not 0 <= row_num < self.height:
+                continue
+
+            row = self.rows[row_num]
+
+            for start, pixels in runs:
+                begin = x + start
+                end = begin + (len(pixels) // 3)
+
+                if begin >= 0 and end <= self.width:
+                    row[begin * 3:end * 3] = pixels
+                    continue
+
+                skip = max(0, -begin)
+                end = min(end, self.width)
+
+                if begin + skip < end:
+                    row[(begin + skip) * 3:end * 3] = pixels[skip * 3:(end - begin) * 3]
+
+
+    def to_ppm(self) -> bytes:
+        """
+        Returns the pixels as an image in the binary PPM format.
+        """
+
+        return self._header + b''.join(self.rows)
+
+
+_framebuffer: Optional[FrameBuffer] = None
+
+
+def get_framebuffer() -> FrameBuffer:
+    """
+    Returns the framebuffer of the playable area.
+    """
+
+    global _framebuffer # pylint: disable=global-statement
+
+    if _framebuffer is None:
+        _framebuffer = FrameBuffer(PLAYABLE_WIDTH, HEIGHT)
+
+    return _framebuffer
+
+
+# pylint: disable=invalid-name
+def blit_sprite(framebuffer: FrameBuffer,
+                sprite: Optional["Sprite"],
+                x1: float,
+                y1: float,
+                x2: float,
+                y2: float) -> None:
+    """
+    Draws a sprite into the framebuffer and moves it to its next frame.
+    Missing sprites are drawn as a magenta square, as 'draw_sprite' does.
+    """
+
+    if not sprite:
+        framebuffer.fill_rectangle(x1, y1, x2, y2, b"\xff\x00\xff")
+        return
+
+    left, top = round(x1), round(y1)
+    width, height = round(x2) - left, round(y2) - top
+
+    if width > 0 and height > 0:
+        framebuffer.blit(rasterize_frame(sprite.path,
+                                         sprite.current_frame_index,
+                                         width,
+                                         height),
+                         left,
+                         top)
+
+    sprite.next_frame()
+
+
+def draw_bullets_into(framebuffer: FrameBuffer, game: "Game") -> None:
+    """
+    Draws every bullet into the framebuffer, each with a thin outline.
+    The arcs of the electric bullets are still drawn on the canvas.
+    """
+
+    outline = rgb_bytes(get_color(game, "GUI OUTLINE 1"))
+    bullet_outline = (outline if QualityGovernor().allows("bullet outlines") else None)
+
+    for bullet in game.all_bullets:
+
+        match bullet.sprite_type:
+
+            case BulletSprites.PLAIN:
+                fill = get_color(game, "BULLET PLAIN 1")
+
+            case BulletSprites.SPECIAL:
+                fill = get_color(game, "BULLET SPECIAL 1")
+
+            case BulletSprites.SHINY:
+                fill = get_color(game, "BULLET SHINY 1")
+
+            case BulletSprites.ELECTRIC:
+                fill = electric_color(game)
+
+            case _:
+                continue
+
+        draw_outlined_oval(framebuffer, *bullet.all_coords, rgb_bytes(fill), bullet_outline)
+
+        if isinstance(bullet, BulletElectric):
+            cx, cy = bullet.center # pylint: disable=invalid-name
+            radius = bullet.field_radius
+            draw_outlined_oval(framebuffer,
+                               cx - radius, cy - radius, cx + radius, cy + radius,
+                               outline,
+                               rgb_bytes(electric_color(game)))
+
+
+# pylint: disable=invalid-name, too-many-arguments
+def draw_outlined_oval(framebuffer: FrameBuffer,
+                       x1: float,
+                       y1: float,
+                       x2: float,
+                       y2: float,
+                       fill: Optional[bytes],
+                       outline: Optional[bytes]) -> None:
+    """
+    Draws an ellipse into the framebuffer with a one pixel outline.
+    'None' colors are not drawn.
+    """
+
+    if outline:
+        framebuffer.fill_oval(x1, y1, x2, y2, outline)
+
+    if fill:
+        framebuffer.fill_oval(x1 + 1, y1 + 1, x2 - 1, y2 - 1, fill)
+
+
+def draw_playfield(game: "Game") -> None:
+    """
+    Draws the bullets, drops, enemies and player into the framebuffer,
+    and shows it as a single image over the playable area.
+    """
+
+    framebuffer = get_framebuffer()
+    framebuffer.clear(rgb_bytes(get_color(game, "BG_COLOR")) or b"\x00\x00\x00")
+
+    draw_bullets_into(framebuffer, game)
+
+    for drop in game.drops:
+        blit_sprite(framebuffer, drop.sprite, drop.x1, drop.y1, drop.x2, drop.y2)
+
+    for enem in game.enemies:
+        blit_sprite(framebuffer, enem.sprite, enem.x1, enem.y1, enem.x2, enem.y2)
+
+    player = game.player
+    blit_sprite(framebuffer, player.sprite, player.x1, player.y1, player.x2, player.y2)
+
+    if player.satellite:
+        blit_sprite(framebuffer, player.satellite.sprite, *player.satellite.all_coords)
+
+    draw_image_data("playfield", framebuffer.to_ppm(), 0, 0)
+
+    for bullet in game.all_bullets:
+        if isinstance(bullet, BulletElectric):
+            draw_electric_bullets_arcs(game, bullet)
@@ -3,23 +3,34 @@ Gmaeplay Graphics Module.
 """
 
 from random import choice
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Sequence, Tuple
 
 from ..auxiliar import get_color
+from ..backends import (draw_lines, draw_oval, draw_ovals, draw_polyline,
+                        draw_rectangles, draw_text)
 from ..bullets import BulletElectric, BulletSprites
 from ..consts import DEBUG_LINES, DEBUG_TEXT, HEIGHT, WIDTH
-from ..gamelib import draw_line, draw_oval, draw_rectangle, draw_text
+from ..telemetry import MemoryMonitor
 from .gui import draw_bar_percentage
+from .quality import QualityGovernor
+from .sprites import SpriteLOD
+from .text_layout import TextLayoutCache
 
 if TYPE_CHECKING:
     from ..state import Game
 
+Coords = Tuple[float, float, float, float]
+
 
 def draw_bullets(game: "Game") -> None:
     """
     Draws every single bullet currently on screen.
     """
 
+    outline = (get_color(game, "GUI OUTLINE 1")
+               if QualityGovernor().allows("bullet outlines")
+               else '')
+
     for bullet in game.all_bullets:
 
         x1, y1, x2, y2 = bullet.all_coords # pylint: disable=invalid-name
@@ -31,7 +42,7 @@ def draw_bullets(game: "Game") -> None:
                           y1=y1,
                           x2=x2,
                           y2=y2,
-                          outline=get_color(game, "GUI OUTLINE 1"),
+                          outline=outline,
                           fill=get_color(game, "BULLET PLAIN 1"))
 
             case BulletSprites.SPECIAL:
@@ -39,7 +50,7 @@ def draw_bullets(game: "Game") -> None:
                           y1=y1,
                           x2=x2,
                           y2=y2,
-                          outline=get_color(game, "GUI OUTLINE 1"),
+                          outline=outline,
                           fill=get_color(game, "BULLET SPECIAL 1"))
 
             case BulletSprites.SHINY:
@@ -47,15 +58,13 @@ def draw_bullets(game: "Game") -> None:
                           y1=y1,
                           x2=x2,
                           y2=y2,
-                          outline=get_color(game, "GUI OUTLINE 1"),
+                          outline=outline,
                           fill=get_color(game, "BULLET SHINY 1"))
 
             case BulletSprites.INVISIBLE:
                 pass # Do nothing
 
             case BulletSprites.ELECTRIC:
-                electric_colors = (get_color(game, "BULLET ELECTRIC 1"),
-                                   get_color(game, "BULLET ELECTRIC 2"))
                 cx, cy = bullet.center # pylint: disable=invalid-name
                 field_x1 = cx - bullet.field_radius
                 field_y1 = cy - bullet.field_radius
@@ -67,48 +76,67 @@ def draw_bullets(game: "Game") -> None:
                           y1=y1,
                           x2=x2,
                           y2=y2,
-                          outline=get_color(game, "GUI OUTLINE 1"),
-                          fill=choice(electric_colors))
+                          outline=outline,
+                          fill=electric_color(game))
 
                 if isinstance(bullet, BulletElectric):
                     draw_oval(x1=field_x1,
                               y1=field_y1,
                               x2=field_x2,
                               y2=field_y2,
-                              outline=choice(electric_colors),
+                              outline=electric_color(game),
                               fill=get_color(game, "GUI OUTLINE 1"),
-                              dash=choice(((dash_size, dash_size),
-                                            (dash_size // 2, dash_size ),
-                                            (dash_size, dash_size, dash_size // 3, dash_size))))
+                              dash=electric_dash(dash_size))
 
                     draw_electric_bullets_arcs(game, bullet)
 
 
+def electric_color(game: "Game") -> str:
+    """
+    Returns one of the colors of the electric bullets, at random
+    unless their jitter is turned off.
+    """
+
+    electric_colors = (get_color(game, "BULLET ELECTRIC 1"),
+                       get_color(game, "BULLET ELECTRIC 2"))
+
+    return (choice(electric_colors)
+            if QualityGovernor().allows("arc jitter")
+            else electric_colors[0])
+
+
+def electric_dash(dash_size: int) -> Tuple[int, ...]:
+    """
+    Returns the dash of the field of an electric bullet, at random
+    unless its jitter is turned off.
+    """
+
+    dashes = ((dash_size, dash_size),
+              (dash_size // 2, dash_size ),
+              (dash_size, dash_size, dash_size // 3, dash_size))
+
+    return (choice(dashes) if QualityGovernor().allows("arc jitter") else dashes[0])
+
+
 def draw_electric_bullets_arcs(game: "Game", bullet: BulletElectric) -> None:
     """
-    Draws the arcs of the electric bullets.
+    Draws the arcs of the electric bullets, unless their jitter is turned off.
     """
 
-    if not bullet.arcs_pivots:
+    if not bullet.arcs_pivots or not QualityGovernor().allows("arc jitter"):
         return
 
     cx, cy = bullet.center # pylint: disable=invalid-name
-    electric_colors = (get_color(game, "BULLET ELECTRIC 1"),
-                       get_color(game, "BULLET ELECTRIC 2"))
     size_aux = HEIGHT / 700
 
-    for piv in bullet.arcs_pivots: # We don't want to cross the last one
-        range_to_use = len(piv) - 1
-
-        for piv_i in range(range_to_use):
-            piv_x1, piv_y1 = piv[piv_i]
-            piv_x2, piv_y2 = piv[piv_i + 1]
+    for piv in bullet.arcs_pivots:
+        if len(piv) < 2:
+            continue
 
-            draw_line(cx + piv_x1,
-                      cy + piv_y1,
-                      cx + piv_x2,
-                      cy + piv_y2,
-                      fill=choice(electric_colors),
+        draw_polyline([coord
+                       for piv_x, piv_y in piv
+                       for coord in (cx + piv_x, cy + piv_y)],
+                      fill=electric_color(game),
                       width=size_aux)
 
 
@@ -120,186 +148,102 @@ def draw_debug_lines(game: "Game") -> None:
     player = game.player
     cx, cy = player.center # pylint: disable=invalid-name
     aux = (WIDTH // 150)
-
-    # Upper Lines
-    draw_line(cx,
-              0,
-              cx,
-              player.y1,
-              fill=get_color(game, "DEBUG_LINES_1"))
-    draw_line(cx - aux,
-              player.y1,
-              cx + aux,
-              player.y1,
-              fill=get_color(game, "DEBUG_LINES_1"))
-
-    # Bottom Lines
-    draw_line(cx,
-              player.y2,
-              cx,
-              HEIGHT,
-              fill=get_color(game, "DEBUG_LINES_1"))
-    draw_line(cx - aux,
-              player.y2,
-              cx + aux,
-              player.y2,
-              fill=get_color(game, "DEBUG_LINES_1"))
-
-    # Left Lines
-    draw_line(0,
-              cy,
-              player.x1,
-              cy,
-              fill=get_color(game, "DEBUG_LINES_1"))
-    draw_line(player.x1,
-              cy - aux,
-              player.x1,
-              cy + aux,
-              fill=get_color(game, "DEBUG_LINES_1"))
-
-    # Right Lines
-    draw_line(player.x2,
-              cy, WIDTH,
-              cy,
-              fill=get_color(game, "DEBUG_LINES_1"))
-    draw_line(player.x2,
-              cy - aux,
-              player.x2,
-              cy + aux,
-              fill=get_color(game, "DEBUG_LINES_1"))
-
+    corner = aux * 2
+    debug_color = get_color(game, "DEBUG_LINES_1")
+
+    draw_lines(((cx, 0, cx, player.y1), # Upper Lines
+                (cx - aux, player.y1, cx + aux, player.y1),
+                (cx, player.y2, cx, HEIGHT), # Bottom Lines
+                (cx - aux, player.y2, cx + aux, player.y2),
+                (0, cy, player.x1, cy), # Left Lines
+                (player.x1, cy - aux, player.x1, cy + aux),
+                (player.x2, cy, WIDTH, cy), # Right Lines
+                (player.x2, cy - aux, player.x2, cy + aux)),
+               fill=debug_color)
 
     # Upper-Left Corner
-    draw_line(player.x1,
-              player.y1,
-              player.x1 + (aux * 2),
-              player.y1,
-              fill=get_color(game, "DEBUG_LINES_1"))
-    draw_line(player.x1,
-              player.y1,
-              player.x1,
-              player.y1 + (aux * 2),
-              fill=get_color(game, "DEBUG_LINES_1"))
+    draw_polyline((player.x1 + corner, player.y1,
+                   player.x1, player.y1,
+                   player.x1, player.y1 + corner),
+                  fill=debug_color)
 
     # Upper-Right Corner
-    draw_line(player.x2,
-              player.y1,
-              player.x2 - (aux * 2),
-              player.y1,
-              fill=get_color(game, "DEBUG_LINES_1"))
-    draw_line(player.x2,
-              player.y1,
-              player.x2,
-              player.y1 + (aux * 2),
-              fill=get_color(game, "DEBUG_LINES_1"))
+    draw_polyline((player.x2 - corner, player.y1,
+                   player.x2, player.y1,
+                   player.x2, player.y1 + corner),
+                  fill=debug_color)
 
     # Bottom-Left Corner
-    draw_line(player.x1,
-              player.y2,
-              player.x1 + (aux * 2),
-              player.y2,
-              fill=get_color(game, "DEBUG_LINES_1"))
-    draw_line(player.x1,
-              player.y2,
-              player.x1,
-              player.y2 - (aux * 2),
-              fill=get_color(game, "DEBUG_LINES_1"))
+    draw_polyline((player.x1 + corner, player.y2,
+                   player.x1, player.y2,
+                   player.x1, player.y2 - corner),
+                  fill=debug_color)
 
     # Bottom-Right Corner
-    draw_line(player.x2,
-              player.y2,
-              player.x2 - (aux * 2),
-              player.y2,
-              fill=get_color(game, "DEBUG_LINES_1"))
-    draw_line(player.x2,
-              player.y2,
-              player.x2,
-              player.y2 - (aux * 2),
-              fill=get_color(game, "DEBUG_LINES_1"))
+    draw_polyline((player.x2 - corner, player.y2,
+                   player.x2, player.y2,
+                   player.x2, player.y2 - corner),
+                  fill=debug_color)
 
     aux2 = (WIDTH // 30)
     aux3 = int(aux2 * 1.67)
 
     if player.satellite:
-        sh_x1, sh_y1, sh_x2, sh_y2 = player.satellite.all_coords
-        draw_circle_case(game,
-                         sh_x1,
-                         sh_y1,
-                         sh_x2,
-                         sh_y2,
-                         aux=aux3)
+        draw_circle_cases(game, (player.satellite.all_coords,), aux=aux3)
+
+    draw_circle_cases(game, [bullet.all_coords for bullet in game.all_bullets], aux=aux2)
+    draw_box_cases(game, [enem.all_coords for enem in game.enemies], aux=aux3)
+
+
+def cross_segments(hitboxes: Sequence[Coords], aux: float) -> List[Coords]:
+    """
+    Returns the two lines of a cross at the center of each hitbox.
+    """
+
+    segments = []
+
+    for x1, y1, x2, y2 in hitboxes: # pylint: disable=invalid-name
+        cx = (x1 + x2) / 2 # pylint: disable=invalid-name
+        cy = (y1 + y2) / 2 # pylint: disable=invalid-name
+
+        segments.append((cx, cy - aux, cx, cy + aux))
+        segments.append((cx - aux, cy, cx + aux, cy))
+
+    return segments
 
-    for bullet in game.all_bullets:
 
-        bullet_x1, bullet_y1, bullet_x2, bullet_y2 = bullet.all_coords
-        draw_circle_case(game,
-                         bullet_x1,
-                         bullet_y1,
-                         bullet_x2,
-                         bullet_y2,
-                         aux=aux2)
-
-    for enem in game.enemies:
-
-        enem_x1, enem_y1, enem_x2, enem_y2 = enem.all_coords
-        draw_box_case(game,
-                      enem_x1,
-                      enem_y1,
-                      enem_x2,
-                      enem_y2,
-                      aux=aux3)
-
-
-# pylint: disable=invalid-name
-def draw_box_case(game: "Game",
-                  x1: float,
-                  y1: float,
-                  x2: float,
-                  y2: float,
-                  aux: float) -> None:
+def draw_box_cases(game: "Game", hitboxes: Sequence[Coords], aux: float) -> None:
     """
-    Draws a box case around a hitbox.
+    Draws a box case around each hitbox.
     """
 
-    cx = (x1 + x2) / 2
-    cy = (y1 + y2) / 2
+    if not hitboxes:
+        return
+
     debug_color = get_color(game, "DEBUG_LINES_2")
 
-    draw_rectangle(x1, y1, x2, y2,
-                   fill='',
-                   outline=debug_color)
-    draw_line(cx, cy - aux,
-              cx, cy + aux,
-              fill=debug_color)
-    draw_line(cx - aux,
-              cy, cx + aux,
-              cy, fill=debug_color)
-
-
-# pylint: disable=invalid-name
-def draw_circle_case(game: "Game",
-                     x1: float,
-                     y1: float,
-                     x2: float,
-                     y2: float,
-                     aux: float) -> None:
+    draw_rectangles(hitboxes,
+                    fill='',
+                    outline=debug_color)
+    draw_lines(cross_segments(hitboxes, aux),
+               fill=debug_color)
+
+
+def draw_circle_cases(game: "Game", hitboxes: Sequence[Coords], aux: float) -> None:
     """
-    Draws a box case around a hitcircle.
+    Draws a circle case inside each hitbox.
     """
 
-    cx = (x1 + x2) / 2
-    cy = (y1 + y2) / 2
+    if not hitboxes:
+        return
+
     debug_color = get_color(game, "DEBUG_LINES_2")
 
-    draw_oval(x1, y1, x2, y2,
-              fill='',
-              outline=debug_color)
-    draw_line(cx, cy - aux,
-              cx, cy + aux,
-              fill=debug_color)
-    draw_line(cx - aux, cy,
-              cx + aux, cy,
-              fill=debug_color)
+    draw_ovals(hitboxes,
+               fill='',
+               outline=debug_color)
+    draw_lines(cross_segments(hitboxes, aux),
+               fill=debug_color)
 
 
 def draw_lifebars(game: "Game") -> None:
@@ -363,7 +307,18 @@ def draw_debug_info(game: "Game") -> None:
 
                     enemies=len(game.enemies),
                     bullets=len(game.all_bullets),
-                    drops=len(game.drops))
+                    drops=len(game.drops),
+                    spawns=', '.join(f"{count} {name}"
+                                     for name, count in game.spawn_metrics().items()),
+
+                    layout_hits=TextLayoutCache().hits,
+                    layout_misses=TextLayoutCache().misses,
+
+                    sprite_texels=f"{SpriteLOD().drawn_texels} / {SpriteLOD().frame_budget}",
+                    degraded_sprites=SpriteLOD().degraded,
+                    quality=QualityGovernor().describe(),
+
+                    memory=MemoryMonitor().hud_text())
 
     draw_text(debug_text,
               debug_cons,
@@ -376,4 +331,6 @@ def draw_debug_info(game: "Game") -> None:
         return
 
     draw_debug_lines(game)
-    draw_lifebars(game)
+
+    if QualityGovernor().allows("lifebars"):
+        draw_lifebars(game)
@@ -6,16 +6,55 @@ sees on screen.
 from sys import version_info
 from typing import TYPE_CHECKING, Optional
 
+from ..consts import FRAMEBUFFER_RENDERING, QUALITY_SPRITE_BUDGET
 from .background import draw_background, draw_default_background
+from .framebuffer import draw_playfield
 from .gameplay import draw_bullets, draw_debug_info
 from .gui import draw_exiting_bar, draw_gui
-from .sprites import draw_sprite
+from .quality import QualityGovernor
+from .sprites import SpriteLOD, draw_sprite
 
 if TYPE_CHECKING:
     from ..graphics import SceneDrawer
     from ..state import Game
 
 
+def draw_entities(game: "Game") -> None:
+    """
+    Draws the drops, the enemies and the player.
+    """
+
+    for drop in game.drops:
+        draw_sprite(drop.sprite,
+                    drop.x1,
+                    drop.y1,
+                    drop.x2,
+                    drop.y2)
+
+    for enem in game.enemies:
+        draw_sprite(enem.sprite,
+                    enem.x1,
+                    enem.y1,
+                    enem.x2,
+                    enem.y2)
+
+    draw_sprite(game.player.sprite,
+                game.player.x1,
+                game.player.y1,
+                game.player.x2,
+                game.player.y2,
+                use_lod=False)
+
+    if game.player.satellite:
+        sh_x1, sh_y1, sh_x2, sh_y2 = game.player.satellite.all_coords
+        draw_sprite(game.player.satellite.sprite,
+                    sh_x1,
+                    sh_y1,
+                    sh_x2,
+                    sh_y2,
+                    sprite_type="CIRCLE")
+
+
 def draw_screen(game: "Game",
                 _cursor_x: Optional[int],
                 _cursor_y: Optional[int],
@@ -29,39 +68,20 @@ def draw_screen(game: "Game",
         draw_default_background()
         return
 
+    SpriteLOD().begin_frame(1.0 if QualityGovernor().allows("sprite detail")
+                            else QUALITY_SPRITE_BUDGET)
     draw_background(game)
-    draw_bullets(game)
+
+    if game.is_in_game and FRAMEBUFFER_RENDERING:
+        draw_playfield(game)
+
+    else:
+        draw_bullets(game)
 
     if game.is_in_game:
 
-        for drop in game.drops:
-            draw_sprite(drop.sprite,
-                        drop.x1,
-                        drop.y1,
-                        drop.x2,
-                        drop.y2)
-
-        for enem in game.enemies:
-            draw_sprite(enem.sprite,
-                        enem.x1,
-                        enem.y1,
-                        enem.x2,
-                        enem.y2)
-
-        draw_sprite(game.player.sprite,
-                    game.player.x1,
-                    game.player.y1,
-                    game.player.x2,
-                    game.player.y2)
-
-        if game.player.satellite:
-            sh_x1, sh_y1, sh_x2, sh_y2 = game.player.satellite.all_coords
-            draw_sprite(game.player.satellite.sprite,
-                        sh_x1,
-                        sh_y1,
-                        sh_x2,
-                        sh_y2,
-                        sprite_type="CIRCLE")
+        if not FRAMEBUFFER_RENDERING:
+            draw_entities(game)
 
         if game.show_debug_info:
             draw_debug_info(game)
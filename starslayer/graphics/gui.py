@@ -5,8 +5,9 @@ GUI Module.
 from typing import TYPE_CHECKING, Optional
 
 from ..auxiliar import get_color
+from ..backends import draw_line, draw_rectangle, draw_text
 from ..consts import HEIGHT, PLAYABLE_WIDTH, WIDTH
-from ..gamelib import draw_line, draw_rectangle, draw_text
+from .text_layout import draw_cached_text
 
 if TYPE_CHECKING:
     from ..state import Game
@@ -31,12 +32,12 @@ def draw_gui(game: "Game") -> None:
                    fill=get_color(game, "GUI COLOR 1"))
 
     # Game Score
-    draw_text("Score:",
-              prop_name_x,
-              HEIGHT * 0.03,
-              size=(WIDTH // 50),
-              fill=get_color(game, "TEXT COLOR 1"),
-              anchor='w')
+    draw_cached_text("Score:",
+                     prop_name_x,
+                     HEIGHT * 0.03,
+                     size=(WIDTH // 50),
+                     fill=get_color(game, "TEXT COLOR 1"),
+                     anchor='w')
     draw_text(f"{game.score}",
               prop_value_x,
               HEIGHT * 0.03,
@@ -45,12 +46,12 @@ def draw_gui(game: "Game") -> None:
               anchor='e')
 
     # Power Level
-    draw_text("Power Level:",
-              prop_name_x,
-              HEIGHT * 0.08,
-              size=(WIDTH // 50),
-              fill=get_color(game, "TEXT COLOR 1"),
-              anchor='w')
+    draw_cached_text("Power Level:",
+                     prop_name_x,
+                     HEIGHT * 0.08,
+                     size=(WIDTH // 50),
+                     fill=get_color(game, "TEXT COLOR 1"),
+                     anchor='w')
     draw_text(game.player.power_level.name,
               prop_value_x,
               HEIGHT * 0.08,
@@ -77,12 +78,12 @@ def draw_gui(game: "Game") -> None:
                     outline=get_color(game, "GUI OUTLINE 2"))
 
     # Game Level
-    draw_text("Current Level:",
-              prop_name_x,
-              HEIGHT * 0.73,
-              size=(WIDTH // 50),
-              fill=get_color(game, "TEXT COLOR 1"),
-              anchor='w')
+    draw_cached_text("Current Level:",
+                     prop_name_x,
+                     HEIGHT * 0.73,
+                     size=(WIDTH // 50),
+                     fill=get_color(game, "TEXT COLOR 1"),
+                     anchor='w')
     draw_text(game.game_level,
               prop_value_x,
               HEIGHT * 0.73,
@@ -98,12 +99,12 @@ def draw_gui(game: "Game") -> None:
               fill=get_color(game, "GUI COLOR 2"))
 
     # Hardness
-    draw_text("Current Hardness:",
-              prop_name_x,
-              HEIGHT * 0.8,
-              size=(WIDTH // 62),
-              fill=get_color(game, "TEXT COLOR 1"),
-              anchor='w')
+    draw_cached_text("Current Hardness:",
+                     prop_name_x,
+                     HEIGHT * 0.8,
+                     size=(WIDTH // 62),
+                     fill=get_color(game, "TEXT COLOR 1"),
+                     anchor='w')
     draw_text(f"{game.player.hardness}",
               prop_value_x,
               HEIGHT * 0.8,
@@ -112,12 +113,12 @@ def draw_gui(game: "Game") -> None:
               anchor='e')
 
     # Speed
-    draw_text("Current Speed:",
-              prop_name_x,
-              HEIGHT * 0.85,
-              size=(WIDTH // 62),
-              fill=get_color(game, "TEXT COLOR 1"),
-              anchor='w')
+    draw_cached_text("Current Speed:",
+                     prop_name_x,
+                     HEIGHT * 0.85,
+                     size=(WIDTH // 62),
+                     fill=get_color(game, "TEXT COLOR 1"),
+                     anchor='w')
     draw_text(f"{game.player.speed}",
               prop_value_x,
               HEIGHT * 0.85,
@@ -2,18 +2,22 @@
 Menus Graphics Module.
 """
 
-from textwrap import wrap
 from typing import TYPE_CHECKING
 
 from ..auxiliar import get_color
 from ..consts import PROFILES_CHANGER, PROFILES_DELETER, SPECIAL_CHARS
-from ..gamelib import draw_text
 from .gui import draw_button_hitbox
+from .text_layout import TextLayoutCache, draw_layout
 
 if TYPE_CHECKING:
     from ..state import Game
     from ..utils import Menu
 
+CENTERED_MESSAGES = frozenset(SPECIAL_CHARS + (PROFILES_CHANGER, PROFILES_DELETER))
+"""
+Button messages that are always drawn in the center of the button.
+"""
+
 
 def draw_menu_buttons(game: "Game", menu: "Menu", *, line_limit: int=21) -> None:
     """
@@ -23,6 +27,8 @@ def draw_menu_buttons(game: "Game", menu: "Menu", *, line_limit: int=21) -> None
     if menu.hidden:
         return
 
+    layouts = TextLayoutCache()
+
     for button in menu.buttons_on_screen:
 
         draw_button_hitbox(game, menu, button)
@@ -30,19 +36,16 @@ def draw_menu_buttons(game: "Game", menu: "Menu", *, line_limit: int=21) -> None
         if not button.msg:
             continue
 
-        button_message = button.msg[:]
         x_coord, y_coord = button.center
-        btn_anchor = menu.button_anchor
-        button_size = int((button.y2 - button.y1) // (2 if button_message in SPECIAL_CHARS else 4))
-
-        if len(button_message) > line_limit:
-            button_message = '\n'.join(wrap(button_message, line_limit))
-            button_size = int(button_size * 0.8)
-
-        if button_message in list(SPECIAL_CHARS) + [PROFILES_CHANGER, PROFILES_DELETER]:
-            btn_anchor = 'c'
+        is_centered = button.msg in CENTERED_MESSAGES
+        button_size = int((button.y2 - button.y1) // (2 if button.msg in SPECIAL_CHARS else 4))
+        layout = layouts.get_layout(button.msg,
+                                    button_size,
+                                    ('c' if is_centered else menu.button_anchor),
+                                    line_limit,
+                                    spaced=True)
 
-        else:
+        if not is_centered:
 
             if menu.button_anchor == 'c':
 
@@ -70,9 +73,7 @@ def draw_menu_buttons(game: "Game", menu: "Menu", *, line_limit: int=21) -> None
 
                     x_coord = button.x2 - width_extra
 
-        draw_text(' '.join(button_message.split('_')),
-                  x_coord, y_coord,
-                  size=button_size,
-                  fill=get_color(game, "TEXT_COLOR_1"),
-                  anchor=btn_anchor,
-                  justify='c')
+        draw_layout(layout,
+                    x_coord, y_coord,
+                    fill=get_color(game, "TEXT_COLOR_1"),
+                    justify='c')
@@ -5,8 +5,8 @@ Prompt Graphics Module.
 from typing import TYPE_CHECKING
 
 from ..auxiliar import get_color
+from ..backends import draw_rectangle, draw_text
 from ..consts import HEIGHT, WIDTH
-from ..gamelib import draw_rectangle, draw_text
 from .color_selector import (draw_color_table, draw_hue_bar,
                              draw_selector_buttons, draw_selector_details)
 
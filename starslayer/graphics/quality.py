@@ -0,0 +1,132 @@
+"""
+Quality Module. Turns off optional effects when frames take longer
+than their budget, and back on once there is time to spare.
+"""
+
+from typing import Tuple
+
+from ..auxiliar import Singleton
+from ..consts import (QUALITY_DOWN_FRAMES, QUALITY_DOWN_RATIO,
+                      QUALITY_SMOOTHING, QUALITY_STEPS, QUALITY_UP_FRAMES,
+                      QUALITY_UP_RATIO)
+from ..logger import GameLogger
+
+
+class QualityGovernor(metaclass=Singleton):
+    """
+    Keeps an average of how long the frames take to update and draw,
+    and chooses from it how many optional effects are turned off.
+
+    The painting done apart from the game, as the Tk window does, runs
+    alongside it, so a frame takes as long as the slowest of the two. A
+    frame during which others were dropped before being painted took at
+    least its whole budget, plus one for each of them.
+
+    The quality is lowered one tier after the average stays over the
+    budget for a while, and raised one tier after it stays well under it
+    for longer, so that it does not flicker between two tiers.
+    """
+
+    def __init__(self,
+                 *,
+                 budget: float=1 / 60,
+                 steps: Tuple[str, ...]=QUALITY_STEPS) -> None:
+        """
+        Initializes an instance of type 'QualityGovernor'.
+
+        'budget' is how many seconds a frame can take.
+        """
+
+        if budget <= 0:
+            raise ValueError("The frame budget must be positive.")
+
+        self.budget: float = budget
+        self.steps: Tuple[str, ...] = steps
+        self.tier: int = 0
+        self.average: float = 0.0
+        self.frames_over: int = 0
+        self.frames_under: int = 0
+        self.paint_time: float = 0.0
+        self.frames_dropped: int = 0
+
+
+    def allows(self, effect: str) -> bool:
+        """
+        Checks if an optional effect is drawn in the current tier.
+        """
+
+        return self.steps.index(effect) >= self.tier
+
+
+    def record(self,
+               tick_time: float,
+               draw_time: float,
+               *,
+               paint_time: float=0.0,
+               frames_dropped: int=0) -> None:
+        """
+        Adds how many seconds the last frame took to update and to
+        draw, and changes the tier if it is time to.
+
+        'paint_time' and 'frames_dropped' are the totals since the start,
+        as the backend counts them, of the painting done apart from the
+        game; only what they grew since the last frame is added.
+        """
+
+        frame_time = max(tick_time + draw_time, paint_time - self.paint_time)
+        dropped = frames_dropped - self.frames_dropped
+
+        if dropped > 0:
+            frame_time = max(frame_time, self.budget) + dropped * self.budget
+
+        self.paint_time = paint_time
+        self.frames_dropped = frames_dropped
+
+        self.average += QUALITY_SMOOTHING * (frame_time - self.average)
+
+        if self.average > self.budget * QUALITY_DOWN_RATIO:
+            self.frames_over += 1
+            self.frames_under = 0
+
+        elif self.average < self.budget * QUALITY_UP_RATIO:
+            self.frames_under += 1
+            self.frames_over = 0
+
+        else:
+            self.frames_over = 0
+            self.frames_under = 0
+
+        if self.frames_over >= QUALITY_DOWN_FRAMES and self.tier < len(self.steps):
+            self.set_tier(self.tier + 1)
+
+        elif self.frames_under >= QUALITY_UP_FRAMES and self.tier > 0:
+            self.set_tier(self.tier - 1)
+
+
+    def set_tier(self, tier: int) -> None:
+        """
+        Changes the quality tier, and starts counting the frames over
+        and under the budget anew.
+        """
+
+        if not 0 <= tier <= len(self.steps):
+            raise ValueError(f"The quality tier must be between 0 and {len(self.steps)}.")
+
+        GameLogger().info(f"Quality tier {self.tier} -> {tier}, at an average " +
+                          f"of {self.average * 1000:.1f} ms per frame.",
+                          subsystem="quality")
+
+        self.tier = tier
+        self.frames_over = 0
+        self.frames_under = 0
+
+
+    def describe(self) -> str:
+        """
+        Returns the current tier, as it is shown in the debug info.
+        """
+
+        turned_off = ', '.join(self.steps[:self.tier]) or "nothing"
+
+        return (f"{self.tier} / {len(self.steps)} ({self.average * 1000:.1f} ms, " +
+                f"off: {turned_off})")
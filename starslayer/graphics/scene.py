@@ -5,13 +5,16 @@ Scene Graphics Module.
 from typing import TYPE_CHECKING
 
 from ..auxiliar import get_color
+from ..backends import draw_line, draw_oval, draw_rectangle, draw_text
 from ..consts import (ACTIONS_PATH, BILBY_TANKA_INFO, GAME_VERSION, HEIGHT,
-                      SCORES_PATH, STAR_SLAYER_INFO, VIPER_DODGER_INFO, WIDTH)
-from ..files import action_description, list_action_keys, load_json
-from ..gamelib import draw_line, draw_oval, draw_rectangle, draw_text
+                      STAR_SLAYER_INFO, VIPER_DODGER_INFO, WIDTH)
+from ..files import action_description, list_action_keys
+from ..settings import get_settings
 from .menus import draw_menu_buttons
 from .prompt import draw_attribute_prompt, draw_key_changing_prompt
+from .quality import QualityGovernor
 from .sprites import draw_sprite
+from .text_layout import TextLayoutCache, draw_cached_text, draw_layout
 
 if TYPE_CHECKING:
     from ..scene import AnimationsDict
@@ -80,7 +83,11 @@ class SceneDrawer:
                 fill_name = label.properties.pop("fill_name", "TEXT_COLOR_1")
                 label.properties.update(fill=get_color(self.game, fill_name))
 
-            draw_text(label.text, label.x, label.y, **label.properties)
+            if label.immutable:
+                draw_cached_text(label.text, label.x, label.y, **label.properties)
+
+            else:
+                draw_text(label.text, label.x, label.y, **label.properties)
 
             label.properties.update(fill_name=fill_name)
 
@@ -136,17 +143,25 @@ class SceneDrawer:
 
     def draw_scene_rear_animations(self) -> None:
         """
-        Draws in the screen the current scene rear animations.
+        Draws in the screen the current scene rear animations,
+        unless they are turned off.
         """
 
+        if not QualityGovernor().allows("rear animations"):
+            return
+
         self.draw_scene_animations(self.game.current_scene.rear_animations)
 
 
     def draw_scene_front_animations(self) -> None:
         """
-        Draws in the screen the current scene front animations.
+        Draws in the screen the current scene front animations,
+        unless they are turned off.
         """
 
+        if not QualityGovernor().allows("front animations"):
+            return
+
         self.draw_scene_animations(self.game.current_scene.front_animations)
 
 
@@ -173,29 +188,29 @@ class SceneDrawer:
         aux_y = HEIGHT * 0.3
         size_aux = WIDTH // 60
 
-        draw_text(STAR_SLAYER_INFO,
-                  WIDTH * 0.17,
-                  aux_y,
-                  size=size_aux,
-                  anchor='n',
-                  justify="left",
-                  italic=True)
-
-        draw_text(BILBY_TANKA_INFO,
-                  WIDTH * 0.5,
-                  aux_y,
-                  size=size_aux,
-                  anchor='n',
-                  justify="left",
-                  italic=True)
-
-        draw_text(VIPER_DODGER_INFO,
-                  WIDTH * 0.85,
-                  aux_y,
-                  size=size_aux,
-                  anchor='n',
-                  justify="left",
-                  italic=True)
+        draw_cached_text(STAR_SLAYER_INFO,
+                         WIDTH * 0.17,
+                         aux_y,
+                         size=size_aux,
+                         anchor='n',
+                         justify="left",
+                         italic=True)
+
+        draw_cached_text(BILBY_TANKA_INFO,
+                         WIDTH * 0.5,
+                         aux_y,
+                         size=size_aux,
+                         anchor='n',
+                         justify="left",
+                         italic=True)
+
+        draw_cached_text(VIPER_DODGER_INFO,
+                         WIDTH * 0.85,
+                         aux_y,
+                         size=size_aux,
+                         anchor='n',
+                         justify="left",
+                         italic=True)
 
 
     def draw_scene_controls(self) -> None:
@@ -214,16 +229,17 @@ class SceneDrawer:
                        outline=get_color(self.game, "MENU_OUTLINE_1"),
                        fill=get_color(self.game, "MENU_COLOR_1"))
 
-        action_title = ' '.join(self.game.action_to_show.split('_'))
+        action_title = TextLayoutCache().get_layout(self.game.action_to_show,
+                                                    (WIDTH // 30),
+                                                    spaced=True)
 
-        draw_text(action_title,
-                  int(WIDTH * (5 / 8)),
-                  int(HEIGHT * 0.07),
-                  fill=get_color(self.game, "TEXT_COLOR_1"),
-                  size=(WIDTH // 30),
-                  justify='c')
+        draw_layout(action_title,
+                    int(WIDTH * (5 / 8)),
+                    int(HEIGHT * 0.07),
+                    fill=get_color(self.game, "TEXT_COLOR_1"),
+                    justify='c')
 
-        actions = load_json(ACTIONS_PATH)
+        actions = get_settings(ACTIONS_PATH).data
         keys_assigned = list_action_keys(self.game.action_to_show, actions)
         description = action_description(self.game.action_to_show, actions)
 
@@ -241,21 +257,22 @@ class SceneDrawer:
                       italic=True)
 
         if not keys_assigned:
-            draw_text("Action is currently not binded to any key",
-                      (WIDTH * (5 / 8)),
-                      (HEIGHT * 0.6),
-                      fill=get_color(self.game, "TEXT_COLOR_1"),
-                      size=(WIDTH // 34),
-                      justify='c')
+            draw_cached_text("Action is currently not binded to any key",
+                             (WIDTH * (5 / 8)),
+                             (HEIGHT * 0.6),
+                             fill=get_color(self.game, "TEXT_COLOR_1"),
+                             size=(WIDTH // 34),
+                             justify='c')
 
         else:
-            draw_text("Action is currently bound to the " +
-                      f"key{'s' if len(keys_assigned) > 1 else ''}",
-                      (WIDTH * (5 / 8)),
-                      (HEIGHT * 0.6),
-                      fill=get_color(self.game, "TEXT_COLOR_1"),
-                      size=(WIDTH // 34),
-                      justify='c')
+            draw_cached_text(("Action is currently bound to the keys"
+                              if len(keys_assigned) > 1
+                              else "Action is currently bound to the key"),
+                             (WIDTH * (5 / 8)),
+                             (HEIGHT * 0.6),
+                             fill=get_color(self.game, "TEXT_COLOR_1"),
+                             size=(WIDTH // 34),
+                             justify='c')
             draw_text(" - ".join(keys_assigned),
                       int(WIDTH * (5 / 8)),
                       (HEIGHT * 0.7),
@@ -360,10 +377,7 @@ class SceneDrawer:
         Draws the scoreboard of the game.
         """
 
-        scores = load_json(SCORES_PATH).get("scores", None)
-
-        if scores is None:
-            return
+        scores = self.game.scoreboard.scores()
 
         area_y1 = HEIGHT * 0.2
         return_aux = HEIGHT * 0.04
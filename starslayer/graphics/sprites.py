@@ -2,14 +2,197 @@
 Sprites Graphics Module.
 """
 
-from typing import TYPE_CHECKING, Optional
+from math import ceil
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-from ..gamelib import draw_arc, draw_rectangle
+from ..auxiliar import Singleton
+from ..backends import draw_arc, draw_rectangle
+from ..consts import SPRITE_LOD_FACTORS, SPRITE_LOD_MIN_TEXEL, SPRITE_TEXELS_BUDGET
+from ..sprites import on_frames_loaded
 
 if TYPE_CHECKING:
-    from ..sprites import Sprite
+    from ..color import Color, ColorsDict
+    from ..sprites import FramesList, Sprite
     from ..state import Game
 
+Texel = Tuple[int, int, str] # (column, row, #rrggbb)
+
+
+class SpriteMip:
+    """
+    A level of detail of a sprite frame, with each of its
+    pixels being the average of a block of the original ones.
+    """
+
+    def __init__(self, frame: "ColorsDict", width: int, height: int, factor: int) -> None:
+        """
+        Initializes an instance of type 'SpriteMip'.
+
+        A block is drawn only if at least half of its pixels are.
+        """
+
+        self.factor: int = factor
+        self.width: int = ceil(width / factor)
+        self.height: int = ceil(height / factor)
+        self.texels: List[Texel] = []
+
+        for i in range(self.width):
+            for j in range(self.height):
+
+                colors = [frame[(x, y)]
+                          for x in range(i * factor, min((i + 1) * factor, width))
+                          for y in range(j * factor, min((j + 1) * factor, height))]
+                opaque = [color for color in colors if color]
+
+                if len(opaque) * 2 < len(colors):
+                    continue
+
+                self.texels.append((i, j, average_hex(opaque)))
+
+
+def average_hex(colors: List["Color"]) -> str:
+    """
+    Returns the average of some colors, in the #rrggbb format.
+    """
+
+    how_many = len(colors)
+    red = round(sum(color.red for color in colors) / how_many)
+    green = round(sum(color.green for color in colors) / how_many)
+    blue = round(sum(color.blue for color in colors) / how_many)
+
+    return f"#{red:02x}{green:02x}{blue:02x}"
+
+
+class SpriteLOD(metaclass=Singleton):
+    """
+    Levels of detail of the sprites, and how many of their pixels
+    can still be drawn in the current frame.
+
+    The levels are generated as soon as a sprite folder is read. Each
+    sprite is drawn in full detail while the budget of the frame allows
+    it. Once it does not, the finest level whose pixels are not too small
+    on screen and that fits is used, and at last a single solid shape.
+    """
+
+    def __init__(self,
+                 *,
+                 factors: Tuple[int, ...]=SPRITE_LOD_FACTORS,
+                 min_texel: float=SPRITE_LOD_MIN_TEXEL,
+                 budget: int=SPRITE_TEXELS_BUDGET) -> None:
+        """
+        Initializes an instance of type 'SpriteLOD'.
+        """
+
+        self.factors: Tuple[int, ...] = factors
+        self.min_texel: float = min_texel
+        self.budget: int = budget
+
+        self.mips: Dict[str, List[List[SpriteMip]]] = {}
+        self.solid_colors: Dict[str, List[Optional[str]]] = {}
+
+        self.frame_budget: int = budget
+        self.drawn_texels: int = 0
+        self.degraded: int = 0
+
+
+    def begin_frame(self, share: float=1.0) -> None:
+        """
+        Restores the budget for a new frame, or only a 'share' of it.
+        """
+
+        self.frame_budget = int(self.budget * share)
+        self.drawn_texels = 0
+        self.degraded = 0
+
+
+    @property
+    def remaining(self) -> int:
+        """
+        Returns how many sprite pixels can still be drawn in this frame.
+        """
+
+        return self.frame_budget - self.drawn_texels
+
+
+    def generate(self, path: str, width: int, height: int, frames: "FramesList") -> None:
+        """
+        Generates the levels of detail of every frame of a sprite folder.
+        """
+
+        self.mips[path] = [[SpriteMip(frame, width, height, factor)
+                            for factor in self.factors]
+                           for frame in frames]
+        self.solid_colors[path] = [(average_hex([color for color in frame.values() if color])
+                                    if any(frame.values())
+                                    else None)
+                                   for frame in frames]
+
+
+    def _generate(self, sprite: "Sprite") -> None:
+        """
+        Generates the levels of detail of a sprite whose folder
+        was read before they could be.
+        """
+
+        self.generate(sprite.path, sprite.width, sprite.height, sprite.frames)
+
+
+    def frame_mips(self, sprite: "Sprite") -> List[SpriteMip]:
+        """
+        Returns the levels of detail of the current frame of a
+        sprite, from the finest to the coarsest.
+        """
+
+        if sprite.path not in self.mips:
+            self._generate(sprite)
+
+        return self.mips[sprite.path][sprite.current_frame_index]
+
+
+    def solid_color(self, sprite: "Sprite") -> Optional[str]:
+        """
+        Returns the average color of the current frame of a sprite,
+        or 'None' if it is fully transparent.
+        """
+
+        if sprite.path not in self.solid_colors:
+            self._generate(sprite)
+
+        return self.solid_colors[sprite.path][sprite.current_frame_index]
+
+
+    def pick(self, sprite: "Sprite", screen_width: float, *, use_lod: bool=True) -> Optional[SpriteMip]:
+        """
+        Chooses the level of detail to draw a sprite with, and charges
+        its pixels to the budget. 'None' means a single solid shape.
+
+        If 'use_lod' is 'False', the sprite is always drawn in full detail.
+        """
+
+        mips = self.frame_mips(sprite)
+
+        if not use_lod or len(mips[0].texels) <= self.remaining:
+            self.drawn_texels += len(mips[0].texels)
+            return mips[0]
+
+        for mip in mips:
+            if mip is not mips[-1] and screen_width * mip.factor / sprite.width < self.min_texel:
+                continue
+
+            if len(mip.texels) <= self.remaining:
+                if mip is not mips[0]:
+                    self.degraded += 1
+
+                self.drawn_texels += len(mip.texels)
+                return mip
+
+        self.degraded += 1
+        self.drawn_texels += 1
+        return None
+
+
+on_frames_loaded(lambda *folder: SpriteLOD().generate(*folder))
+
 
 # pylint: disable=invalid-name
 def draw_sprite_pixels(sprite: "Sprite",
@@ -19,30 +202,33 @@ def draw_sprite_pixels(sprite: "Sprite",
                        y2: float,
                        *,
                        to_next: bool=True,
-                       circular: bool=True) -> None:
+                       circular: bool=True,
+                       use_lod: bool=True) -> None:
     """
-    Draws a definite sprite on the screen.
+    Draws a definite sprite on the screen, with the level
+    of detail that fits it best.
     """
 
-    width = sprite.width
-    height = sprite.height
-    x_increment = (x2 - x1) / width
-    y_increment = (y2 - y1) / height
-    cur_frame = sprite.current_frame
+    mip = SpriteLOD().pick(sprite, x2 - x1, use_lod=use_lod)
 
-    for i in range(width):
-        for j in range(height):
+    if mip is None:
+        solid_color = SpriteLOD().solid_color(sprite)
 
-            frame_color = cur_frame[(i, j)]
-            if not frame_color:
-                continue
+        if solid_color:
+            draw_rectangle(x1, y1, x2, y2, outline='', fill=solid_color)
+
+    else:
+        x_increment = (x2 - x1) * mip.factor / sprite.width
+        y_increment = (y2 - y1) * mip.factor / sprite.height
+
+        for i, j, hex_color in mip.texels:
 
             draw_rectangle(x1 + (i * x_increment),
                            y1 + (j * y_increment),
-                           x1 + ((i + 1) * x_increment),
-                           y1 + ((j + 1) * y_increment),
+                           min(x2, x1 + ((i + 1) * x_increment)),
+                           min(y2, y1 + ((j + 1) * y_increment)),
                            outline='',
-                           fill=frame_color.hex)
+                           fill=hex_color)
 
     if to_next:
         sprite.next_frame(circular)
@@ -60,7 +246,8 @@ def draw_sprite(sprite: Optional["Sprite"],
                 *,
                 to_next: bool=True,
                 circular: bool=True,
-                sprite_type: str="BOX") -> None:
+                sprite_type: str="BOX",
+                use_lod: bool=True) -> None:
     """
     Draws a sprite in the given coordinates.
     """
@@ -134,4 +321,5 @@ def draw_sprite(sprite: Optional["Sprite"],
 
     draw_sprite_pixels(sprite, x1, y1, x2, y2,
                        to_next=to_next,
-                       circular=circular)
+                       circular=circular,
+                       use_lod=use_lod)
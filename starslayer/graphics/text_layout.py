@@ -0,0 +1,181 @@
+"""
+Text Layout Module. Keeps the already formatted
+text so it is not processed again each frame.
+"""
+
+from textwrap import wrap
+from typing import Dict, Optional, Tuple
+
+from ..auxiliar import Singleton
+from ..backends import draw_text
+from ..consts import TEXT_LAYOUT_CACHE_SIZE
+
+LayoutKey = Tuple[str, int, str, Optional[int], Optional[str], bool, bool, bool]
+
+
+class TextLayout:
+    """
+    A text already formatted, ready to be drawn.
+    """
+
+    def __init__(self,
+                 text: str,
+                 size: int,
+                 anchor: str,
+                 *,
+                 font: Optional[str]=None,
+                 bold: bool=False,
+                 italic: bool=False) -> None:
+        """
+        Initializes an instance of type 'TextLayout'.
+        """
+
+        self.text: str = text
+        self.size: int = size
+        self.anchor: str = anchor
+        self.font: Dict = dict(font=font, size=size, bold=bold, italic=italic)
+
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the layout.
+        """
+
+        return f"TextLayout(text={self.text!r}, size={self.size}, anchor={self.anchor!r})"
+
+
+class TextLayoutCache(metaclass=Singleton):
+    """
+    Cache of text layouts, keyed by (text, size, anchor, wrap width).
+
+    Immutable layouts are kept forever, while the rest are discarded,
+    oldest first, once there are too many of them.
+    """
+
+    def __init__(self, max_layouts: int=TEXT_LAYOUT_CACHE_SIZE) -> None:
+        """
+        Initializes an instance of type 'TextLayoutCache'.
+        """
+
+        self.max_layouts: int = max_layouts
+        self.immutable_layouts: Dict[LayoutKey, TextLayout] = {}
+        self.layouts: Dict[LayoutKey, TextLayout] = {}
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+
+    def __len__(self) -> int:
+        """
+        Returns how many layouts are stored.
+        """
+
+        return len(self.immutable_layouts) + len(self.layouts)
+
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the counters of the cache.
+        """
+
+        return {"hits": self.hits,
+                "misses": self.misses,
+                "layouts": len(self)}
+
+
+    # pylint: disable=too-many-arguments
+    def get_layout(self,
+                   text: str,
+                   size: int,
+                   anchor: str='c',
+                   wrap_width: Optional[int]=None,
+                   *,
+                   font: Optional[str]=None,
+                   bold: bool=False,
+                   italic: bool=False,
+                   spaced: bool=False,
+                   immutable: bool=False) -> TextLayout:
+        """
+        Returns the layout of a text, generating it if necessary.
+
+        If 'wrap_width' is given and the text is longer than it, the text is
+        wrapped into lines of that width and the size is reduced.
+        If 'spaced' is 'True', underscores are shown as spaces.
+        """
+
+        key = (text, size, anchor, wrap_width, font, bold, italic, spaced)
+        layout = self.immutable_layouts.get(key) or self.layouts.get(key)
+
+        if layout is not None:
+            self.hits += 1
+            return layout
+
+        self.misses += 1
+
+        if wrap_width is not None and len(text) > wrap_width:
+            text = '\n'.join(wrap(text, wrap_width))
+            size = int(size * 0.8)
+
+        if spaced:
+            text = ' '.join(text.split('_'))
+
+        layout = TextLayout(text, size, anchor, font=font, bold=bold, italic=italic)
+
+        if immutable:
+            self.immutable_layouts[key] = layout
+
+        else:
+            if len(self.layouts) >= self.max_layouts:
+                del self.layouts[next(iter(self.layouts))]
+
+            self.layouts[key] = layout
+
+        return layout
+
+
+    def clear(self, *, keep_immutable: bool=True) -> None:
+        """
+        Discards the stored layouts and resets the counters.
+        """
+
+        self.layouts.clear()
+        if not keep_immutable:
+            self.immutable_layouts.clear()
+
+        self.hits = 0
+        self.misses = 0
+
+
+def draw_layout(layout: TextLayout, x: float, y: float, **kwargs) -> None: # pylint: disable=invalid-name
+    """
+    Draws a text layout in the given coordinates.
+    """
+
+    draw_text(layout.text, x, y, anchor=layout.anchor, **layout.font, **kwargs)
+
+
+def draw_cached_text(text: str,
+                     x: float, # pylint: disable=invalid-name
+                     y: float, # pylint: disable=invalid-name
+                     *,
+                     size: int=12,
+                     anchor: str='c',
+                     font: Optional[str]=None,
+                     bold: bool=False,
+                     italic: bool=False,
+                     immutable: bool=True,
+                     **kwargs) -> None:
+    """
+    Draws a text through the layout cache.
+    By default, the text is considered to be immutable.
+    """
+
+    draw_layout(TextLayoutCache().get_layout(text,
+                                             size,
+                                             anchor,
+                                             font=font,
+                                             bold=bold,
+                                             italic=italic,
+                                             immutable=immutable),
+                x, y, **kwargs)
@@ -5,3 +5,4 @@ JSON Files Package.
 from .actions import *
 from .profiles import *
 from .scores import *
+from .spawns import *
@@ -0,0 +1,3 @@
+"""
+Spawns JSON Package.
+"""
@@ -4,30 +4,49 @@ from which is created the objects that logs events
 of the program.
 """
 
-from logging import INFO, FileHandler, Formatter, StreamHandler, getLogger
-from typing import TYPE_CHECKING
+from atexit import register as at_exit
+from logging import DEBUG, INFO, Formatter, Handler, StreamHandler, getLogger
+from logging.handlers import (QueueHandler, QueueListener, RotatingFileHandler,
+                              TimedRotatingFileHandler)
+from os import register_at_fork
+from queue import SimpleQueue
+from typing import TYPE_CHECKING, Dict, Optional
 
 from ..auxiliar import Singleton
-from ..consts import LOG_PATH
+from ..consts import LOG_BACKUP_COUNT, LOG_MAX_BYTES, LOG_PATH, LOG_SUBSYSTEM_LEVELS
 
 if TYPE_CHECKING:
     from logging import Logger
 
+LevelsDict = Dict[str, int | str]
+
 
 class GameLogger(metaclass=Singleton):
     """
     Class that registers game events.
     Made with singleton pattern.
+
+    Messages are put in a queue, and written to the file and the
+    console by another thread, so logging never blocks the game.
     """
 
+    # pylint: disable=too-many-arguments
     def __init__(self,
                  *,
                  log_name: str="TheStarThatSlays",
                  log_level: int=INFO,
                  fmt: str="[ %(asctime)s ] [ %(levelname)s ] %(message)s",
-                 date_fmt: str="%d-%m-%Y %I:%M:%S %p") -> None:
+                 date_fmt: str="%d-%m-%Y %I:%M:%S %p",
+                 max_bytes: int=LOG_MAX_BYTES,
+                 rotate_when: Optional[str]=None,
+                 backup_count: int=LOG_BACKUP_COUNT,
+                 subsystem_levels: Optional[LevelsDict]=None) -> None:
         """
         Creates an instance of 'GameLogger'.
+
+        The log file is rotated once it reaches 'max_bytes' or, if
+        'rotate_when' is given (as in 'midnight' or 'H'), periodically.
+        'subsystem_levels' overrides the level of some subsystems.
         """
 
         super().__init__()
@@ -37,14 +56,115 @@ class GameLogger(metaclass=Singleton):
 
         self._formatter = Formatter(fmt=self.format, datefmt=self.date_fmt)
 
-        self.file_handler = FileHandler(filename=LOG_PATH, encoding="utf-8")
+        self.file_handler: Handler = (TimedRotatingFileHandler(filename=LOG_PATH,
+                                                               when=rotate_when,
+                                                               backupCount=backup_count,
+                                                               encoding="utf-8",
+                                                               delay=True)
+                                      if rotate_when is not None
+                                      else RotatingFileHandler(filename=LOG_PATH,
+                                                               maxBytes=max_bytes,
+                                                               backupCount=backup_count,
+                                                               encoding="utf-8",
+                                                               delay=True))
         self.console_handler = StreamHandler()
         self.update_formatter()
 
+        self.queue: SimpleQueue = SimpleQueue()
+        self.queue_handler: QueueHandler = QueueHandler(self.queue)
+        self.listener: QueueListener = self._new_listener()
+
         self.logger: "Logger" = getLogger(log_name)
         self.logger.setLevel(log_level)
-        self.logger.addHandler(self.file_handler)
-        self.logger.addHandler(self.console_handler)
+        self.logger.addHandler(self.queue_handler)
+
+        for subsystem, level in (LOG_SUBSYSTEM_LEVELS | (subsystem_levels or {})).items():
+            self.set_level(level, subsystem=subsystem)
+
+        self.listener.start()
+        self._listening: bool = True
+        at_exit(self.stop)
+        register_at_fork(after_in_child=self._restart_listener)
+
+
+    def _new_listener(self) -> QueueListener:
+        """
+        Creates the thread that writes the queued messages.
+        """
+
+        return QueueListener(self.queue,
+                             self.file_handler,
+                             self.console_handler,
+                             respect_handler_level=True)
+
+
+    def _restart_listener(self) -> None:
+        """
+        Starts the writing thread again in a forked process, with a new
+        queue, since threads do not survive forks. The log file is opened
+        again as well, as the parent may have been writing to it.
+        If the thread was already stopped, messages are still
+        written right away.
+        """
+
+        self.file_handler.stream = None
+
+        if not self._listening:
+            return
+
+        self.queue = SimpleQueue()
+        self.queue_handler.queue = self.queue
+        self.listener = self._new_listener()
+        self.listener.start()
+        self._listening = True
+
+
+    def stop(self) -> None:
+        """
+        Writes the messages still queued and stops the writing thread.
+        Messages logged after that are written right away.
+        """
+
+        if self._listening:
+            self.listener.stop()
+            self._listening = False
+            self.logger.removeHandler(self.queue_handler)
+            self.logger.addHandler(self.file_handler)
+            self.logger.addHandler(self.console_handler)
+
+
+    def subsystem(self, name: str) -> "Logger":
+        """
+        Returns the logger of a subsystem of the game, whose
+        level can be set apart from the others.
+        """
+
+        return self.logger.getChild(name)
+
+
+    def set_level(self, level: int | str, *, subsystem: Optional[str]=None) -> None:
+        """
+        Sets the level of the game logger, or of one of its subsystems.
+        """
+
+        self._logger_for(subsystem).setLevel(level)
+
+
+    def is_enabled(self, level: int=DEBUG, *, subsystem: Optional[str]=None) -> bool:
+        """
+        Checks if messages of 'level' would be logged, so that hot paths can
+        skip building a message nobody is going to read.
+        """
+
+        return self._logger_for(subsystem).isEnabledFor(level)
+
+
+    def _logger_for(self, subsystem: Optional[str]) -> "Logger":
+        """
+        Returns the logger of a subsystem, or the game one if there is none.
+        """
+
+        return (self.subsystem(subsystem) if subsystem else self.logger)
 
 
     def update_formatter(self) -> None:
@@ -106,44 +226,64 @@ class GameLogger(metaclass=Singleton):
         self.formatter = Formatter(fmt=self.format, datefmt=self.date_fmt)
 
 
-    def debug(self, message: str, *args, **kwargs) -> None:
+    def debug(self,
+              message: str,
+              *args,
+              subsystem: Optional[str]=None,
+              **kwargs) -> None:
         """
         Registers an event of level DEBUG.
         """
 
-        self.logger.debug(message, *args, **kwargs)
+        self._logger_for(subsystem).debug(message, *args, **kwargs)
 
 
-    def info(self, message: str, *args, **kwargs) -> None:
+    def info(self,
+             message: str,
+             *args,
+             subsystem: Optional[str]=None,
+             **kwargs) -> None:
         """
         Registers an event of level INFO.
         """
 
-        self.logger.info(message, *args, **kwargs)
+        self._logger_for(subsystem).info(message, *args, **kwargs)
 
 
-    def warning(self, message: str, *args, **kwargs) -> None:
+    def warning(self,
+                message: str,
+                *args,
+                subsystem: Optional[str]=None,
+                **kwargs) -> None:
         """
         Registers an event of level WARNING.
         """
 
-        self.logger.warning(message, *args, **kwargs)
+        self._logger_for(subsystem).warning(message, *args, **kwargs)
 
 
-    def error(self, message: str, *args, **kwargs) -> None:
+    def error(self,
+              message: str,
+              *args,
+              subsystem: Optional[str]=None,
+              **kwargs) -> None:
         """
         Registers an event of level ERROR.
         """
 
-        self.logger.error(message, *args, **kwargs)
+        self._logger_for(subsystem).error(message, *args, **kwargs)
 
 
-    def critical(self, message: str, *args, **kwargs) -> None:
+    def critical(self,
+                 message: str,
+                 *args,
+                 subsystem: Optional[str]=None,
+                 **kwargs) -> None:
         """
         Registers an event of level CRITICAL.
         """
 
-        self.logger.critical(message, *args, **kwargs)
+        self._logger_for(subsystem).critical(message, *args, **kwargs)
 
 
     def exception(self, msg, *args, exc_info=True, **kwargs) -> None:
@@ -151,4 +291,4 @@ class GameLogger(metaclass=Singleton):
         Registers an exception.
         """
 
-        self.logger.exception(msg, *args, exc_info, **kwargs)
+        self.logger.exception(msg, *args, exc_info=exc_info, **kwargs)
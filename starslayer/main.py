@@ -2,59 +2,110 @@
 Main Module. It encases all the other modules to start the game.
 """
 
-from .consts import GAME_ICON, GAME_VERSION, HEIGHT, WIDTH
-from .gamelib import (draw_begin, draw_end, get_events, icon, init, loop,
-                      resize, title)
-from .graphics import SceneDrawer, draw_screen
+from os import getenv
+from time import perf_counter
+from typing import Optional
+
+from .backends import (draw_begin, draw_end, get_events, icon, init, loop,
+                       paint_stats, resize, title)
+from .consts import (GAME_ICON, GAME_VERSION, HEIGHT, RECORD_DRAWS_ENV,
+                     RECORD_INPUT_ENV, WIDTH)
+from .drawlog import DrawRecorder
+from .graphics import PaletteImages, QualityGovernor, SceneDrawer, draw_screen
+from .logger import GameLogger
+from .replay import InputRecorder
+from .settings import flush_settings
 from .state import Game
 
 
-def main() -> int:
+def main(record_path: Optional[str]=None, draws_path: Optional[str]=None) -> int:
     """
     Main function. Initializes the game.
+
+    If `record_path` is set (or the environment variable `RECORD_INPUT_ENV`),
+    the input of the run is recorded there so it can be replayed later.
+    Likewise, if `draws_path` is set (or `RECORD_DRAWS_ENV`), every draw
+    command is recorded there.
     """
 
     title(f"Star Slayer v{GAME_VERSION}")
     resize(WIDTH, HEIGHT)
     icon(GAME_ICON)
 
+    record_path = record_path or getenv(RECORD_INPUT_ENV)
+    recorder = (InputRecorder(record_path) if record_path else None)
+
+    draws_path = draws_path or getenv(RECORD_DRAWS_ENV)
+    draw_recorder = (DrawRecorder(draws_path, width=WIDTH, height=HEIGHT)
+                     if draws_path else None)
+
+    if draw_recorder:
+        draw_recorder.start()
+
     game = Game()
     scene_drawer = SceneDrawer(game)
+    governor = QualityGovernor(budget=1 / game.time_flow)
 
     is_first_lap = True # So that some actions take place in the next iteration of the loop
     cursor_coords = {'x': None, 'y': None}
 
-    while loop(fps=game.time_flow):
+    try:
+        while loop(fps=game.time_flow):
 
-        if game.exit:
-            break
+            if game.exit:
+                break
 
-        draw_begin()
-        cursor_x, cursor_y = cursor_coords['x'], cursor_coords['y']
-        draw_screen(game, cursor_x, cursor_y, scene_drawer)
-        draw_end()
+            draw_start = perf_counter()
+            draw_begin()
+            cursor_x, cursor_y = cursor_coords['x'], cursor_coords['y']
+            draw_screen(game, cursor_x, cursor_y, scene_drawer)
+            draw_end()
+            tick_start = perf_counter()
 
-        for event in get_events():
+            for event in get_events():
 
-            if not event:
-                break
+                if not event:
+                    break
+
+                if recorder:
+                    recorder.record_event(event)
+
+                game.classify_events(event, cursor_coords)
+
+            game.process_events()
+
+            if game.is_on_prompt:
+
+                if is_first_lap:
+                    is_first_lap = False
 
-            game.classify_events(event, cursor_coords)
+                else:
+                    is_first_lap = True
+                    game.prompt()
 
-        game.process_events()
+            # print(game.typing_cooldown.current_time)
+            # print(game.combinations)
+            game.advance_game()
+            paint_time, frames_dropped = paint_stats()
+            governor.record(perf_counter() - tick_start,
+                            tick_start - draw_start,
+                            paint_time=paint_time,
+                            frames_dropped=frames_dropped)
 
-        if game.is_on_prompt:
+            if recorder:
+                recorder.end_tick()
 
-            if is_first_lap:
-                is_first_lap = False
+    finally:
+        if recorder:
+            recorder.close()
 
-            else:
-                is_first_lap = True
-                game.prompt()
+        if draw_recorder:
+            draw_recorder.close()
 
-        # print(game.typing_cooldown.current_time)
-        # print(game.combinations)
-        game.advance_game()
+        flush_settings()
+        game.scoreboard.flush()
+        PaletteImages().remove()
+        GameLogger().stop() # Last, so that what was logged while closing is written
 
     return 0
 
@@ -0,0 +1,7 @@
+"""
+Replay Package.
+"""
+
+from .recorded_event import *
+from .recorder import *
+from .replayer import *
@@ -0,0 +1,84 @@
+"""
+Recorded Event Module. Stores the input events in a way
+that they can be written to a log and read back later.
+"""
+
+from typing import TYPE_CHECKING, List, Optional
+
+from ..gamelib import EventType
+
+if TYPE_CHECKING:
+    from ..gamelib import Event
+
+EventValues = List[Optional[str | int]]
+
+
+# pylint: disable=invalid-name
+class RecordedEvent:
+    """
+    A stand-in for `gamelib.Event`, with only the attributes the
+    game actually reads from it.
+    """
+
+    @classmethod
+    def from_event(cls, event: "Event") -> "RecordedEvent":
+        """
+        Creates the recorded event from a live one.
+        """
+
+        match event.type:
+
+            case EventType.KeyPress | EventType.KeyRelease:
+                return cls(event.type, key=event.key)
+
+            case EventType.ButtonPress | EventType.ButtonRelease:
+                return cls(event.type, x=event.x, y=event.y, mouse_button=event.mouse_button)
+
+            case _:
+                return cls(event.type, x=event.x, y=event.y)
+
+
+    @classmethod
+    def from_values(cls, values: EventValues) -> "RecordedEvent":
+        """
+        Creates the recorded event from the values stored in a log.
+        """
+
+        event_type, key, x, y, mouse_button = values
+
+        return cls(EventType(event_type), key=key, x=x, y=y, mouse_button=mouse_button)
+
+
+    def __init__(self,
+                 event_type: EventType,
+                 *,
+                 key: Optional[str]=None,
+                 x: Optional[int]=None,
+                 y: Optional[int]=None,
+                 mouse_button: Optional[int]=None) -> None:
+        """
+        Initializes an instance of type 'RecordedEvent'.
+        """
+
+        self.type: EventType = event_type
+        self.key: Optional[str] = key
+        self.x: Optional[int] = x
+        self.y: Optional[int] = y
+        self.mouse_button: Optional[int] = mouse_button
+
+
+    def __repr__(self) -> str:
+        """
+        Returns a string with class information so it can be parsed 'as is' later.
+        """
+
+        return f"RecordedEvent({self.values})"
+
+
+    @property
+    def values(self) -> EventValues:
+        """
+        Returns the values to store in a log, in a compact form.
+        """
+
+        return [self.type.value, self.key, self.x, self.y, self.mouse_button]
@@ -0,0 +1,111 @@
+"""
+Input Recorder Module. Writes the input of a run, tick by tick,
+so that it can be replayed afterwards.
+"""
+
+from json import dumps
+from typing import TYPE_CHECKING, List, Optional
+
+from ..auxiliar import seed_rng
+from .recorded_event import RecordedEvent
+
+if TYPE_CHECKING:
+    from ..gamelib import Event
+
+REPLAY_LOG_VERSION = 1
+"""
+The version of the input log format.
+"""
+
+
+class InputRecorder:
+    """
+    Records the input events of every tick into a JSONL log.
+
+    The first line of the log holds the format version and the seed
+    of the simulation RNG. Then, there is one line per tick that had
+    any events, and a last line with how many ticks were recorded.
+    """
+
+    def __init__(self, log_path: str, *, seed: Optional[int]=None) -> None:
+        """
+        Initializes an instance of type 'InputRecorder'.
+
+        It seeds the simulation RNG, so it should be created before the
+        run starts. If `seed` is not provided, a new one is drawn.
+        """
+
+        self.log_path: str = log_path
+        self.seed: int = seed_rng(seed)
+        self.current_tick: int = 0
+        self._tick_events: List[RecordedEvent] = []
+        self._file = open(log_path, mode='w', encoding="utf-8") # pylint: disable=consider-using-with
+
+        self._write_line({"version": REPLAY_LOG_VERSION, "seed": self.seed})
+
+
+    def __enter__(self) -> "InputRecorder":
+        """
+        Returns the recorder itself to be used in a `with` block.
+        """
+
+        return self
+
+
+    def __exit__(self, *_exc_info) -> None:
+        """
+        Closes the log when leaving the `with` block.
+        """
+
+        self.close()
+
+
+    @property
+    def closed(self) -> bool:
+        """
+        Checks if the log is already closed.
+        """
+
+        return self._file.closed
+
+
+    def _write_line(self, line_dict: dict) -> None:
+        """
+        Writes a single line into the log.
+        """
+
+        self._file.write(dumps(line_dict, separators=(',', ':')) + '\n')
+
+
+    def record_event(self, event: "Event") -> None:
+        """
+        Stores an event of the current tick.
+        """
+
+        self._tick_events.append(RecordedEvent.from_event(event))
+
+
+    def end_tick(self) -> None:
+        """
+        Writes the events of the current tick, if any, and
+        moves on to the next one.
+        """
+
+        if self._tick_events:
+            self._write_line({"tick": self.current_tick,
+                              "events": [event.values for event in self._tick_events]})
+            self._tick_events.clear()
+
+        self.current_tick += 1
+
+
+    def close(self) -> None:
+        """
+        Writes how many ticks were recorded and closes the log.
+        """
+
+        if self.closed:
+            return
+
+        self._write_line({"end": self.current_tick})
+        self._file.close()
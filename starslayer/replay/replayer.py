@@ -0,0 +1,103 @@
+"""
+Input Replayer Module. Feeds a recorded input log back into
+a game, reproducing the original run.
+"""
+
+from json import loads
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from ..auxiliar import seed_rng
+from ..state import Game
+from .recorded_event import RecordedEvent
+from .recorder import REPLAY_LOG_VERSION
+
+TicksDict = Dict[int, List[RecordedEvent]]
+
+
+class InputReplayer:
+    """
+    Replays an input log written by an `InputRecorder`.
+    """
+
+    def __init__(self, log_path: str) -> None:
+        """
+        Initializes an instance of type 'InputReplayer'.
+        """
+
+        self.log_path: str = log_path
+        self.seed: int = 0
+        self.total_ticks: int = 0
+        self.ticks: TicksDict = {}
+        self.tick_times: List[float] = []
+
+        self.load_log()
+
+
+    def load_log(self) -> None:
+        """
+        Reads the input log.
+        """
+
+        with open(self.log_path, mode='r', encoding="utf-8") as file:
+
+            header = loads(file.readline())
+
+            if header.get("version") != REPLAY_LOG_VERSION:
+                raise ValueError(f"'{self.log_path}' has version {header.get('version')}, " +
+                                 f"but only version {REPLAY_LOG_VERSION} is supported.")
+
+            self.seed = header["seed"]
+
+            for line in file:
+                if not line.strip():
+                    continue
+
+                line_dict = loads(line)
+
+                if "end" in line_dict:
+                    self.total_ticks = line_dict["end"]
+                    continue
+
+                self.ticks[line_dict["tick"]] = [RecordedEvent.from_values(values)
+                                                 for values in line_dict["events"]]
+
+        if not self.total_ticks and self.ticks:
+            # The run did not finish cleanly, so replay up to the last known tick
+            self.total_ticks = max(self.ticks) + 1
+
+
+    def replay(self, game: Optional[Game]=None) -> List[float]:
+        """
+        Replays the log over `game`, or over a new one if not provided.
+
+        The simulation RNG is seeded again and the audio is turned off,
+        while the prompts (which need a window) are skipped. It returns
+        how much time, in seconds, each tick took.
+        """
+
+        seed_rng(self.seed)
+
+        if game is None:
+            game = Game()
+
+        game.has_audio = False
+        cursor_coords = {'x': None, 'y': None}
+        self.tick_times = []
+
+        for tick in range(self.total_ticks):
+
+            if game.exit:
+                break
+
+            tick_start = perf_counter()
+
+            for event in self.ticks.get(tick, []):
+                game.classify_events(event, cursor_coords)
+
+            game.process_events()
+            game.advance_game()
+
+            self.tick_times.append(perf_counter() - tick_start)
+
+        return self.tick_times
@@ -54,7 +54,8 @@ class InGameScene(Scene):
                                           fill_name="HEALTH_COLOR_2",
                                           outline_name=''),
                            name=f"{PLAYER_HEALTH_BAR_ANIM}_1",
-                           is_front=True)
+                           is_front=True,
+                           tags=(PLAYER_HEALTH_BAR_ANIM,))
         self.add_animation(SinusoidalWave(x1=bar_anim_x1,
                                           y1=bar_anim_y1,
                                           x2=bar_anim_x2,
@@ -68,7 +69,8 @@ class InGameScene(Scene):
                                           fill_name="HEALTH_COLOR_2",
                                           outline_name=''),
                            name=f"{PLAYER_HEALTH_BAR_ANIM}_2",
-                           is_front=True)
+                           is_front=True,
+                           tags=(PLAYER_HEALTH_BAR_ANIM,))
         self.add_animation(SinusoidalWave(x1=bar_anim_x1,
                                           y1=bar_anim_y1,
                                           x2=bar_anim_x2,
@@ -82,4 +84,5 @@ class InGameScene(Scene):
                                           fill_name="HEALTH_COLOR_2",
                                           outline_name=''),
                            name=f"{PLAYER_HEALTH_BAR_ANIM}_3",
-                           is_front=True)
+                           is_front=True,
+                           tags=(PLAYER_HEALTH_BAR_ANIM,))
@@ -4,7 +4,7 @@ the content on display.
 """
 
 from re import match
-from typing import TYPE_CHECKING, Dict, Generator, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Generator, Iterable, List, Optional, Tuple
 
 from ..sprites import Sprite
 from ..utils import ButtonKwargs, Label, Menu, Timer
@@ -19,6 +19,8 @@ SpriteProperties = Dict[str, int | Sprite]
 SpritesDict = Dict[str, SpriteProperties]
 AnimationsDict = Dict[str, "Animation"]
 SceneDict = Dict[str, "Scene"]
+TagIndex = Dict[str, List[Any]]
+ElementKey = Tuple[str, str] # (kind, name)
 
 
 class Scene:
@@ -44,6 +46,11 @@ class Scene:
         self._rear_animations: AnimationsDict = {}
         self._front_animations: AnimationsDict = {}
 
+        # Tags
+        self._tag_index: TagIndex = {}
+        self._element_tags: Dict[ElementKey, Tuple[str, ...]] = {}
+        self._default_names: Dict[Tuple[str, int], int] = {}
+
         self.parent: Optional["Scene"] = parent
 
         # Timers
@@ -166,15 +173,101 @@ class Scene:
                 yield front_anim
 
 
+    def find_tagged(self, tag: str) -> List[Any]:
+        """
+        Returns all the elements (labels, sprite properties or animations)
+        registered with the given tag.
+        """
+
+        return list(self._tag_index.get(tag, ()))
+
+
+    def tags_of(self, kind: str, name: str) -> Tuple[str, ...]:
+        """
+        Returns the tags of the element of a kind ('label', 'sprite',
+        'rear_animation' or 'front_animation') with the given name.
+        """
+
+        return self._element_tags.get((kind, name), ())
+
+
+    def _index_element(self, kind: str, name: str, element: Any, tags: Iterable[str]) -> None:
+        """
+        Registers an element in the tag index, replacing whatever
+        was under the same name before.
+        """
+
+        self._unindex_element(kind, name)
+
+        tags = tuple(dict.fromkeys(tags))
+        if not tags:
+            return
+
+        self._element_tags[(kind, name)] = tags
+        for tag in tags:
+            self._tag_index.setdefault(tag, []).append(element)
+
+
+    def _unindex_element(self, kind: str, name: str) -> None:
+        """
+        Removes an element from the tag index, if it was there.
+        """
+
+        tags = self._element_tags.pop((kind, name), ())
+        if not tags:
+            return
+
+        element = self._element_dict(kind)[name]
+
+        for tag in tags:
+            tagged = self._tag_index[tag]
+            for i, other in enumerate(tagged):
+                if other is element:
+                    del tagged[i]
+                    break
+
+            if not tagged:
+                del self._tag_index[tag]
+
+
+    def _element_dict(self, kind: str) -> Dict:
+        """
+        Returns the dictionary where the elements of a kind are stored.
+        """
+
+        match kind:
+            case "label":
+                return self.labels
+
+            case "sprite":
+                return self.sprites
+
+            case "rear_animation":
+                return self.rear_animations
+
+            case "front_animation":
+                return self.front_animations
+
+            case _:
+                raise ValueError(f"'{kind}' is not a valid kind of scene element.")
+
+
     def get_default_name(self, elem_name: str, dictionary: Dict) -> str:
         """
         Gets a default name when it is not provided.
         """
 
-        how_many = len([key for key in dictionary if (isinstance(key, str) and
-                                                      key.startswith(f"{elem_name}_"))])
+        counter_key = (elem_name, id(dictionary))
+        how_many = self._default_names.get(counter_key, 0)
+        name = f"{elem_name}_{str(how_many + 1).zfill(3)}"
 
-        return f"{elem_name}_{str(how_many + 1).zfill(3)}"
+        while name in dictionary:
+            how_many += 1
+            name = f"{elem_name}_{str(how_many + 1).zfill(3)}"
+
+        self._default_names[counter_key] = how_many + 1
+
+        return name
 
 
     def add_menu(self, menu: Menu) -> None:
@@ -197,6 +290,7 @@ class Scene:
                   x: Optional[float]=None,
                   y: Optional[float]=None,
                   text: str='',
+                  tags: Iterable[str]=(),
                   **kwargs) -> None:
         """
         Adds a label to the scene.
@@ -205,17 +299,17 @@ class Scene:
         if not name:
             name = self.get_default_name("label", self.labels)
 
-        if label:
-            self.labels[name] = label
-            return
+        if not label:
+            if not all((x, y)):
+                return
 
-        if not all((x, y)):
-            return
+            label = Label(x=x,
+                          y=y,
+                          text=text,
+                          **kwargs)
 
-        self.labels[name] = Label(x=x,
-                                  y=y,
-                                  text=text,
-                                  **kwargs)
+        self._index_element("label", name, label, tags)
+        self.labels[name] = label
 
 
     def add_sprite(self,
@@ -224,6 +318,7 @@ class Scene:
                    *,
                    texture_path: Optional[str]=None,
                    spr_type: str="BOX",
+                   tags: Iterable[str]=(),
                    **kwargs) -> None:
         """
         Adds a sprite to the scene.
@@ -240,6 +335,7 @@ class Scene:
 
         kwargs.update(sprite=sprite,
                       spr_type=spr_type)
+        self._index_element("sprite", name, kwargs, tags)
         self.sprites[name] = kwargs
 
 
@@ -247,22 +343,60 @@ class Scene:
                       animation: "Animation",
                       name: Optional[str]=None,
                       *,
-                      is_front: bool=False) -> None:
+                      is_front: bool=False,
+                      tags: Iterable[str]=()) -> None:
         """
         Adds an animation to the scene.
         """
 
-        if is_front:
-            anim_list = self.front_animations
-        else:
-            anim_list = self.rear_animations
+        kind = ("front_animation" if is_front else "rear_animation")
+        anim_list = self._element_dict(kind)
 
         if not name:
             name = self.get_default_name("animation", anim_list)
 
+        self._index_element(kind, name, animation, tags)
         anim_list[name] = animation
 
 
+    def remove_label(self, name: str) -> Optional[Label]:
+        """
+        Removes a label from the scene, if it exists, and returns it.
+        """
+
+        return self._remove_element("label", name)
+
+
+    def remove_sprite(self, name: str) -> Optional[SpriteProperties]:
+        """
+        Removes a sprite from the scene, if it exists, and returns its properties.
+        """
+
+        return self._remove_element("sprite", name)
+
+
+    def remove_animation(self, name: str, *, is_front: bool=False) -> Optional["Animation"]:
+        """
+        Removes an animation from the scene, if it exists, and returns it.
+        """
+
+        return self._remove_element(("front_animation" if is_front else "rear_animation"), name)
+
+
+    def _remove_element(self, kind: str, name: str) -> Optional[Any]:
+        """
+        Removes an element of a kind from the scene and from the tag index.
+        """
+
+        dictionary = self._element_dict(kind)
+
+        if name not in dictionary:
+            return None
+
+        self._unindex_element(kind, name)
+        return dictionary.pop(name)
+
+
     def change_selection(self, reverse: bool=False) -> None:
         """
         Changes the current selected menu.
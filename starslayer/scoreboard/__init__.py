@@ -0,0 +1,5 @@
+"""
+Scoreboard Package.
+"""
+
+from .score_store import *
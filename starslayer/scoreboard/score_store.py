@@ -0,0 +1,211 @@
+"""
+Score Store Module. Keeps the scoreboards in memory, so the
+scores file is only read once, and saves them in the background.
+"""
+
+from heapq import heappush, heappushpop
+from itertools import count
+from threading import Lock, Thread
+from typing import Dict, List, Optional, Tuple
+
+from ..consts import SCOREBOARD_SIZE
+from ..files import dump_json, load_json
+from ..logger import GameLogger
+
+ScoreRow = List[str | int] # [name, power, level, score]
+ScoreBoard = List[ScoreRow]
+HeapEntry = Tuple[int, int, ScoreRow]
+
+
+class ScoreStore:
+    """
+    Top scores of the game, both the general ones and the ones of each
+    character.
+
+    Each scoreboard is a bounded min-heap, so adding a score is O(log n).
+    On a tie, the older score stays above the newer one.
+    """
+
+    def __init__(self,
+                 scores_path: str,
+                 *,
+                 max_scores: int=SCOREBOARD_SIZE,
+                 background: bool=True) -> None:
+        """
+        Initializes an instance of type 'ScoreStore'.
+
+        If 'background' is 'True', the scores are written to the file
+        in another thread, so the game does not wait for it.
+        """
+
+        if max_scores < 1:
+            raise ValueError(f"max_scores must be positive, not {max_scores}.")
+
+        self.scores_path: str = scores_path
+        self.max_scores: int = max_scores
+        self.background: bool = background
+
+        self._order = count()
+        self._boards: Dict[Optional[str], List[HeapEntry]] = {}
+        self._sorted_boards: Dict[Optional[str], ScoreBoard] = {}
+
+        self._version: int = 0
+        self._written_version: int = 0
+        self._write_lock: Lock = Lock()
+        self._writer: Optional[Thread] = None
+
+        self.load()
+
+
+    @property
+    def characters(self) -> List[str]:
+        """
+        Returns the characters that have their own scoreboard.
+        """
+
+        return [board for board in self._boards if board is not None]
+
+
+    def load(self) -> None:
+        """
+        Loads the scoreboards from the scores file, discarding
+        the ones in memory.
+        """
+
+        self._boards.clear()
+        self._sorted_boards.clear()
+
+        try:
+            scores_dict = load_json(self.scores_path)
+
+        except FileNotFoundError:
+            scores_dict = {}
+
+        for row in scores_dict.get("scores", []):
+            self._push(None, list(row))
+
+        for character, rows in scores_dict.get("characters", {}).items():
+            for row in rows:
+                self._push(character, list(row))
+
+
+    def _push(self, board: Optional[str], row: ScoreRow) -> bool:
+        """
+        Pushes a row into a scoreboard.
+        Returns `True` if it made it into the board, or `False` otherwise.
+        """
+
+        heap = self._boards.setdefault(board, [])
+        entry = (row[3], -next(self._order), row)
+
+        if len(heap) < self.max_scores:
+            heappush(heap, entry)
+
+        elif heappushpop(heap, entry) is entry:
+            return False
+
+        self._sorted_boards.pop(board, None)
+        return True
+
+
+    def scores(self, character: Optional[str]=None) -> ScoreBoard:
+        """
+        Returns the rows of a scoreboard, from the highest score to the lowest.
+        If no character is given, it is the general scoreboard.
+        """
+
+        if character not in self._sorted_boards:
+            heap = self._boards.get(character, [])
+            self._sorted_boards[character] = [row for *_, row in sorted(heap, reverse=True)]
+
+        return list(self._sorted_boards[character])
+
+
+    def add_score(self,
+                  name: str,
+                  power: str,
+                  level: int,
+                  score: int,
+                  *,
+                  character: Optional[str]=None) -> bool:
+        """
+        Adds a new score to the general scoreboard, and to the one of
+        the character, if given.
+
+        Returns `True` if the score made it into the general scoreboard.
+        """
+
+        row = [name, power, level, score]
+        added = self._push(None, row)
+        added_to_character = (character is not None and self._push(character, list(row)))
+
+        if added or added_to_character:
+            self.save()
+
+        return added
+
+
+    def clear(self) -> None:
+        """
+        Empties all the scoreboards.
+        """
+
+        self._boards.clear()
+        self._sorted_boards.clear()
+        self.save()
+
+
+    def _snapshot(self) -> Dict:
+        """
+        Returns the scoreboards as they are saved in the scores file.
+        """
+
+        return {"scores": self.scores(),
+                "characters": {character: self.scores(character)
+                               for character in self.characters}}
+
+
+    def save(self) -> None:
+        """
+        Saves the scoreboards into the scores file.
+        """
+
+        self._version += 1
+        snapshot = self._snapshot()
+
+        if not self.background:
+            self._write(snapshot, self._version)
+            return
+
+        self._writer = Thread(target=self._write,
+                              args=(snapshot, self._version),
+                              name="ScoreStoreWriter")
+        self._writer.start()
+
+
+    def _write(self, snapshot: Dict, version: int) -> None:
+        """
+        Writes a snapshot of the scoreboards, unless a newer
+        one was already written.
+        """
+
+        with self._write_lock:
+            if version <= self._written_version:
+                return
+
+            try:
+                dump_json(snapshot, self.scores_path)
+                self._written_version = version
+
+            except OSError as err:
+                GameLogger().error(f"Could not save the scores: {err}")
+
+
+    def flush(self) -> None:
+        """
+        Waits until the last save is written.
+        """
+
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
@@ -3,13 +3,14 @@ Selector Module. This stores a color selector
 that helps the user in picking a color.
 """
 
+from colorsys import hsv_to_rgb
 from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
 
-from ..color import Color, ColorsDict, CoordsTuple
+from ..backends import input as lib_input
+from ..backends import say as lib_say
+from ..color import Color, ColorsDict, CoordsTuple, RGBTuple
 from ..consts import HEIGHT, WIDTH
 from ..files import StrDict
-from ..gamelib import input as lib_input
-from ..gamelib import say as lib_say
 from ..utils import Button, ButtonsList, FloatTuple4
 
 if TYPE_CHECKING:
@@ -65,7 +66,7 @@ class ColorSelector():
             hue += (1.0 / hue_bar_size)
 
         self.hue_bar: List[Tuple[float, Color]] = hue_bar
-        self.color_palette: ColorsDict = self.generate_colors()
+        self._color_palette: Optional[ColorsDict] = None
 
         self.selection: CoordsTuple = ((self.cols - 1), 0)
         self.buttons, self.actions = self.generate_buttons()
@@ -124,7 +125,20 @@ class ColorSelector():
     def hue_index(self, new_index: int) -> None:
 
         self._hue_index = new_index
-        self.color_palette = self.generate_colors()
+        self._color_palette = None
+
+
+    @property
+    def color_palette(self) -> ColorsDict:
+        """
+        Returns the color palette of the selected hue, creating
+        it only the first time it is asked for.
+        """
+
+        if self._color_palette is None:
+            self._color_palette = self.generate_colors()
+
+        return self._color_palette
 
 
     @property
@@ -233,9 +247,27 @@ class ColorSelector():
         return True
 
 
-    def generate_colors(self, rows: int=0, cols: int=0) -> ColorsDict:
+    def generate_colors(self,
+                        rows: int=0,
+                        cols: int=0,
+                        hue_index: Optional[int]=None) -> ColorsDict:
+        """
+        Creates the color palette of a hue, which
+        is the one selected if not given.
+        """
+
+        return {(col, row): Color(*rgb)
+                for row, rgb_row in enumerate(self.palette_rgb(rows, cols, hue_index))
+                for col, rgb in enumerate(rgb_row)}
+
+
+    def palette_rgb(self,
+                    rows: int=0,
+                    cols: int=0,
+                    hue_index: Optional[int]=None) -> List[List[RGBTuple]]:
         """
-        Creates the color palette.
+        Returns the RGB values of the color palette of a hue, as a list
+        of rows, without creating a color for each of them.
         """
 
         if not rows:
@@ -244,24 +276,32 @@ class ColorSelector():
         if not cols:
             cols = self.cols
 
+        if hue_index is None:
+            hue_index = self.hue_index
+
         s_augment = 1.0 / cols
         v_augment = 1.0 / rows
+        hue, _ = self.hue_bar[hue_index]
+        hue = (hue * 360 % 360) / 360 # as Color.from_hsv does
 
-        colors: ColorsDict = {}
-
-        for row in range(rows):
+        # Scaled to percentages and back, as Color.from_hsv does, so they round the same
+        return [[Color.dec_float_to_int(hsv_to_rgb(hue,
+                                                   s_augment * col * 100 / 100,
+                                                   (1.0 - (v_augment * row)) * 100 / 100))
+                 for col in range(cols)]
+                for row in range(rows)] # Black is on the bottom
 
-            value = 1.0 - (v_augment * row) # We want black to be on bottom
 
-            for col in range(cols):
-
-                hue, _ = self.hue_bar[self.hue_index]
-                saturation = (s_augment * col)
-
-                colors[(col, row)] = Color.from_hsv(hue * 360, saturation * 100, value * 100)
+    def color_at(self, col: int, row: int) -> Color:
+        """
+        Returns the color of a cell of the palette of the selected hue.
+        """
 
+        hue, _ = self.hue_bar[self.hue_index]
 
-        return colors
+        return Color.from_hsv(hue * 360,
+                              (1.0 / self.cols) * col * 100,
+                              (1.0 - (1.0 / self.rows) * row) * 100)
 
 
     def get_selected_color(self) -> Color:
@@ -270,7 +310,7 @@ class ColorSelector():
         is the color selected.
         """
 
-        return ('' if self.is_transparent else self.color_palette[self.selection])
+        return ('' if self.is_transparent else self.color_at(*self.selection))
 
 
     def get_selected_color_hex(self) -> str:
@@ -279,7 +319,7 @@ class ColorSelector():
         which is the color selected.
         """
 
-        return ('' if self.is_transparent else self.color_palette[self.selection].hex)
+        return ('' if self.is_transparent else self.color_at(*self.selection).hex)
 
 
     def generate_buttons(self) -> tuple[ButtonsList, dict[str, Callable]]:
@@ -0,0 +1,5 @@
+"""
+Settings Package.
+"""
+
+from .settings_store import *
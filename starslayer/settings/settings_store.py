@@ -0,0 +1,195 @@
+"""
+Settings Store Module. Keeps the settings of the game, such as the color
+profiles and the key bindings, in memory, and saves them in the background.
+"""
+
+from atexit import register
+from copy import deepcopy
+from threading import Condition, Lock, Thread
+from time import monotonic
+from typing import Dict, Optional, Tuple
+
+from ..consts import SETTINGS_SAVE_DELAY
+from ..files import GameDict, dump_json, load_json
+from ..logger import GameLogger
+
+
+class SettingsStore:
+    """
+    The settings kept in a JSON file.
+
+    The dictionary in 'data' is the one the game reads and edits. After
+    editing it, 'save' should be called; changes made in less than 'delay'
+    seconds of each other are written to the file only once.
+    """
+
+    def __init__(self,
+                 settings_path: str,
+                 *,
+                 delay: float=SETTINGS_SAVE_DELAY,
+                 background: bool=True) -> None:
+        """
+        Initializes an instance of type 'SettingsStore'.
+
+        If 'background' is 'True', the settings are written to the file
+        in another thread, so the game does not wait for it.
+        """
+
+        if delay < 0:
+            raise ValueError(f"delay must not be negative, not {delay}.")
+
+        self.settings_path: str = settings_path
+        self.delay: float = delay
+        self.background: bool = background
+        self.data: GameDict = load_json(settings_path)
+
+        self._changed: Condition = Condition()
+        self._pending: Optional[GameDict] = None
+        self._deadline: float = 0.0
+        self._version: int = 0
+        self._written_version: int = 0
+        self._write_lock: Lock = Lock()
+        self._writer: Optional[Thread] = None
+
+        register(self.flush)
+
+
+    @property
+    def pending(self) -> bool:
+        """
+        Returns 'True' if there are changes not yet written, or 'False' otherwise.
+        """
+
+        return self._pending is not None
+
+
+    def save(self) -> None:
+        """
+        Schedules the settings to be saved into their file.
+        """
+
+        snapshot = deepcopy(self.data)
+
+        if not self.background:
+            self._version += 1
+            self._write(snapshot, self._version)
+            return
+
+        with self._changed:
+            self._version += 1
+            self._pending = snapshot
+            self._deadline = monotonic() + self.delay
+            self._changed.notify()
+
+        if self._writer is None:
+            self._writer = Thread(target=self._run,
+                                  name="SettingsStoreWriter",
+                                  daemon=True)
+            self._writer.start()
+
+
+    def _take_pending(self) -> Optional[Tuple[GameDict, int]]:
+        """
+        Returns the snapshot waiting to be written, along with its version.
+        It should only be called with the condition acquired.
+        """
+
+        if self._pending is None:
+            return None
+
+        snapshot, self._pending = self._pending, None
+        return snapshot, self._version
+
+
+    def _run(self) -> None:
+        """
+        Writes the settings whenever they have not changed for a while.
+
+        The write lock is taken before the snapshot, so that 'flush'
+        never finds nothing pending while it is not yet written.
+        """
+
+        while True:
+            with self._changed:
+                while self._pending is None or monotonic() < self._deadline:
+                    self._changed.wait(None if self._pending is None
+                                       else self._deadline - monotonic())
+
+                self._write_lock.acquire() # pylint: disable=consider-using-with
+                snapshot, version = self._take_pending()
+
+            try:
+                self._dump(snapshot, version)
+
+            finally:
+                self._write_lock.release()
+
+
+    def _write(self, snapshot: GameDict, version: int) -> None:
+        """
+        Writes a snapshot of the settings, unless a newer
+        one was already written.
+        """
+
+        with self._write_lock:
+            self._dump(snapshot, version)
+
+
+    def _dump(self, snapshot: GameDict, version: int) -> None:
+        """
+        Writes a snapshot of the settings into their file, unless a newer
+        one was already written. It should only be called with the write
+        lock acquired.
+        """
+
+        if version <= self._written_version:
+            return
+
+        try:
+            dump_json(snapshot, self.settings_path)
+            self._written_version = version
+
+        except OSError as err:
+            GameLogger().error(f"Could not save '{self.settings_path}': {err}")
+
+
+    def flush(self) -> None:
+        """
+        Writes the changes not yet written, and waits until they are.
+        """
+
+        with self._changed:
+            pending = self._take_pending()
+
+        if pending is not None:
+            self._write(*pending)
+            return
+
+        with self._write_lock: # waits for a write in progress, if any
+            pass
+
+
+_stores: Dict[str, SettingsStore] = {}
+
+
+def get_settings(settings_path: str) -> SettingsStore:
+    """
+    Returns the store of the settings in 'settings_path', so that
+    everything that reads or edits them shares the same one.
+    """
+
+    if settings_path not in _stores:
+        _stores[settings_path] = SettingsStore(settings_path)
+
+    return _stores[settings_path]
+
+
+def flush_settings() -> None:
+    """
+    Writes the changes not yet written of every store, and waits until
+    they are. It should be called before the game exits, as some ways
+    out of it skip the exit handlers.
+    """
+
+    for store in _stores.values():
+        store.flush()
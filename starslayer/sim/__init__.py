@@ -0,0 +1,8 @@
+"""
+Simulation Package. Runs headless games in batches, for
+balancing and load testing.
+"""
+
+from .metrics import *
+from .players import *
+from .simulator import *
@@ -0,0 +1,69 @@
+"""
+Runs a batch of headless games and writes their metrics.
+
+Usage: python -m starslayer.sim --runs 1000 --output runs.csv
+"""
+
+from argparse import ArgumentParser
+from sys import stderr, stdout
+from time import perf_counter
+from typing import List, Optional
+
+from .metrics import write_csv, write_json
+from .players import SimPlayer
+from .simulator import CHARACTERS, POWER_LEVELS, make_configs, run_batch
+
+
+def main(args: Optional[List[str]]=None) -> int:
+    """
+    Parses the command line and runs the simulations.
+    """
+
+    parser = ArgumentParser(prog="python -m starslayer.sim",
+                            description="Runs many games without a window and " +
+                                        "measures how they went.")
+    parser.add_argument("-n", "--runs", type=int, default=100,
+                        help="how many games to run")
+    parser.add_argument("-p", "--processes", type=int, default=None,
+                        help="how many processes to use (all the CPUs by default)")
+    parser.add_argument("-s", "--seed", type=int, default=None,
+                        help="seed the runs seeds are drawn from")
+    parser.add_argument("-t", "--ticks", type=int, default=10_000,
+                        help="the most ticks a game can last")
+    parser.add_argument("--characters", nargs='+', choices=list(CHARACTERS),
+                        default=list(CHARACTERS))
+    parser.add_argument("--powers", nargs='+', choices=list(POWER_LEVELS),
+                        default=["SimplePower"])
+    parser.add_argument("--players", nargs='+', choices=list(SimPlayer.types),
+                        default=["random"])
+    parser.add_argument("-o", "--output", default=None,
+                        help="file to write the metrics to (the standard output by default)")
+    parser.add_argument("-f", "--format", choices=("csv", "json"), default="csv")
+    parsed = parser.parse_args(args)
+
+    configs = make_configs(parsed.runs,
+                           seed=parsed.seed,
+                           characters=parsed.characters,
+                           powers=parsed.powers,
+                           players=parsed.players,
+                           max_ticks=parsed.ticks)
+
+    batch_start = perf_counter()
+    runs = run_batch(configs, processes=parsed.processes)
+    print(f"{len(runs)} runs in {perf_counter() - batch_start:.2f}s", file=stderr)
+
+    write_metrics = (write_csv if parsed.format == "csv" else write_json)
+
+    if parsed.output is None:
+        write_metrics(runs, stdout)
+
+    else:
+        with open(parsed.output, mode='w', encoding="utf-8", newline='') as file:
+            write_metrics(runs, file)
+
+    return 0
+
+
+if __name__ == "__main__":
+
+    raise SystemExit(main())
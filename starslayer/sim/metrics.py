@@ -0,0 +1,97 @@
+"""
+Run Metrics Module. Holds what was measured in a simulated
+run, and writes batches of them in columns.
+"""
+
+from csv import writer as csv_writer
+from json import dump
+from typing import Dict, Iterable, List, TextIO
+
+MetricValue = str | int | float | bool
+ColumnsDict = Dict[str, List[MetricValue]]
+
+METRIC_COLUMNS = ("run_id",
+                  "seed",
+                  "character",
+                  "power",
+                  "player",
+                  "survival_ticks",
+                  "died",
+                  "score",
+                  "level",
+                  "peak_enemies",
+                  "peak_enemy_bullets",
+                  "peak_player_bullets",
+                  "peak_drops",
+                  "deferred_spawns",
+                  "rejected_spawns",
+                  "evicted_spawns",
+                  "mean_tick_ms",
+                  "max_tick_ms")
+"""
+The columns of the output of a batch of simulations.
+"""
+
+
+class RunMetrics:
+    """
+    The metrics of a single simulated run.
+    """
+
+    __slots__ = METRIC_COLUMNS
+
+    def __init__(self, **values: MetricValue) -> None:
+        """
+        Initializes an instance of type 'RunMetrics'.
+        """
+
+        for column in METRIC_COLUMNS:
+            setattr(self, column, values.get(column))
+
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the metrics.
+        """
+
+        return f"RunMetrics({', '.join(f'{col}={getattr(self, col)!r}' for col in METRIC_COLUMNS)})"
+
+
+    def as_row(self) -> List[MetricValue]:
+        """
+        Returns the metrics in the order of the columns.
+        """
+
+        return [getattr(self, column) for column in METRIC_COLUMNS]
+
+
+def to_columns(runs: Iterable[RunMetrics]) -> ColumnsDict:
+    """
+    Arranges the metrics of many runs by column.
+    """
+
+    columns = {column: [] for column in METRIC_COLUMNS}
+
+    for run in runs:
+        for column, value in zip(METRIC_COLUMNS, run.as_row()):
+            columns[column].append(value)
+
+    return columns
+
+
+def write_csv(runs: Iterable[RunMetrics], file: TextIO) -> None:
+    """
+    Writes the metrics of many runs as CSV, one row per run.
+    """
+
+    rows = csv_writer(file)
+    rows.writerow(METRIC_COLUMNS)
+    rows.writerows(run.as_row() for run in runs)
+
+
+def write_json(runs: Iterable[RunMetrics], file: TextIO) -> None:
+    """
+    Writes the metrics of many runs as JSON, one list per column.
+    """
+
+    dump(to_columns(runs), file)
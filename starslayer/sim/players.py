@@ -0,0 +1,155 @@
+"""
+Simulated Players Module. Bots that play the game
+by sending key events to it.
+"""
+
+from abc import ABC, abstractmethod
+from random import Random
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
+
+from ..consts import ACTIONS_PATH
+from ..files import list_action_keys
+from ..gamelib import EventType
+from ..replay import RecordedEvent
+from ..settings import get_settings
+
+if TYPE_CHECKING:
+    from ..state import Game
+
+MOVES = ("UP", "DOWN", "LEFT", "RIGHT")
+
+
+class SimPlayer(ABC):
+    """
+    A bot that decides which keys to hold each tick.
+    """
+
+    name: str = ""
+    types: Dict[str, "SimPlayer"]
+
+    def __init_subclass__(cls) -> None:
+        """
+        Registers subclasses by their name.
+        """
+
+        try:
+            SimPlayer.types[cls.name] = cls
+
+        except AttributeError:
+            SimPlayer.types = {cls.name: cls}
+
+
+    def __init__(self, seed: Optional[int]=None) -> None:
+        """
+        Initializes an instance of type 'SimPlayer'.
+
+        The bot has its own random generator, so it never
+        touches the one of the simulation.
+        """
+
+        self.rng: Random = Random(seed)
+        self.held: Set[str] = set()
+
+        actions = get_settings(ACTIONS_PATH).data
+        self.action_keys: Dict[str, str] = {action: list_action_keys(action, actions)[0]
+                                            for action in (*MOVES, "SHOOT")}
+
+
+    @abstractmethod
+    def wanted_actions(self, game: "Game", tick: int) -> Set[str]:
+        """
+        Returns the actions the bot wants to be doing in this tick.
+        """
+
+        raise NotImplementedError
+
+
+    def events(self, game: "Game", tick: int) -> List[RecordedEvent]:
+        """
+        Returns the key events needed to go from the actions held
+        in the last tick to the ones wanted now.
+        """
+
+        wanted = self.wanted_actions(game, tick)
+
+        events = [RecordedEvent(EventType.KeyRelease, key=self.action_keys[action])
+                  for action in sorted(self.held - wanted)]
+        events.extend(RecordedEvent(EventType.KeyPress, key=self.action_keys[action])
+                      for action in sorted(wanted - self.held))
+
+        self.held = wanted
+        return events
+
+
+class IdlePlayer(SimPlayer):
+    """
+    Stays still and keeps shooting.
+    """
+
+    name = "idle"
+
+    def wanted_actions(self, game: "Game", tick: int) -> Set[str]:
+        """
+        Only shoots.
+        """
+
+        return {"SHOOT"}
+
+
+class StrafingPlayer(SimPlayer):
+    """
+    Sweeps the screen from side to side while shooting.
+    """
+
+    name = "strafing"
+
+    def __init__(self, seed: Optional[int]=None, *, period: int=120) -> None:
+        """
+        Initializes an instance of type 'StrafingPlayer'.
+        """
+
+        super().__init__(seed)
+        self.period: int = period
+
+
+    def wanted_actions(self, game: "Game", tick: int) -> Set[str]:
+        """
+        Goes left for 'period' ticks, then right for as many.
+        """
+
+        return {"SHOOT", ("LEFT" if (tick // self.period) % 2 == 0 else "RIGHT")}
+
+
+class RandomPlayer(SimPlayer):
+    """
+    Holds random directions for random amounts of time, while shooting.
+    """
+
+    name = "random"
+
+    def __init__(self,
+                 seed: Optional[int]=None,
+                 *,
+                 min_hold: int=10,
+                 max_hold: int=90) -> None:
+        """
+        Initializes an instance of type 'RandomPlayer'.
+        """
+
+        super().__init__(seed)
+        self.min_hold: int = min_hold
+        self.max_hold: int = max_hold
+        self.next_change: int = 0
+        self.moves: Set[str] = set()
+
+
+    def wanted_actions(self, game: "Game", tick: int) -> Set[str]:
+        """
+        Changes direction once the current one was held long enough.
+        """
+
+        if tick >= self.next_change:
+            self.moves = set(self.rng.sample(MOVES, self.rng.randint(0, 2)))
+            self.next_change = tick + self.rng.randint(self.min_hold, self.max_hold)
+
+        return {"SHOOT", *self.moves}
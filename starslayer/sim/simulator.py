@@ -0,0 +1,203 @@
+"""
+Simulator Module. Runs whole games without a window, many
+at a time, and measures how they went.
+"""
+
+from itertools import product
+from multiprocessing import Pool
+from random import Random
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Type
+
+from ..auxiliar import seed_rng
+from ..characters import BilbyTankaCharacter, StarSlayerCharacter, ViperDodgerCharacter
+from ..power_levels import (HyperPower, MegaPower, PowerLevel, SimplePower,
+                            SuperPower, UltraPower)
+from ..state import Game
+from .metrics import RunMetrics
+from .players import SimPlayer
+
+if TYPE_CHECKING:
+    from ..characters import PlayableCharacter
+
+CharacterFactory = Callable[[Game], "PlayableCharacter"]
+
+CHARACTERS: Dict[str, CharacterFactory] = {
+    "StarSlayerCharacter": lambda game: StarSlayerCharacter(),
+    "BilbyTankaCharacter": lambda game: BilbyTankaCharacter(),
+    "ViperDodgerCharacter": lambda game: ViperDodgerCharacter(threats_pool=game.enemies)
+}
+"""
+The characters that can be simulated, built as their menu builds them.
+"""
+
+POWER_LEVELS: Dict[str, Type[PowerLevel]] = {power.__name__: power
+                                             for power in (SimplePower,
+                                                           SuperPower,
+                                                           UltraPower,
+                                                           MegaPower,
+                                                           HyperPower)}
+"""
+The power levels the characters can start the simulation with.
+"""
+
+
+class RunConfig:
+    """
+    What a simulated run is made of.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self,
+                 run_id: int,
+                 seed: int,
+                 *,
+                 character: str="StarSlayerCharacter",
+                 power: str="SimplePower",
+                 player: str="random",
+                 max_ticks: int=10_000) -> None:
+        """
+        Initializes an instance of type 'RunConfig'.
+        """
+
+        if character not in CHARACTERS:
+            raise ValueError(f"There is no character named '{character}'.")
+
+        if power not in POWER_LEVELS:
+            raise ValueError(f"There is no power level named '{power}'.")
+
+        if player not in SimPlayer.types:
+            raise ValueError(f"There is no simulated player named '{player}'.")
+
+        self.run_id: int = run_id
+        self.seed: int = seed
+        self.character: str = character
+        self.power: str = power
+        self.player: str = player
+        self.max_ticks: int = max_ticks
+
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the run.
+        """
+
+        return (f"RunConfig(run_id={self.run_id}, seed={self.seed}, " +
+                f"character={self.character!r}, power={self.power!r}, " +
+                f"player={self.player!r}, max_ticks={self.max_ticks})")
+
+
+def make_configs(runs: int,
+                 *,
+                 seed: Optional[int]=None,
+                 characters: Iterable[str]=tuple(CHARACTERS),
+                 powers: Iterable[str]=("SimplePower",),
+                 players: Iterable[str]=("random",),
+                 max_ticks: int=10_000) -> List[RunConfig]:
+    """
+    Makes the configurations of 'runs' runs, going through every combination
+    of characters, power levels and players in turn.
+
+    Each run gets its own seed, drawn from 'seed', so a batch
+    can be reproduced no matter how it is split into processes.
+    """
+
+    seeds = Random(seed)
+    combinations = list(product(characters, powers, players))
+
+    if not combinations:
+        raise ValueError("There must be at least one character, power level and player.")
+
+    configs = []
+
+    for run_id in range(runs):
+        character, power, player = combinations[run_id % len(combinations)]
+        configs.append(RunConfig(run_id,
+                                 seeds.getrandbits(32),
+                                 character=character,
+                                 power=power,
+                                 player=player,
+                                 max_ticks=max_ticks))
+
+    return configs
+
+
+def run_simulation(config: RunConfig) -> RunMetrics:
+    """
+    Plays a whole game with a simulated player, until the
+    player dies or 'config.max_ticks' ticks have passed.
+    """
+
+    seed_rng(config.seed)
+
+    game = Game()
+    game.has_audio = False
+
+    game.player = CHARACTERS[config.character](game)
+    if config.power != type(game.player.power_level).__name__:
+        game.player.power_level = POWER_LEVELS[config.power]()
+        game.player.change_cooldown(game.player.power_level.cooldown)
+        game.player.change_invulnerability(game.player.power_level.invulnerability)
+
+    game.start_game()
+
+    bot = SimPlayer.types[config.player](config.seed)
+    cursor_coords = {'x': None, 'y': None}
+    peaks = dict(peak_enemies=0, peak_enemy_bullets=0, peak_player_bullets=0, peak_drops=0)
+    tick_times = []
+
+    for tick in range(config.max_ticks):
+
+        if game.exit or not game.is_in_game:
+            break
+
+        tick_start = perf_counter()
+
+        for event in bot.events(game, tick):
+            game.classify_events(event, cursor_coords)
+
+        game.process_events()
+        game.advance_game()
+
+        tick_times.append(perf_counter() - tick_start)
+
+        peaks["peak_enemies"] = max(peaks["peak_enemies"], len(game.enemies))
+        peaks["peak_enemy_bullets"] = max(peaks["peak_enemy_bullets"], len(game.enemies_bullets))
+        peaks["peak_player_bullets"] = max(peaks["peak_player_bullets"], len(game.player_bullets))
+        peaks["peak_drops"] = max(peaks["peak_drops"], len(game.drops))
+
+    return RunMetrics(run_id=config.run_id,
+                      seed=config.seed,
+                      character=config.character,
+                      power=config.power,
+                      player=config.player,
+                      survival_ticks=len(tick_times),
+                      died=game.player.is_dead(),
+                      score=game.score,
+                      level=game.game_level,
+                      mean_tick_ms=(1000 * sum(tick_times) / len(tick_times)
+                                    if tick_times else 0.0),
+                      max_tick_ms=1000 * max(tick_times, default=0.0),
+                      **peaks,
+                      **{f"{name}_spawns": count for name, count in game.spawn_metrics().items()})
+
+
+def run_batch(configs: Iterable[RunConfig],
+              *,
+              processes: Optional[int]=None,
+              chunksize: int=1) -> List[RunMetrics]:
+    """
+    Runs many simulations over a pool of processes, and returns
+    their metrics in the order of their ids.
+
+    With a single process, the runs take place in this one.
+    """
+
+    if processes == 1:
+        results = [run_simulation(config) for config in configs]
+
+    else:
+        with Pool(processes) as pool:
+            results = list(pool.imap_unordered(run_simulation, configs, chunksize))
+
+    return sorted(results, key=lambda run: run.run_id)
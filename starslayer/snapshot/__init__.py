@@ -0,0 +1,5 @@
+"""
+Snapshot Package.
+"""
+
+from .game_snapshot import *
@@ -0,0 +1,151 @@
+"""
+Game Snapshot Module. Captures the state of the simulation
+so that it can be brought back at any moment.
+"""
+
+from gc import disable as gc_disable
+from gc import enable as gc_enable
+from gc import isenabled as gc_isenabled
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+from struct import Struct
+from typing import TYPE_CHECKING, Any, Dict
+
+from ..auxiliar import get_rng
+
+if TYPE_CHECKING:
+    from ..state import Game
+
+SNAPSHOT_MAGIC = b"SSNP"
+SNAPSHOT_VERSION = 2 # 2: the bullets are kept in admission pools
+SNAPSHOT_HEADER = Struct("<4sH")
+
+SNAPSHOT_ATTRIBUTES = ("game_level",
+                       "score",
+                       "times_upgraded",
+                       "player",
+                       "player_bullets",
+                       "enemies",
+                       "enemies_bullets",
+                       "drops",
+                       "chronometers",
+                       "timer_wheel",
+                       "flow_wheel",
+                       "spawn_schedule",
+                       "keys_pressed",
+                       "keys_released",
+                       "events_processed")
+
+
+class GameSnapshot:
+    """
+    The state of the simulation of a game at a given tick: the player,
+    enemies, bullets, drops, timers, the keys being held and the
+    simulation RNG.
+
+    Everything is serialized together, so references between entities
+    (homing targets, satellites, timer callbacks) are kept. Sprites are
+    stored as the folder they come from, not as their frames.
+
+    A snapshot can run arbitrary code when restored, so only load
+    the ones that were saved by the game itself.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        """
+        Initializes an instance of type 'GameSnapshot'.
+        """
+
+        self.data: bytes = data
+
+
+    def __len__(self) -> int:
+        """
+        Returns the size of the snapshot, in bytes.
+        """
+
+        return len(self.data)
+
+
+    @classmethod
+    def take(cls, game: "Game") -> "GameSnapshot":
+        """
+        Captures the current state of the game.
+        """
+
+        state: Dict[str, Any] = {attr: getattr(game, attr) for attr in SNAPSHOT_ATTRIBUTES}
+        state["used_cheats"] = game.used_cheats
+        state["rng_state"] = get_rng().getstate()
+
+        return cls(dumps(state, protocol=HIGHEST_PROTOCOL))
+
+
+    def restore(self, game: "Game") -> None:
+        """
+        Brings the game back to the captured state. Each restore makes
+        new entities, so the snapshot can be restored many times.
+        """
+
+        # Restoring creates lots of objects at once, and none of them is garbage
+        gc_was_enabled = gc_isenabled()
+        gc_disable()
+
+        try:
+            state: Dict[str, Any] = loads(self.data)
+
+        finally:
+            if gc_was_enabled:
+                gc_enable()
+
+        for attr in SNAPSHOT_ATTRIBUTES:
+            setattr(game, attr, state[attr])
+
+        game.used_cheats = state["used_cheats"]
+        get_rng().setstate(state["rng_state"])
+
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the snapshot in its binary format, with its version.
+        """
+
+        return SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION) + self.data
+
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> "GameSnapshot":
+        """
+        Reads a snapshot in its binary format.
+        """
+
+        if len(raw) < SNAPSHOT_HEADER.size:
+            raise ValueError("The data is too short to be a snapshot.")
+
+        magic, version = SNAPSHOT_HEADER.unpack_from(raw)
+
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("The data is not a game snapshot.")
+
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"The snapshot has version {version}, but only " +
+                             f"version {SNAPSHOT_VERSION} is supported.")
+
+        return cls(raw[SNAPSHOT_HEADER.size:])
+
+
+    def save(self, snapshot_path: str) -> None:
+        """
+        Writes the snapshot into a file.
+        """
+
+        with open(snapshot_path, mode="wb") as file:
+            file.write(self.to_bytes())
+
+
+    @classmethod
+    def load(cls, snapshot_path: str) -> "GameSnapshot":
+        """
+        Reads a snapshot from a file.
+        """
+
+        with open(snapshot_path, mode="rb") as file:
+            return cls.from_bytes(file.read())
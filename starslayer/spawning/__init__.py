@@ -0,0 +1,8 @@
+"""
+Spawning Package.
+"""
+
+from .admission import *
+from .spawn_grid import *
+from .spawn_schedule import *
+from .spawn_wave import *
@@ -0,0 +1,203 @@
+"""
+Admission Module. Caps how many entities a container of the game
+can hold, and how many can enter it each tick.
+"""
+
+from collections import deque
+from heapq import nsmallest
+from typing import (TYPE_CHECKING, Any, Callable, Deque, Dict, Iterable, List,
+                    Optional, Tuple, Type)
+
+from ..consts import HEIGHT, SPAWN_BUDGETS, SPAWN_RATES, WIDTH
+
+if TYPE_CHECKING:
+    from ..utils import BoundingShape
+
+PoolState = Tuple[List["BoundingShape"], Dict[str, Any]]
+PoolReduce = Tuple[Callable[..., "AdmissionPool"], Tuple[type], PoolState]
+
+
+def new_pool(cls: Type["AdmissionPool"]) -> "AdmissionPool":
+    """
+    Makes an empty pool, whose entities and state are set afterwards.
+    """
+
+    return cls.__new__(cls)
+
+
+def offscreen_distance(shape: "BoundingShape") -> float:
+    """
+    Returns how far out of the screen a shape is, or 0 if
+    any part of it is on screen.
+    """
+
+    x1, y1, x2, y2 = shape.all_coords # pylint: disable=invalid-name
+
+    return max(0, -x2, x1 - WIDTH, -y2, y1 - HEIGHT)
+
+
+class AdmissionPool(list):
+    """
+    A list of entities with a budget of how many it holds and of how
+    many can be added to it each tick.
+
+    Entities added over the rate of a tick wait in a queue for the next
+    ones, and only if that queue is full as well are they rejected. A
+    pool can go over its budget during a tick; at its end, 'evict_overflow'
+    removes the entities farthest out of the screen, or else the oldest
+    ones, until it is back within it.
+    """
+
+    def __init__(self,
+                 category: str,
+                 *,
+                 budget: Optional[int]=None,
+                 rate: Optional[int]=None) -> None:
+        """
+        Initializes an instance of type 'AdmissionPool'.
+
+        'budget' and 'rate' default to those of 'category'
+        in SPAWN_BUDGETS and SPAWN_RATES.
+        """
+
+        super().__init__()
+
+        self.category: str = category
+        self.budget: int = (SPAWN_BUDGETS[category] if budget is None else budget)
+        self.rate: int = (SPAWN_RATES[category] if rate is None else rate)
+
+        if self.budget <= 0 or self.rate <= 0:
+            raise ValueError("The budget and the rate of a pool must be positive.")
+
+        self.deferred: Deque["BoundingShape"] = deque()
+        self.admitted_this_tick: int = 0
+
+        self.deferred_count: int = 0
+        self.rejected_count: int = 0
+        self.evicted_count: int = 0
+
+
+    def __reduce__(self) -> PoolReduce:
+        """
+        Pickles the pool along with its entities. They are set apart from
+        the pool itself, as they may refer back to it.
+        """
+
+        return new_pool, (type(self),), (list(self), self.__dict__)
+
+
+    def __setstate__(self, state: PoolState) -> None:
+        """
+        Brings back the entities and the state of the pool, without
+        admitting the entities one by one.
+        """
+
+        entities, attributes = state
+        list.extend(self, entities)
+        self.__dict__.update(attributes)
+
+
+    def __iadd__(self, entities: Iterable["BoundingShape"]) -> "AdmissionPool":
+        """
+        Adds every entity, through the admission.
+        """
+
+        self.extend(entities)
+        return self
+
+
+    def append(self, entity: "BoundingShape") -> None:
+        """
+        Adds an entity if there is room for it in this tick,
+        or defers it to the next ones.
+        """
+
+        if self.admitted_this_tick >= self.rate:
+            self.defer(entity)
+            return
+
+        self.admit(entity)
+
+
+    def extend(self, entities: Iterable["BoundingShape"]) -> None:
+        """
+        Adds every entity, through the admission.
+        """
+
+        for entity in entities:
+            self.append(entity)
+
+
+    def clear(self) -> None:
+        """
+        Removes every entity, including the deferred ones.
+        """
+
+        super().clear()
+        self.deferred.clear()
+
+
+    def admit(self, entity: "BoundingShape") -> None:
+        """
+        Adds an entity. If this leaves the pool over its budget,
+        others are evicted once the tick is over.
+        """
+
+        super().append(entity)
+        self.admitted_this_tick += 1
+
+
+    def defer(self, entity: "BoundingShape") -> None:
+        """
+        Keeps an entity for the next ticks, or rejects it if
+        there are already as many waiting as the budget.
+        """
+
+        if len(self.deferred) >= self.budget:
+            self.rejected_count += 1
+            return
+
+        self.deferred.append(entity)
+        self.deferred_count += 1
+
+
+    def evict_overflow(self) -> None:
+        """
+        Removes as many entities as the pool is over its budget, the ones
+        farthest out of the screen first, and then the oldest ones.
+
+        It should be called once the tick is over, as the pool is compacted
+        in place, which would make a loop over it skip some entities.
+        """
+
+        overflow = len(self) - self.budget
+
+        if overflow <= 0:
+            return
+
+        victims = set(nsmallest(overflow,
+                                range(len(self)),
+                                key=lambda index: (-offscreen_distance(self[index]), index)))
+        self[:] = [entity for index, entity in enumerate(self) if index not in victims]
+        self.evicted_count += overflow
+
+
+    def next_tick(self) -> None:
+        """
+        Starts a new tick, admitting as many deferred entities as the rate allows.
+        """
+
+        self.admitted_this_tick = 0
+
+        while self.deferred and self.admitted_this_tick < self.rate:
+            self.admit(self.deferred.popleft())
+
+
+    def metrics(self) -> Dict[str, int]:
+        """
+        Returns how many entities were deferred, rejected and evicted so far.
+        """
+
+        return {"deferred": self.deferred_count,
+                "rejected": self.rejected_count,
+                "evicted": self.evicted_count}
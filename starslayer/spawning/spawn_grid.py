@@ -0,0 +1,144 @@
+"""
+Spawn Grid Module. Keeps track of which places of
+a wave are still free to spawn an enemy in.
+"""
+
+from math import ceil, floor
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from random import Random
+
+    from ..utils import HitBox
+    from .spawn_wave import SpawnWave
+
+
+class SpawnGrid:
+    """
+    Occupancy grid of the places where the enemies of a wave can spawn.
+
+    Each slot is a place an enemy could be put in. Slots whose enemy would
+    collide with something are taken out of the free ones, so picking a
+    place never needs to test it against the other enemies.
+    """
+
+    def __init__(self, wave: "SpawnWave", occupied: Iterable["HitBox"]=()) -> None:
+        """
+        Initializes an instance of type 'SpawnGrid'.
+
+        'occupied' are the hitboxes already in the game, that the
+        new enemies must not collide with.
+        """
+
+        self.width: int = wave.width
+        self.height: int = wave.height
+        self.from_x: int = wave.from_x
+        self.from_y: int = wave.from_y
+        self.spacing_x: int = wave.spacing_x
+        self.spacing_y: int = wave.spacing_y
+
+        self.columns: int = max(0, ceil((wave.until_x - wave.from_x) / wave.spacing_x))
+        self.rows: int = max(0, ceil((wave.until_y - wave.from_y) / wave.spacing_y))
+
+        self._free: List[int] = list(range(self.columns * self.rows))
+        self._positions: List[Optional[int]] = list(self._free)
+
+        for box in occupied:
+            self.occupy(box)
+
+
+    def __len__(self) -> int:
+        """
+        Returns how many slots are still free.
+        """
+
+        return len(self._free)
+
+
+    def slot_box(self, slot: int) -> Tuple[int, int, int, int]:
+        """
+        Returns the corners of the enemy that would be put in a slot.
+        """
+
+        row, column = divmod(slot, self.columns)
+        x1 = self.from_x + column * self.spacing_x
+        y1 = self.from_y + row * self.spacing_y
+
+        return x1, y1, x1 + self.width - 1, y1 + self.height - 1
+
+
+    @staticmethod
+    def _colliding_range(start: int,
+                         spacing: int,
+                         size: int,
+                         count: int,
+                         low: float,
+                         high: float) -> range:
+        """
+        Returns the indexes of the slots of a row or column whose
+        enemy would overlap the segment from 'low' to 'high'.
+        """
+
+        first = max(0, ceil((low - size + 1 - start) / spacing))
+        last = min(count - 1, floor((high - start) / spacing))
+
+        return range(first, last + 1)
+
+
+    def occupy(self, box: "HitBox") -> None:
+        """
+        Takes out of the free slots all those that collide with 'box'.
+        """
+
+        self._occupy_corners(box.x1, box.y1, box.x2, box.y2)
+
+
+    def _discard(self, slot: int) -> None:
+        """
+        Takes a slot out of the free ones, if it is not already.
+        """
+
+        position = self._positions[slot]
+        if position is None:
+            return
+
+        last_slot = self._free.pop()
+        if last_slot != slot:
+            self._free[position] = last_slot
+            self._positions[last_slot] = position
+
+        self._positions[slot] = None
+
+
+    def take(self, rng: "Random") -> Optional[Tuple[int, int, int, int]]:
+        """
+        Picks a random free slot and occupies it.
+        Returns the corners of the enemy to put there, or 'None' if
+        there are no free slots left.
+        """
+
+        if not self._free:
+            return None
+
+        slot = self._free[rng.randrange(len(self._free))]
+        x1, y1, x2, y2 = self.slot_box(slot)
+
+        self._occupy_corners(x1, y1, x2, y2)
+
+        return x1, y1, x2, y2
+
+
+    def _occupy_corners(self, x1: int, y1: int, x2: int, y2: int) -> None:
+        """
+        Takes out of the free slots all those that collide with
+        the given corners.
+        """
+
+        columns = self._colliding_range(self.from_x, self.spacing_x, self.width,
+                                        self.columns, x1, x2)
+        rows = self._colliding_range(self.from_y, self.spacing_y, self.height,
+                                     self.rows, y1, y2)
+
+        for row in rows:
+            for column in columns:
+                self._discard(row * self.columns + column)
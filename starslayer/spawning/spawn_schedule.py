@@ -0,0 +1,128 @@
+"""
+Spawn Schedule Module. Compiles the waves of a level
+into a timeline of upcoming spawns.
+"""
+
+from heapq import heapify, heappop, heappush
+from typing import Dict, List, Optional, Tuple
+
+from ..files import load_json
+from .spawn_wave import SpawnWave, WaveDict
+
+LevelDict = Dict[str, Optional[int] | List[WaveDict]]
+TimelineEntry = Tuple[float, int, SpawnWave]
+
+
+class SpawnSchedule:
+    """
+    Timeline of the waves of the current level.
+
+    The waves are read once from the spawns file, and compiled into a heap
+    ordered by their next spawn time each time the level changes. Checking
+    the timeline when no wave is due costs O(1).
+    """
+
+    def __init__(self, spawns_path: str) -> None:
+        """
+        Initializes an instance of type 'SpawnSchedule'.
+        """
+
+        self.spawns_path: str = spawns_path
+        self.levels: List[Tuple[int, Optional[int], List[SpawnWave]]] = []
+        self.level: Optional[int] = None
+        self._timeline: List[TimelineEntry] = []
+
+        self.load()
+
+
+    def load(self) -> None:
+        """
+        Loads the waves of every level from the spawns file.
+        """
+
+        self.levels = [self._parse_level(level_dict)
+                       for level_dict in load_json(self.spawns_path).get("levels", [])]
+        self.level = None
+        self._timeline.clear()
+
+
+    @staticmethod
+    def _parse_level(level_dict: LevelDict) -> Tuple[int, Optional[int], List[SpawnWave]]:
+        """
+        Parses a level definition of the spawns file.
+        """
+
+        from_level = level_dict.get("from_level", 1)
+        until_level = level_dict.get("until_level", None)
+
+        if until_level is not None and until_level < from_level:
+            raise ValueError(f"Level range {from_level}-{until_level} is empty.")
+
+        return (from_level,
+                until_level,
+                [SpawnWave.from_dict(wave_dict) for wave_dict in level_dict.get("waves", [])])
+
+
+    def waves_of(self, level: int) -> List[SpawnWave]:
+        """
+        Returns the waves of a level. If more than one range includes the
+        level, the first one is used.
+        """
+
+        for from_level, until_level, waves in self.levels:
+            if from_level <= level and (until_level is None or level <= until_level):
+                return waves
+
+        return []
+
+
+    def compile(self, level: int, from_time: float) -> None:
+        """
+        Builds the timeline of a level, from 'from_time' onwards.
+        """
+
+        self.level = level
+        self._timeline = []
+
+        for index, wave in enumerate(self.waves_of(level)):
+            next_time = wave.next_time(from_time)
+
+            if next_time is not None:
+                self._timeline.append((next_time, index, wave))
+
+        heapify(self._timeline)
+
+
+    @property
+    def next_spawn_time(self) -> Optional[float]:
+        """
+        Returns when the next wave is due, if any.
+        """
+
+        return (self._timeline[0][0] if self._timeline else None)
+
+
+    def due_waves(self, current_time: float) -> List[SpawnWave]:
+        """
+        Returns the waves that spawn at 'current_time', in the order they
+        were declared, and schedules their next spawn.
+
+        Waves whose time passed without being checked are skipped.
+        """
+
+        due = []
+
+        while self._timeline and self._timeline[0][0] <= current_time:
+            spawn_time, index, wave = heappop(self._timeline)
+
+            if spawn_time == current_time:
+                due.append(wave)
+                next_time = wave.next_time(current_time + 1)
+
+            else:
+                next_time = wave.next_time(current_time)
+
+            if next_time is not None:
+                heappush(self._timeline, (next_time, index, wave))
+
+        return due
@@ -0,0 +1,157 @@
+"""
+Spawn Wave Module. A wave of enemies, with all its
+parameters already validated.
+"""
+
+from math import ceil
+from typing import Any, Dict, List, Optional
+
+from ..consts import HEIGHT, PLAYABLE_WIDTH, WIDTH
+from ..enemies import Enemy
+
+EnemyTypes = List[Optional["Enemy"]]
+WaveDict = Dict[str, Any]
+
+WIDTH_KEYS = ("width", "spacing_x", "from_x", "until_x")
+"""
+Keys of a wave in the spawns file that are fractions of the screen width.
+"""
+
+HEIGHT_KEYS = ("height", "spacing_y", "from_y", "until_y")
+"""
+Keys of a wave in the spawns file that are fractions of the screen height.
+"""
+
+
+class SpawnWave:
+    """
+    A wave of enemies that spawns at a given time, or periodically.
+    """
+
+    # pylint: disable=too-many-arguments, too-many-locals
+    def __init__(self,
+                 *,
+                 when: Optional[float]=None,
+                 each: Optional[float]=None,
+                 enemy_types: EnemyTypes,
+                 weights: Optional[List[float]]=None,
+                 amount_from: int=1,
+                 amount_until: int=1,
+                 width: int=(WIDTH // 25),
+                 height: int=(HEIGHT // 23),
+                 spacing_x: Optional[int]=None,
+                 spacing_y: Optional[int]=None,
+                 from_x: Optional[int]=None,
+                 until_x: Optional[int]=None,
+                 from_y: int=-50,
+                 until_y: int=0,
+                 disregard_timer_start: bool=False,
+                 target_player: bool=False,
+                 **gen_kwargs) -> None:
+        """
+        Initializes an instance of type 'SpawnWave'.
+
+        If 'target_player' is 'True', the player is given to the
+        enemies as their 'homing_target'.
+        """
+
+        if when is None and each is None:
+            raise TypeError("either 'when' or 'each' must be setted")
+
+        if weights is not None and (len(weights) != len(enemy_types)):
+            raise ValueError("If provided, the weights list must be of the same " +
+                             "length than the enemy types.")
+
+        if until_x is not None and until_x < width:
+            raise ValueError("The are end should be before the very width of the sprite.")
+
+        self.when: Optional[float] = when
+        self.each: Optional[float] = each
+        self.disregard_timer_start: bool = disregard_timer_start
+        self.can_spawn: bool = amount_from <= amount_until
+
+        self.enemy_types: EnemyTypes = enemy_types
+        self.weights: List[float] = weights or [1.0 for _ in enemy_types]
+
+        self.width: int = int(width)
+        self.height: int = int(height)
+        self.spacing_x: int = int(spacing_x or width)
+        self.from_x: int = int(from_x or width)
+        self.until_x: int = int(until_x or (PLAYABLE_WIDTH - 2 * width))
+
+        self.spacing_y: int = int(spacing_y or 5)
+        self.from_y: int = int(from_y)
+        self.until_y: int = int(until_y)
+        max_possible = self.until_x // (width + 1)
+
+        if amount_until >= max_possible:
+            amount_until = max_possible - 1
+
+            if amount_until < amount_from:
+                amount_from = amount_until
+
+        self.amount_from: int = amount_from
+        self.amount_until: int = amount_until
+
+        self.target_player: bool = target_player
+        self.gen_kwargs: Dict[str, Any] = gen_kwargs
+
+
+    @classmethod
+    def from_dict(cls, wave_dict: WaveDict) -> "SpawnWave":
+        """
+        Creates a wave from its definition in the spawns file.
+
+        There, enemy types are given by their class name (or 'null' for no
+        enemy), and the positions and sizes are fractions of the screen.
+        """
+
+        wave_kwargs = dict(wave_dict)
+
+        try:
+            wave_kwargs["enemy_types"] = [(Enemy.types[name] if name is not None else None)
+                                          for name in wave_kwargs.get("enemy_types", [])]
+
+        except KeyError as err:
+            raise ValueError(f"There is no enemy type named {err}.") from err
+
+        for key in WIDTH_KEYS:
+            if key in wave_kwargs:
+                wave_kwargs[key] = WIDTH * wave_kwargs[key]
+
+        for key in HEIGHT_KEYS:
+            if key in wave_kwargs:
+                wave_kwargs[key] = HEIGHT * wave_kwargs[key]
+
+        return cls(**wave_kwargs)
+
+
+    def is_due(self, current_time: float) -> bool:
+        """
+        Checks if the wave should spawn at the given time.
+        """
+
+        return not any(((not current_time if not self.disregard_timer_start else False),
+                        (self.when is not None and current_time != self.when),
+                        (self.each is not None and current_time % self.each != 0),
+                        not self.can_spawn))
+
+
+    def next_time(self, from_time: float) -> Optional[float]:
+        """
+        Returns the first time, from 'from_time' onwards, when the wave
+        should spawn; or 'None' if it never will again.
+        """
+
+        if not self.can_spawn:
+            return None
+
+        if self.when is not None:
+            return (self.when if self.when >= from_time and self.is_due(self.when) else None)
+
+        next_time = ceil(from_time / self.each) * self.each
+
+        if not self.is_due(next_time):
+            next_time += self.each
+
+        return next_time
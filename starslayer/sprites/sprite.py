@@ -3,14 +3,22 @@ Sprite Module. Contains the class
 which is used to store a game element's sprite.
 """
 
+from functools import lru_cache
 from os.path import basename, isdir
-from typing import List
+from typing import Callable, Dict, List, Tuple
 
 from ..color import Color, ColorsDict
 from ..consts import CUSTOMEXT, abs_path
 from ..files import count_files, path_join
+from ..telemetry import track
 
 FramesList = List[ColorsDict]
+FramesListener = Callable[[str, int, int, FramesList], None]
+
+_frames_listeners: List[FramesListener] = []
+"""
+What is called with every sprite folder, right after it is read.
+"""
 
 
 class Sprite:
@@ -25,91 +33,25 @@ class Sprite:
         'folder_path' should be a folder path relative to the 'textures' package.
         """
 
-        subpackage, *name = folder_path.rsplit('/', 1)
-        if not name:
-            name = subpackage
-            subpackage = None
-        else:
-            name = name[0]
-            subpackage = subpackage.replace('/', '.')
-
-        realpath = abs_path(name, ("textures" + (f".{subpackage}" if subpackage else '')))
-
-        if not isdir(realpath):
-            raise ValueError(f"'{folder_path}' is not a directory.")
+        realpath = sprite_realpath(folder_path)
+        width, height, frames = load_frames(realpath)
 
-        self._width: int = 0
-        self._height: int = 0
-        self._frames: FramesList = []
+        self._width: int = width
+        self._height: int = height
+        self._frames: FramesList = frames
         self.current_frame_index: int = 0
         self.path: str = realpath
-
-        spr_name = basename(realpath)
-        frames = count_files(realpath, CUSTOMEXT)
-
-        for frame in range(1, len(frames) + 1):
-
-            fr_path = path_join(realpath, f"{spr_name}_{frame:03d}.{CUSTOMEXT}")
-            with open(fr_path,
-                      mode='r',
-                      encoding="utf-8") as file:
-
-                pixels: ColorsDict = {}
-                pix_x = pix_y = -1
-
-                for line in file:
-                    sep = line.split()
-                    sep_str = ''.join(sep)
-                    sep_size = len(sep)
-
-                    # get rid of all whitespace and check comments
-                    if not sep_str or sep_str.startswith('#'):
-                        continue
-
-                    if sep_size == 2: # It's the sprite dimensions
-                        wid, hei = sep
-
-                        if (not self._width) and (not self._height):
-                            self._width, self._height = int(wid), int(hei)
-
-                        if (not self._width == int(wid)) or (not self._height == int(hei)):
-                            raise Exception("The dimensions of the frames are not the same.")
-
-                        continue
-
-                    if not sep_size % 4 == 0:
-                        raise Exception("One of the lines has an invalid amount of values.")
-
-                    # by now we are sure this is a row of pixels
-                    pix_y += 1
+        self.folder_path: str = folder_path
+        track(self)
 
 
-                    for elem in range(0, sep_size, 4):
-                        pix_x += 1
-                        rgba = sep[elem:elem+4]
-
-                        for i, comp in enumerate(rgba):
-                            if comp == '-':
-                                rgba[i] = None
-                            else:
-                                rgba[i] = int(comp)
-
-                        alpha = rgba[3]
-                        if alpha and (alpha > 0):
-                            red, green, blue, alpha = rgba
-                            color = Color(red, green, blue, int(alpha / 255 * 100))
-                        else:
-                            color = None
-
-                        pixels[(pix_x, pix_y)] = color
-
-                    pix_x = -1
-
-                self.frames.append(pixels)
-
+    def __reduce__(self) -> Tuple[type, Tuple[str], Dict[str, int]]:
+        """
+        Pickles the sprite as the folder it is loaded from, so that
+        its frames are not copied.
+        """
 
-        if not self._frames:
-            raise ValueError("There must be at least 1 frame.")
+        return (Sprite, (self.folder_path,), {"current_frame_index": self.current_frame_index})
 
 
     def __str__(self) -> str:
@@ -200,3 +142,117 @@ class Sprite:
             return
 
         self.current_frame_index += (0 if self.is_last() else 1)
+
+
+@lru_cache(maxsize=None)
+def sprite_realpath(folder_path: str) -> str:
+    """
+    Returns the absolute path of a sprite folder, relative to the 'textures' package.
+    """
+
+    subpackage, *name = folder_path.rsplit('/', 1)
+    if not name:
+        name = subpackage
+        subpackage = None
+    else:
+        name = name[0]
+        subpackage = subpackage.replace('/', '.')
+
+    realpath = abs_path(name, ("textures" + (f".{subpackage}" if subpackage else '')))
+
+    if not isdir(realpath):
+        raise ValueError(f"'{folder_path}' is not a directory.")
+
+    return realpath
+
+
+def on_frames_loaded(listener: FramesListener) -> None:
+    """
+    Calls 'listener' with the path, the width, the height and the
+    frames of every sprite folder read from now on, once each.
+    """
+
+    _frames_listeners.append(listener)
+
+
+@lru_cache(maxsize=None)
+def load_frames(realpath: str) -> Tuple[int, int, FramesList]:
+    """
+    Reads the frames of the sprite in 'realpath'. Each folder is only
+    read once, and its frames are shared by all the sprites loaded from it.
+    """
+
+    width = height = 0
+    frames: FramesList = []
+
+    spr_name = basename(realpath)
+    frame_files = count_files(realpath, CUSTOMEXT)
+
+    for frame in range(1, len(frame_files) + 1):
+
+        fr_path = path_join(realpath, f"{spr_name}_{frame:03d}.{CUSTOMEXT}")
+        with open(fr_path,
+                  mode='r',
+                  encoding="utf-8") as file:
+
+            pixels: ColorsDict = {}
+            pix_x = pix_y = -1
+
+            for line in file:
+                sep = line.split()
+                sep_str = ''.join(sep)
+                sep_size = len(sep)
+
+                # get rid of all whitespace and check comments
+                if not sep_str or sep_str.startswith('#'):
+                    continue
+
+                if sep_size == 2: # It's the sprite dimensions
+                    wid, hei = sep
+
+                    if (not width) and (not height):
+                        width, height = int(wid), int(hei)
+
+                    if (not width == int(wid)) or (not height == int(hei)):
+                        raise Exception("The dimensions of the frames are not the same.")
+
+                    continue
+
+                if not sep_size % 4 == 0:
+                    raise Exception("One of the lines has an invalid amount of values.")
+
+                # by now we are sure this is a row of pixels
+                pix_y += 1
+
+
+                for elem in range(0, sep_size, 4):
+                    pix_x += 1
+                    rgba = sep[elem:elem+4]
+
+                    for i, comp in enumerate(rgba):
+                        if comp == '-':
+                            rgba[i] = None
+                        else:
+                            rgba[i] = int(comp)
+
+                    alpha = rgba[3]
+                    if alpha and (alpha > 0):
+                        red, green, blue, alpha = rgba
+                        color = Color(red, green, blue, int(alpha / 255 * 100))
+                    else:
+                        color = None
+
+                    pixels[(pix_x, pix_y)] = color
+
+                pix_x = -1
+
+            frames.append(pixels)
+
+
+    if not frames:
+        raise ValueError("There must be at least 1 frame.")
+
+    for listener in _frames_listeners:
+        listener(realpath, width, height, frames)
+
+    return width, height, frames
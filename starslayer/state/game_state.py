@@ -7,31 +7,35 @@ of the game.
 from importlib import import_module
 from math import ceil
 from os import listdir
-from random import choices, randrange
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
-from ..consts import (ACTIONS_PATH, EXITING_DELAY, HEIGHT, HOOKS_GROUPS_PATH,
-                      PLAYABLE_WIDTH, PLAYER_HEALTH_BAR_ANIM, PROFILES_PATH,
-                      SCORES_PATH, SFX_SHOOT, WIDTH)
+from ..auxiliar import get_rng
+from ..backends import play_sound as lib_play_sound
+from ..consts import (ACTIONS_PATH, CULL_AREA, EXITING_DELAY, HEIGHT,
+                      HOOKS_GROUPS_PATH, PLAYER_HEALTH_BAR_ANIM, PROFILES_PATH,
+                      SCORES_PATH, SFX_SHOOT, SPAWNS_PATH, WIDTH)
 from ..drops import DropsList
-from ..enemies import EnemyCommonA, EnemyCommonB, EnemySwift
-from ..files import (ProfilesDict, StrDict, dump_json, get_action_from_key,
-                     list_action_keys, list_actions, list_profiles, load_json)
+from ..entity import Entity
+from ..files import (ProfilesDict, StrDict, get_action_from_key, list_action_keys,
+                     list_actions, list_profiles)
 from ..gamelib import EventType
-from ..gamelib import play_sound as lib_play_sound
 from ..hooks import HooksGroup
 from ..logger import GameLogger
 from ..scene import (AboutScene, CharacterScene, ControlScene, GameOverScene,
                      InGameScene, MainScene, OptionScene, ProfileScene, Scene,
                      SceneDict, ScoreBoardScene)
+from ..scoreboard import ScoreStore
 from ..selector import ColorSelector
-from ..utils import Chronometer, HitBox, HitCircle, Menu, Timer
+from ..settings import get_settings
+from ..spawning import AdmissionPool, SpawnGrid, SpawnSchedule, SpawnWave
+from ..telemetry import MemoryMonitor
+from ..utils import (Chronometer, HitBox, HitCircle, Menu, Timer, TimerWheel,
+                     use_timer_wheel)
 
 if TYPE_CHECKING:
     from ..bullets import Bullet
     from ..characters import PlayableCharacter
     from ..enemies import Enemy
-    from ..entity import Entity
     from ..gamelib import Event
     from ..utils import BoundingShape
 
@@ -40,7 +44,6 @@ TimerDict = Dict[str, Timer]
 ChronDict = Dict[str, Chronometer]
 EventsDict = Dict[str, bool]
 BulletsList = List["Bullet"]
-ScoreBoard = List[List[str | int]]
 
 
 class Game:
@@ -67,15 +70,15 @@ class Game:
 
         # Player Parameters
         self.player: Optional["PlayableCharacter"] = None
-        self.player_bullets: BulletsList = []
+        self.player_bullets: BulletsList = AdmissionPool("player_bullets")
 
         # Color Profiles
-        self.color_profiles: ProfilesDict = load_json(PROFILES_PATH)
+        self.color_profiles: ProfilesDict = get_settings(PROFILES_PATH).data
         self._color_theme: List[str] = list_profiles(self.color_profiles)[0]
         self.color_profile: StrDict = self.color_profiles[self._color_theme]
 
         # Sub-menu related
-        self.action_to_show: str = list_actions(load_json(ACTIONS_PATH))[0]
+        self.action_to_show: str = list_actions(get_settings(ACTIONS_PATH).data)[0]
         self.sub_menu: Optional[Menu] = None
 
         # Timers
@@ -83,13 +86,23 @@ class Game:
         self.special_timers: TimerDict = {"exiting_cooldown": Timer(EXITING_DELAY)}
         self.chronometers: ChronDict = {"real_time": Chronometer()}
 
+        # Timer wheels: one for every tick, and one for when time flows
+        self.timer_wheel: TimerWheel = TimerWheel()
+        self.flow_wheel: TimerWheel = TimerWheel()
+
         # Enemies
         self.enemies: List["Enemy"] = []
-        self.enemies_bullets: BulletsList = []
+        self.enemies_bullets: BulletsList = AdmissionPool("enemies_bullets")
 
         # Drops
         self.drops: DropsList = []
 
+        # Scores
+        self.scoreboard: ScoreStore = ScoreStore(SCORES_PATH)
+
+        # Spawns
+        self.spawn_schedule: SpawnSchedule = SpawnSchedule(SPAWNS_PATH)
+
         # Control Attributes
         self.control_attributes: Dict[str, bool] = {}
         self.control_attributes.update(is_on_prompt=False,
@@ -130,7 +143,7 @@ class Game:
         The key is guaranteed to already exist it the json file.
         """
 
-        return get_action_from_key(key, load_json(ACTIONS_PATH))
+        return get_action_from_key(key, get_settings(ACTIONS_PATH).data)
 
 
     def apply_events(self,
@@ -147,7 +160,7 @@ class Game:
 
         elif all((not events_dict.get(repeated_key, False)
                  for repeated_key in list_action_keys(original_action,
-                                                      load_json(ACTIONS_PATH)))):
+                                                      get_settings(ACTIONS_PATH).data))):
             self.events_processed[action] = False
 
 
@@ -321,8 +334,10 @@ class Game:
         self.game_level = 1
         self.times_upgraded = 0
         self.real_time.reset()
+        self.spawn_schedule.compile(self.game_level, self.real_time.current_time)
         self.used_cheats = False
         self.score = 0
+        MemoryMonitor().reset()
         self.change_scene("scene-in-game")
         self.change_menu_visibility(True)
 
@@ -645,25 +660,18 @@ class Game:
                            new_name: str,
                            new_power: str,
                            new_level: int,
-                           new_score: int) -> None:
+                           new_score: int,
+                           *,
+                           character: Optional[str]=None) -> None:
         """
         Adds a new score to the scoreboard.
         """
 
-        scores: ScoreBoard = load_json(SCORES_PATH).get("scores", None)
-
-        if scores is None:
-            return
-
-        scores.append([new_name, new_power, new_level, new_score])
-        scores.sort(reverse=True, key=(lambda elem : elem[3])) # sort by its fourth element
-
-        if len(scores) > 10:
-            while len(scores) > 10:
-                scores.pop() # Only ten values may exist at a time.
-
-
-        dump_json({"scores": scores}, SCORES_PATH)
+        self.scoreboard.add_score(new_name,
+                                  new_power,
+                                  new_level,
+                                  new_score,
+                                  character=character)
 
 
     def clear_scoreboard(self) -> None:
@@ -671,7 +679,7 @@ class Game:
         Empties the scoreboard.
         """
 
-        dump_json({"scores": []}, SCORES_PATH)
+        self.scoreboard.clear()
 
 
     def change_menu_visibility(self, value: bool) -> None:
@@ -757,7 +765,9 @@ class Game:
         Shoots bullets from player.
         """
 
-        self.player.power_level.shoot_bullets(self.player, self.player_bullets)
+        with use_timer_wheel(self.timer_wheel):
+            self.player.power_level.shoot_bullets(self.player, self.player_bullets)
+
         self.play_sound(SFX_SHOOT)
 
 
@@ -783,66 +793,64 @@ class Game:
         return self.real_time.current_time % awareness == 0
 
 
-    def shape_is_out_bounds(self, shape: "BoundingShape") -> bool:
+    @staticmethod
+    def shape_is_out_bounds(shape: "BoundingShape") -> bool:
         """
         Checks if a shape is outside the boundaries of the screen.
         """
 
-        return any((shape.is_over(-(HEIGHT * 0.15)),
-                    shape.is_below(HEIGHT * 1.15),
-                    shape.is_left_of(-(WIDTH * 0.2)),
-                    shape.is_right_of(WIDTH * 1.2)))
+        left, top, right, bottom = CULL_AREA
+        x1, y1, x2, y2 = shape.all_coords
 
+        return x2 < left or x1 > right or y2 < top or y1 > bottom
 
-    def check_shape_pos_and_entity_health(self,
-                                          entity: Union["Entity", "BoundingShape"],
-                                          container: List["Entity"]) -> bool:
-        """
-        Checks if an entity should disappear from the screen.
 
-        Returns 'True' if the entity in question is dead, otherwise
-        returns 'False'.
+    @staticmethod
+    def _cull(container: List[Union["Entity", "BoundingShape"]],
+              is_gone: Callable[[Any], bool]) -> List[Union["Entity", "BoundingShape"]]:
         """
+        Removes from a container, in one sweep, the shapes that are out of
+        the screen or are gone according to 'is_gone'. The container is
+        compacted in place, so other references to it stay valid.
 
-        return self.check_entity_existence(entity,
-                                           container,
-                                           (self.shape_is_out_bounds(entity),
-                                            entity.is_dead()))
+        Returns the shapes removed.
+        """
 
+        is_out_bounds = Game.shape_is_out_bounds
+        kept = []
+        removed = []
 
-    def check_shape_pos(self,
-                        entity: Union["Entity", "BoundingShape"],
-                        container: List["Entity"]) -> bool:
-        """
-        Checks if an shape should disappear from the screen.
+        for shape in container:
+            if is_out_bounds(shape) or is_gone(shape):
+                removed.append(shape)
+            else:
+                kept.append(shape)
 
-        Returns 'True' if the entity in question is dead, otherwise
-        returns 'False'.
-        """
+        if removed:
+            container[:] = kept
 
-        return self.check_entity_existence(entity,
-                                           container,
-                                           (self.shape_is_out_bounds(entity),)) # comma needed
+        return removed
 
 
-    def check_entity_existence(self,
-                              entity: Union["Entity", "BoundingShape"],
-                              container: List["Entity"],
-                              checks: Tuple[bool, ...]) -> bool:
+    def cull_entities(self) -> None:
         """
-        If any checks are set, the entity or shape is removed
-        from the container.
+        Removes every entity that died or left the screen during the tick.
+        Enemies and their bullets are only removed while time flows.
         """
 
-        if any(checks):
-            try:
-                container.remove(entity)
-            except ValueError:
-                pass
+        if self.is_time_flowing():
+            for enem in self._cull(self.enemies, Entity.is_dead):
+                enem.death_effect(self)
+                enem.give_loot(self.drops)
+
+            self._cull(self.enemies_bullets, Entity.is_dead)
 
-            return True
+        self._cull(self.player_bullets, Entity.is_dead)
+        self._cull(self.drops, lambda drop: drop.collected)
 
-        return False
+        # Only what is still over budget after culling is evicted
+        self.player_bullets.evict_overflow()
+        self.enemies_bullets.evict_overflow()
 
 
     def check_death_effects(self, threat: "Entity") -> None:
@@ -876,8 +884,7 @@ class Game:
         Updates the health bar animations.
         """
 
-        for health_bar_anim in self.current_scene.\
-                                find_animation_match(fr"^{PLAYER_HEALTH_BAR_ANIM}_[0-9]+$"):
+        for health_bar_anim in self.current_scene.find_tagged(PLAYER_HEALTH_BAR_ANIM):
             health_bar_anim.change_crop(self.player.health_percentage())
 
 
@@ -915,7 +922,6 @@ class Game:
 
     def check_damage_to_shield(self,
                                threat: "Entity",
-                               threat_container: List["Entity"],
                                *,
                                reciprocal: bool=True) -> None:
         """
@@ -940,9 +946,6 @@ class Game:
             self.check_death_effects(threat)
             received_damage = True
 
-        if self.is_time_flowing():
-            self.check_shape_pos_and_entity_health(threat, threat_container)
-
         return received_damage
 
 
@@ -952,10 +955,15 @@ class Game:
         Player bullets do not actually hurt the player.
         """
 
+        threats = self.all_threats
+
         for player_bullet in self.player_bullets:
             player_bullet.trajectory()
 
-            for threat in self.all_threats:
+            for threat in threats:
+                if threat.is_dead(): # it is removed at the end of the tick
+                    continue
+
                 if self._check_collision_type(threat, player_bullet):
                     threat.take_damage(player_bullet.hardness)
                     player_bullet.take_damage(threat.hardness)
@@ -963,8 +971,6 @@ class Game:
 
                     break
 
-            self.check_shape_pos_and_entity_health(player_bullet, self.player_bullets)
-
 
     def exec_enem_trajectory(self) -> None:
         """
@@ -972,16 +978,13 @@ class Game:
         """
 
         for enem in self.enemies:
-            self.check_damage_to_shield(enem, self.enemies)
+            self.check_damage_to_shield(enem)
             self.check_damage_to_player(enem)
 
             if not self.is_time_flowing():
                 continue
 
             enem.trajectory()
-            if self.check_shape_pos_and_entity_health(enem, self.enemies):
-                enem.death_effect(self)
-                enem.give_loot(self.drops)
             enem.try_shoot(self.enemies_bullets)
 
 
@@ -992,12 +995,11 @@ class Game:
         """
 
         for enem_bullet in self.enemies_bullets:
-            self.check_damage_to_shield(enem_bullet, self.enemies_bullets)
+            self.check_damage_to_shield(enem_bullet)
             self.check_damage_to_player(enem_bullet, reciprocal=True)
 
             if self.is_time_flowing():
                 enem_bullet.trajectory()
-                self.check_shape_pos_and_entity_health(enem_bullet, self.enemies_bullets)
 
 
     def exec_drop_trajectory(self) -> None:
@@ -1008,149 +1010,72 @@ class Game:
         for drop in self.drops:
             if self._check_collision_type(drop, self.player):
                 drop.effect(self)
-                self.drops.remove(drop)
+                drop.collected = True
+                continue
 
             drop.trajectory()
-            self.check_shape_pos(drop, self.drops)
-
-
-    def spawn_enemies(self,
-                      *,
-                      when: Optional[float]=None,
-                      each: Optional[float]=None,
-                      enemy_types: List["Enemy"],
-                      weights: Optional[List[float]]=None,
-                      amount_from: int=1,
-                      amount_until: int=1,
-                      width: int=(WIDTH // 25),
-                      height: int=(HEIGHT // 23),
-                      spacing_x: Optional[int]=None,
-                      spacing_y: Optional[int]=None,
-                      from_x: Optional[int]=None,
-                      until_x: Optional[int]=None,
-                      from_y: int=-50,
-                      until_y: int=0,
-                      disregard_timer_start: bool=False,
-                      **gen_kwargs) -> None:
-        """
-        Given the parameters, effectively spawns the enemies on the game.
-        """
-
-        if when is None and each is None:
-            raise TypeError("either 'when' or 'each' must be setted")
-
-        if weights is not None and (len(weights) != len(enemy_types)):
-            raise ValueError("If provided, the weights list must be of the same " +
-                             "length than the enemy types.")
-
-        if until_x is not None and until_x < width:
-            raise ValueError("The are end should be before the very width of the sprite.")
-
-        if any(((not self.real_time.current_time if not disregard_timer_start else False),
-                (when is not None and self.real_time.current_time != when),
-                (each is not None and self.real_time.current_time % each != 0),
-                amount_from > amount_until)):
-            return
 
-        weights_used = weights or [1.0 for _ in enemy_types]
 
-        spacing_x = spacing_x or width
-        from_x = from_x or width
-        until_x = until_x or (PLAYABLE_WIDTH - 2 * width)
+    def spawn_enemies(self, **wave_kwargs) -> None:
+        """
+        Given the parameters of a wave, effectively spawns
+        the enemies on the game if it is the time to.
+        """
+
+        wave = SpawnWave(**wave_kwargs)
 
-        spacing_y = spacing_y or 5
-        max_possible = until_x // (width + 1)
+        if wave.is_due(self.real_time.current_time):
+            self.spawn_wave(wave)
 
-        if amount_until >= max_possible:
-            amount_until = max_possible - 1
 
-            if amount_until < amount_from:
-                amount_from = amount_until
+    def spawn_wave(self, wave: SpawnWave) -> None:
+        """
+        Spawns the enemies of a wave.
+        """
+
+        rng = get_rng()
+        number_of_enemies = rng.randrange(wave.amount_from,
+                                          wave.amount_until + 1) # +1 'cause it's not inclusive
 
-        number_of_enemies = randrange(amount_from, amount_until + 1) # +1 'cause it's not inclusive
+        grid = SpawnGrid(wave, self.enemies)
 
-        range_x = lambda : randrange(from_x, until_x, spacing_x)
-        range_y = lambda : randrange(from_y, until_y, spacing_y)
+        gen_kwargs = wave.gen_kwargs
+        if wave.target_player:
+            gen_kwargs = dict(gen_kwargs, homing_target=self.player)
 
         for _ in range(number_of_enemies):
 
-            x1 = range_x()
-            y1 = range_y()
-
-            type_chosen = choices(enemy_types, weights_used)[0]
+            type_chosen = rng.choices(wave.enemy_types, wave.weights)[0]
             if not type_chosen:
                 continue
 
-            new_enemy: "Enemy" = type_chosen(x1=x1,
-                                             y1=y1,
-                                             x2=x1 + width - 1,
-                                             y2=y1 + height - 1,
-                                             can_spawn_outside=True,
-                                             **gen_kwargs)
-
-            if any(new_enemy.collides_with_box(enemy)
-                   for enemy in self.enemies):
-                continue
+            corners = grid.take(rng)
+            if corners is None: # the wave has no room left
+                break
 
-            self.enemies.append(new_enemy)
+            x1, y1, x2, y2 = corners
+            self.enemies.append(type_chosen(x1=x1,
+                                            y1=y1,
+                                            x2=x2,
+                                            y2=y2,
+                                            can_spawn_outside=True,
+                                            **gen_kwargs))
 
 
     def generate_enemies(self) -> None:
         """
-        Generates specific types on enemies depending on the
-        current game level.
+        Generates the enemies of the waves that are due,
+        depending on the current game level.
         """
 
         if not self.is_time_flowing():
             return
 
-        weak_enemies = [EnemyCommonA, EnemyCommonB, EnemySwift, None]
-
-        if self.game_level in range(1, 6): # level 1-5
-            self.spawn_enemies(each=475,
-                               enemy_types=weak_enemies,
-                               weights=[60.0, 40.0, 0.0, 0.0],
-                               amount_from=2,
-                               amount_until=3,
-                               disregard_timer_start=True)
-            self.spawn_enemies(each=200,
-                               enemy_types=weak_enemies,
-                               weights=[0.0, 0.0, 20.0, 80.0],
-                               amount_from=1,
-                               amount_until=1,
-                               until_x=WIDTH * 0.1,
-                               # Gen Kwargs
-                               homing_target=self.player)
-
-        elif self.game_level in range(6, 11): # level 6-10
-            self.spawn_enemies(each=350,
-                               enemy_types=weak_enemies,
-                               weights=[50.0, 50.0, 0.0, 0.0],
-                               amount_from=4,
-                               amount_until=6)
-            self.spawn_enemies(each=175,
-                               enemy_types=weak_enemies,
-                               weights=[0.0, 0.0, 25.0, 75.0],
-                               amount_from=1,
-                               amount_until=2,
-                               until_x=WIDTH * 0.1,
-                               # Gen Kwargs
-                               homing_target=self.player)
-
-        elif self.game_level >= 11: # level 11-inf
-            self.spawn_enemies(each=200,
-                               enemy_types=weak_enemies,
-                               weights=[50.0, 50.0, 0.0, 0.0],
-                               amount_from=6,
-                               amount_until=9)
-            self.spawn_enemies(each=150,
-                               enemy_types=weak_enemies,
-                               weights=[0.0, 0.0, 40.0, 60.0],
-                               amount_from=1,
-                               amount_until=2,
-                               until_x=WIDTH * 0.1,
-                               # Gen Kwargs
-                               homing_target=self.player)
+        if self.spawn_schedule.level != self.game_level:
+            self.spawn_schedule.compile(self.game_level, self.real_time.current_time)
+
+        for wave in self.spawn_schedule.due_waves(self.real_time.current_time):
+            self.spawn_wave(wave)
 
 
     def clear_assets(self) -> None:
@@ -1178,11 +1103,21 @@ class Game:
         if not self.is_in_game:
             return
 
-        self.generate_enemies()
-        self.exec_enem_trajectory()
-        self.exec_enem_bul_trajectory()
-        self.exec_player_bul_trajectory()
-        self.exec_drop_trajectory()
+        self.advance_timer_wheels()
+        self.admit_deferred_spawns()
+
+        # Enemies and their bullets only count time when it flows
+        with use_timer_wheel(self.flow_wheel):
+            self.generate_enemies()
+            self.exec_enem_trajectory()
+            self.exec_enem_bul_trajectory()
+
+        with use_timer_wheel(self.timer_wheel):
+            self.exec_player_bul_trajectory()
+            self.exec_drop_trajectory()
+
+        self.cull_entities()
+        MemoryMonitor().tick(self)
         self.player.check_damaged_sprite()
         self.player.refresh_hook()
 
@@ -1194,6 +1129,37 @@ class Game:
             self.end_game()
 
 
+    def admit_deferred_spawns(self) -> None:
+        """
+        Adds the bullets that were held back in past ticks, as many as fit in this one.
+        """
+
+        self.player_bullets.next_tick()
+        self.enemies_bullets.next_tick()
+
+
+    def spawn_metrics(self) -> Dict[str, int]:
+        """
+        Returns how many bullets were deferred, rejected and evicted so far.
+        """
+
+        player_metrics = self.player_bullets.metrics()
+        enemies_metrics = self.enemies_bullets.metrics()
+
+        return {name: player_metrics[name] + enemies_metrics[name] for name in player_metrics}
+
+
+    def advance_timer_wheels(self) -> None:
+        """
+        Advances the timer wheels by one tick, calling whatever timers expire.
+        """
+
+        self.timer_wheel.advance()
+
+        if self.is_time_flowing():
+            self.flow_wheel.advance()
+
+
     def refresh_timers(self) -> None:
         """
         Refreshes all the in-game timers of the game, so that it updates theirs values.
@@ -1235,7 +1201,7 @@ class Game:
         Refreshes the exit timer.
         """
 
-        exit_correct_keys = list_action_keys("EXIT", load_json(ACTIONS_PATH))
+        exit_correct_keys = list_action_keys("EXIT", get_settings(ACTIONS_PATH).data)
 
         if any(keys_dict.get(key, False) for key in exit_correct_keys):
 
@@ -0,0 +1,5 @@
+"""
+Telemetry Package.
+"""
+
+from .memory import *
@@ -0,0 +1,284 @@
+"""
+Memory Module. Counts the live instances of the classes of the game,
+and watches the containers of the game that could grow without bound.
+"""
+
+import tracemalloc
+from collections import deque
+from gc import collect
+from logging import DEBUG, INFO
+from os import environ
+from os.path import dirname, join
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Set
+from weakref import ref
+
+from ..auxiliar import Singleton
+from ..consts import (MEMORY_GROWTH_SAMPLES, MEMORY_SAMPLE_INTERVAL,
+                      MEMORY_TRACE_ENV, MEMORY_TRACE_TOP)
+from ..logger import GameLogger
+
+if TYPE_CHECKING:
+    from ..state import Game
+
+CountsDict = Dict[str, int]
+
+_live: Dict[str, Dict[int, ref]] = {}
+"""
+The weak references to every tracked instance, by class name and 'id'.
+"""
+
+_tracking: bool = False
+"""
+Whether new instances are tracked. It is off until the memory
+monitor samples, so that creating them costs nothing more.
+"""
+
+PACKAGE_FILES = join(dirname(dirname(__file__)), '*')
+"""
+The files whose allocations are traced. The ones of this
+module, which are the tracking itself, are left out.
+"""
+
+
+def track(obj: Any) -> None:
+    """
+    Counts 'obj' as a live instance of its class until it is collected.
+
+    Shapes are not hashable, so instead of a weak set the references
+    are kept by the 'id' of their object, which is forgotten as soon as
+    the object dies, before that 'id' can be given to another one.
+    """
+
+    if not _tracking:
+        return
+
+    refs = _live.setdefault(type(obj).__name__, {})
+    key = id(obj)
+    refs[key] = ref(obj, lambda _, refs=refs, key=key: refs.pop(key, None))
+
+
+def set_tracking(enabled: bool) -> None:
+    """
+    Starts or stops tracking new instances. Stopping it forgets
+    the instances tracked so far.
+    """
+
+    global _tracking # pylint: disable=global-statement
+
+    _tracking = enabled
+
+    if not enabled:
+        _live.clear()
+
+
+def is_tracking() -> bool:
+    """
+    Checks if new instances are being tracked.
+    """
+
+    return _tracking
+
+
+def live_counts() -> CountsDict:
+    """
+    Returns how many tracked instances of each class are alive.
+    """
+
+    return {name: len(refs) for name, refs in sorted(_live.items()) if refs}
+
+
+def container_sizes(game: "Game") -> CountsDict:
+    """
+    Returns the size of the containers of the game that nothing bounds.
+    """
+
+    return {"keys pressed": len(game.keys_pressed),
+            "keys released": len(game.keys_released),
+            "events processed": len(game.events_processed),
+            "combinations": len(game.combinations),
+            "chronometer splits": sum(len(chrono.splits)
+                                      for chrono in game.chronometers.values())}
+
+
+def stale_references(game: "Game") -> CountsDict:
+    """
+    Returns how many homing targets, of the player and of its bullets,
+    are enemies that are no longer in the game.
+    """
+
+    alive = {id(enemy) for enemy in game.enemies}
+    pools = [getattr(game.player, "homing_targets", None) or []]
+    pools.extend(getattr(bullet, "target_pool", None) or [] for bullet in game.player_bullets)
+
+    return {"stale targets": sum(id(target) not in alive
+                                 for pool in pools
+                                 for target in pool
+                                 if pool is not game.enemies)}
+
+
+class MemoryMonitor(metaclass=Singleton):
+    """
+    Samples the memory of the game every so many ticks, and logs
+    the counts that kept growing for many samples in a row.
+
+    It only samples, and instances are only tracked, while the debug info
+    is shown or while allocations are traced, so normal play never pays for
+    it. Instances created before that are not counted.
+    """
+
+    def __init__(self,
+                 *,
+                 interval: int=MEMORY_SAMPLE_INTERVAL,
+                 growth_samples: int=MEMORY_GROWTH_SAMPLES,
+                 trace: Optional[bool]=None) -> None:
+        """
+        Initializes an instance of type 'MemoryMonitor'.
+
+        If 'trace' is not given, allocations are traced only if
+        the MEMORY_TRACE_ENV environment variable is set.
+        """
+
+        if interval <= 0 or growth_samples <= 0:
+            raise ValueError("The interval and the growth samples must be positive.")
+
+        self.interval: int = interval
+        self.growth_samples: int = growth_samples
+        self.trace: bool = (bool(environ.get(MEMORY_TRACE_ENV)) if trace is None else trace)
+        self.reset()
+
+
+    def reset(self) -> None:
+        """
+        Forgets the samples taken so far, so that a new run
+        is not compared with the one before it.
+        """
+
+        self.ticks: int = 0
+        self.history: Deque[CountsDict] = deque(maxlen=self.growth_samples + 1)
+        self.growing: Set[str] = set()
+        self.entity_classes: Set[str] = set()
+        self.last_trace: Optional[tracemalloc.Snapshot] = None
+        self.top_growth: List[str] = []
+
+
+    def tick(self, game: "Game") -> None:
+        """
+        Counts a tick in game, and samples the memory if it is time to.
+        """
+
+        enabled = game.show_debug_info or self.trace
+
+        if enabled != is_tracking():
+            set_tracking(enabled)
+            self.reset()
+
+        if not enabled:
+            return
+
+        self.ticks += 1
+
+        if self.ticks % self.interval == 0:
+            self.sample(game)
+
+
+    def sample(self, game: "Game") -> CountsDict:
+        """
+        Takes a sample of the memory of the game, and returns it.
+
+        Only the youngest unreachable objects are collected first, as a
+        full collection takes longer than a frame. Older ones are counted
+        until the garbage collector gets to them, which a leak outgrows.
+        """
+
+        collect(0)
+        counts = live_counts()
+        sample = counts | container_sizes(game) | stale_references(game)
+
+        # Bullets waiting to be admitted, and the forms of morphing ones, are still in the game
+        in_game = (game.enemies + game.all_bullets + game.drops +
+                   list(game.player_bullets.deferred) + list(game.enemies_bullets.deferred))
+        in_game += [form for entity in in_game for form in getattr(entity, "forms", [])]
+        in_game_ids = {id(entity) for entity in in_game}
+
+        self.entity_classes.update(type(entity).__name__ for entity in in_game)
+        sample["lingering entities"] = sum(key not in in_game_ids
+                                           for name in self.entity_classes
+                                           for key in list(_live.get(name, {})))
+
+        self.history.append(sample)
+        self.check_growth()
+
+        if self.trace:
+            self.diff_trace()
+
+        if GameLogger().is_enabled(DEBUG, subsystem="memory"):
+            GameLogger().debug(f"Memory sample at tick {self.ticks}: {sample}",
+                               subsystem="memory")
+
+        return sample
+
+
+    def check_growth(self) -> None:
+        """
+        Logs every count that grew in each of the last samples, once.
+        """
+
+        if len(self.history) < self.history.maxlen:
+            return
+
+        for name, value in self.history[-1].items():
+            values = [sample.get(name, 0) for sample in self.history]
+
+            if name not in self.growing and all(a < b for a, b in zip(values, values[1:])):
+                self.growing.add(name)
+                GameLogger().warning(f"'{name}' grew for {len(values) - 1} memory samples " +
+                                     f"in a row, from {values[0]} to {value}.",
+                                     subsystem="memory")
+
+
+    def diff_trace(self, top: int=MEMORY_TRACE_TOP) -> List[str]:
+        """
+        Traces the allocations of the game, and returns the 'top' lines
+        whose memory grew the most since the last trace. Tracing is
+        started the first time, so there is nothing to compare with yet.
+        """
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(True,
+                                                                                 PACKAGE_FILES),
+                                                              tracemalloc.Filter(False, __file__)])
+
+        if self.last_trace is not None:
+            self.top_growth = [str(stat)
+                               for stat in snapshot.compare_to(self.last_trace, "lineno")[:top]
+                               if stat.size_diff > 0]
+
+            if GameLogger().is_enabled(INFO, subsystem="memory"):
+                GameLogger().info("Allocations that grew the most since the last trace:\n" +
+                                  '\n'.join(self.top_growth or ["(none)"]),
+                                  subsystem="memory")
+
+        self.last_trace = snapshot
+
+        return self.top_growth
+
+
+    def hud_text(self, top: int=MEMORY_TRACE_TOP) -> str:
+        """
+        Returns the latest sample, as it is shown in the debug info.
+        """
+
+        if not self.history:
+            return "Not sampled yet"
+
+        sample = self.history[-1]
+        counts = sorted(live_counts().items(), key=lambda item: item[1], reverse=True)[:top]
+        lines = [', '.join(f"{name}: {count}" for name, count in counts),
+                 f"Lingering: {sample['lingering entities']} - " +
+                 f"Stale Targets: {sample['stale targets']} - " +
+                 f"Splits: {sample['chronometer splits']}",
+                 f"Growing: {', '.join(sorted(self.growing)) or 'nothing'}"]
+
+        return '\n'.join(lines + [line.rsplit('/', 1)[-1] for line in self.top_growth])
@@ -6,4 +6,5 @@ from .button import *
 from .label import *
 from .menu import *
 from .shapes import *
+from .timer_wheel import *
 from .timers import *
@@ -13,14 +13,23 @@ class Label:
 
 
     # pylint: disable=invalid-name
-    def __init__(self, x: float, y: float, text: str='', **kwargs) -> None:
+    def __init__(self,
+                 x: float,
+                 y: float,
+                 text: str='',
+                 *,
+                 immutable: bool=True,
+                 **kwargs) -> None:
         """
         Initializes an instace of 'Label'.
+
+        If the label is immutable, its text is formatted only once.
         """
 
         self.x: float = x
         self.y: float = y
         self.text: str = text
+        self.immutable: bool = immutable
 
         self.properties: Dict = kwargs
 
@@ -5,13 +5,14 @@ Controls Menu Module.
 from typing import TYPE_CHECKING
 
 from ....auxiliar import Singleton
+from ....backends import say as lib_say
+from ....backends import wait as lib_wait
 from ....checks import left_click, on_press
 from ....consts import ACTIONS_PATH, HEIGHT, WIDTH
-from ....files import (dump_json, exists_key, get_action_from_key,
-                       list_actions, list_action_keys, load_json)
+from ....files import (exists_key, get_action_from_key, list_action_keys,
+                       list_actions)
 from ....gamelib import EventType
-from ....gamelib import say as lib_say
-from ....gamelib import wait as lib_wait
+from ....settings import get_settings
 from ...menu import ButtonKwargs, Menu, MenuDict
 from ...shapes import FloatTuple4
 from .controlsubmenu import ControlSubMenu
@@ -22,7 +23,7 @@ if TYPE_CHECKING:
     from ...button import Button
 
 
-__all__ = ["ControlsMenu"] # We DON'T want the local variable 'controlsmenu' to be exported
+__all__ = ["ControlsMenu"] # We DON'T want 'create_buttons' to be exported
 
 
 def create_buttons(menu: "ControlsMenu") -> None:
@@ -32,7 +33,7 @@ def create_buttons(menu: "ControlsMenu") -> None:
 
     menu.clear_buttons()
 
-    for action in list_actions(load_json(ACTIONS_PATH)):
+    for action in list_actions(get_settings(ACTIONS_PATH).data):
 
         @menu.button(message=action) # pylint: disable=cell-var-from-loop
         @left_click()
@@ -46,7 +47,7 @@ def create_buttons(menu: "ControlsMenu") -> None:
             """
 
             game.action_to_show = btn.msg
-            controlsmenu.refresh_sub_menu(game)
+            menu.refresh_sub_menu(game)
 
 
 class ControlsMenu(Menu, metaclass=Singleton):
@@ -70,6 +71,8 @@ class ControlsMenu(Menu, metaclass=Singleton):
                          max_rows=8,
                          **kwargs)
 
+        create_buttons(self)
+
 
     def refresh_sub_menu(self, game: "Game") -> None:
         """
@@ -77,7 +80,7 @@ class ControlsMenu(Menu, metaclass=Singleton):
         """
 
         submenu = ControlSubMenu()
-        repeated_keys = list_action_keys(game.action_to_show, load_json(ACTIONS_PATH))
+        repeated_keys = list_action_keys(game.action_to_show, get_settings(ACTIONS_PATH).data)
 
         submenu.clear_buttons()
 
@@ -96,7 +99,7 @@ class ControlsMenu(Menu, metaclass=Singleton):
                 Removes the key passed as an argument from the keys dictionary.
                 """
 
-                actions_dict = load_json(ACTIONS_PATH)
+                actions_dict = get_settings(ACTIONS_PATH).data
                 del_key = btn.msg.removeprefix("Delete ")
                 action_of_key = get_action_from_key(del_key, actions_dict)
 
@@ -111,7 +114,7 @@ class ControlsMenu(Menu, metaclass=Singleton):
                     game.keys_pressed.pop(del_key, None)
                     game.keys_released.pop(del_key, None)
 
-                    dump_json(actions_dict, ACTIONS_PATH)
+                    get_settings(ACTIONS_PATH).save()
                     self.refresh_sub_menu(game)
 
 
@@ -141,7 +144,7 @@ class ControlsMenu(Menu, metaclass=Singleton):
         sel_action = game.action_to_show
 
         event = lib_wait(EventType.KeyPress)
-        actions_dict = load_json(ACTIONS_PATH)
+        actions_dict = get_settings(ACTIONS_PATH).data
         success = False
 
         if not exists_key(event.key, actions_dict):
@@ -149,13 +152,9 @@ class ControlsMenu(Menu, metaclass=Singleton):
 
         if success:
             actions_dict[sel_action]["keys"].append(event.key)
-            dump_json(actions_dict, ACTIONS_PATH)
+            get_settings(ACTIONS_PATH).save()
             self.refresh_sub_menu(game)
 
         game.is_on_prompt = False
 
         return success
-
-
-controlsmenu = ControlsMenu() # instantiated temporarily
-create_buttons(controlsmenu)
@@ -6,10 +6,10 @@ from random import choice
 from typing import TYPE_CHECKING
 
 from ....auxiliar import Singleton
+from ....backends import input as lib_input
+from ....backends import say as lib_say
 from ....checks import left_click, on_press
 from ....consts import HEIGHT, USED_CHEATS_LINES, WIDTH
-from ....gamelib import input as lib_input
-from ....gamelib import say as lib_say
 from ...menu import ButtonKwargs, FloatTuple4, Menu, MenuDict
 
 if TYPE_CHECKING:
@@ -65,6 +65,7 @@ def continue_to_scoreboard(game: "Game",
             game.add_score_to_board(name,
                                     game.player.power_level.name,
                                     game.game_level,
-                                    game.score)
+                                    game.score,
+                                    character=type(game.player).__name__)
 
     game.change_scene("scene-scoreboard")
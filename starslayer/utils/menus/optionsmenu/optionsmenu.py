@@ -5,9 +5,9 @@ Options Menu Module.
 from typing import TYPE_CHECKING
 
 from ....auxiliar import Singleton
+from ....backends import say as lib_say
 from ....checks import left_click, on_press
 from ....consts import HEIGHT, SFX_AUDIO_ON, WIDTH
-from ....gamelib import say as lib_say
 from ...menu import ButtonKwargs, Menu, MenuDict
 from ...shapes import FloatTuple4
 
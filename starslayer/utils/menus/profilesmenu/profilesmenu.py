@@ -6,14 +6,15 @@ from random import choice
 from typing import TYPE_CHECKING
 
 from ....auxiliar import Singleton, copy_dict
+from ....backends import input as lib_input
+from ....backends import say as lib_say
+from ....backends import wait as lib_wait
 from ....checks import left_click, on_press
 from ....consts import (DEFAULT_THEME, DEFAULT_THEME_LINES, HEIGHT,
                         PROFILES_PATH, WIDTH)
-from ....files import dump_json, list_attributes, list_profiles, load_json
+from ....files import list_attributes, list_profiles
 from ....gamelib import EventType
-from ....gamelib import input as lib_input
-from ....gamelib import say as lib_say
-from ....gamelib import wait as lib_wait
+from ....settings import get_settings
 from ...menu import ButtonKwargs, Menu, MenuDict
 from ...shapes import FloatTuple4
 from .profilesubmenu import ProfileSubMenu
@@ -24,7 +25,7 @@ if TYPE_CHECKING:
     from ...button import Button
 
 
-__all__ = ["ProfilesMenu"] # We DON'T want the local variable 'profilesmenu' to be exported
+__all__ = ["ProfilesMenu"] # We DON'T want 'create_buttons' to be exported
 
 
 def create_buttons(menu: "ProfilesMenu") -> None:
@@ -34,7 +35,7 @@ def create_buttons(menu: "ProfilesMenu") -> None:
 
     menu.clear_buttons()
 
-    for profile in list_profiles(load_json(PROFILES_PATH)):
+    for profile in list_profiles(get_settings(PROFILES_PATH).data):
 
         @menu.button(message=profile) # pylint: disable=cell-var-from-loop
         @left_click()
@@ -69,7 +70,7 @@ def create_buttons(menu: "ProfilesMenu") -> None:
         game.color_profiles[new_theme_name] = copy_dict(game.color_profiles[DEFAULT_THEME])
 
         game.selected_theme = new_theme_name
-        dump_json(game.color_profiles, PROFILES_PATH)
+        get_settings(PROFILES_PATH).save()
         menu.refresh_sub_menu(game)
         create_buttons(menu)
 
@@ -96,6 +97,8 @@ class ProfilesMenu(Menu, metaclass=Singleton):
                          special_btn_on_right=False,
                          **kwargs)
 
+        create_buttons(self)
+
 
     def refresh_sub_menu(self, game: "Game") -> None:
         """
@@ -143,7 +146,7 @@ class ProfilesMenu(Menu, metaclass=Singleton):
             game.color_profiles[new_name] = game.color_profiles.pop(game.selected_theme)
             game.selected_theme = new_name
 
-            dump_json(game.color_profiles, PROFILES_PATH)
+            get_settings(PROFILES_PATH).save()
             self.refresh_sub_menu(game)
             create_buttons(self)
 
@@ -171,7 +174,7 @@ class ProfilesMenu(Menu, metaclass=Singleton):
             game.color_profiles.pop(game.selected_theme)
 
             game.selected_theme = themes_list[old_theme_index - 1]
-            dump_json(game.color_profiles, PROFILES_PATH)
+            get_settings(PROFILES_PATH).save()
             self.refresh_sub_menu(game)
             create_buttons(self)
 
@@ -223,11 +226,7 @@ class ProfilesMenu(Menu, metaclass=Singleton):
                 selector.exit = False
                 game.attribute_to_edit = None
 
-                dump_json(game.color_profiles, PROFILES_PATH)
+                get_settings(PROFILES_PATH).save()
                 game.is_on_prompt = False
 
                 break
-
-
-profilesmenu = ProfilesMenu() # instantiated temporarily
-create_buttons(profilesmenu)
@@ -5,9 +5,10 @@ for a bounding shape.
 
 from abc import ABC, abstractmethod
 from math import atan2, cos, sin, sqrt
-from typing import TYPE_CHECKING, Literal, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Literal, Optional, Tuple
 
 from ...sprites import Sprite
+from ...telemetry import track
 
 if TYPE_CHECKING:
     from .hitbox import HitBox
@@ -38,6 +39,16 @@ class BoundingShape(ABC):
         self.sprite: Optional[Sprite] = (Sprite(self.sprite_path) if self.sprite_path else None)
 
         self.properties = kwargs
+        track(self)
+
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restores the state of an unpickled shape, counting it as a live one.
+        """
+
+        self.__dict__.update(state)
+        track(self)
 
 
     @abstractmethod
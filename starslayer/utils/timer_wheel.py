@@ -0,0 +1,418 @@
+"""
+Timer Wheel Module. Contains a hierarchical timing wheel, advanced
+once per tick, and timers whose countdown is driven by it.
+"""
+
+from contextlib import contextmanager
+from math import ceil
+from typing import Any, Callable, Dict, Generator, List, Optional
+from weakref import WeakMethod
+
+from .timers import Timer
+
+WheelCallback = Callable[[], None]
+
+
+class ScheduledCall:
+    """
+    A callback scheduled in a timer wheel.
+    """
+
+    def __init__(self, deadline: int, callback: WheelCallback) -> None:
+        """
+        Initializes an instance of type 'ScheduledCall'.
+        """
+
+        self.deadline: int = deadline
+        self.callback: WheelCallback = callback
+        self.cancelled: bool = False
+
+
+    def cancel(self) -> None:
+        """
+        Prevents the callback from being called.
+        """
+
+        self.cancelled = True
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel.
+
+    Each level has '2 ** slot_bits' slots, and each slot of a level spans
+    as many ticks as the whole level below it. Callbacks are only touched
+    when they are due or when their slot cascades into a lower level, so
+    advancing the wheel does not depend on how many timers there are.
+    """
+
+    def __init__(self, *, slot_bits: int=8, levels: int=4) -> None:
+        """
+        Initializes an instance of type 'TimerWheel'.
+        """
+
+        if slot_bits < 1 or levels < 1:
+            raise ValueError("There must be at least one level with two slots.")
+
+        self.tick: int = 0
+        self._bits: int = slot_bits
+        self._mask: int = (1 << slot_bits) - 1
+        self._levels: List[List[List[ScheduledCall]]] = [[[] for _ in range(1 << slot_bits)]
+                                                         for _ in range(levels)]
+        self._overflow: List[ScheduledCall] = []
+
+
+    def __len__(self) -> int:
+        """
+        Returns how many callbacks are scheduled, counting the cancelled ones
+        that have not been discarded yet.
+        """
+
+        return (sum(len(slot) for level in self._levels for slot in level)
+                + len(self._overflow))
+
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Returns the state of the wheel to be pickled. Only the calls
+        still pending are kept, not the slots they are in.
+        """
+
+        return {"tick": self.tick,
+                "slot_bits": self._bits,
+                "levels": len(self._levels),
+                "calls": [call
+                          for level in self._levels
+                          for slot in level
+                          for call in slot
+                          if not call.cancelled] + [call
+                                                    for call in self._overflow
+                                                    if not call.cancelled]}
+
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restores the state of an unpickled wheel, putting
+        the pending calls back into their slots.
+        """
+
+        self.__init__(slot_bits=state["slot_bits"], levels=state["levels"])
+        self.tick = state["tick"]
+
+        for call in state["calls"]:
+            self._place(call)
+
+
+    def schedule(self, delay: float, callback: WheelCallback) -> ScheduledCall:
+        """
+        Schedules a callback to be called after 'delay' ticks.
+        A delay lesser than one tick means the next one.
+        """
+
+        call = ScheduledCall(self.tick + max(1, ceil(delay)), callback)
+        self._place(call)
+
+        return call
+
+
+    def _place(self, call: ScheduledCall) -> None:
+        """
+        Puts a scheduled call in the slot it belongs to.
+        """
+
+        diff = call.deadline - self.tick
+
+        if diff <= 0:
+            self._levels[0][self.tick & self._mask].append(call)
+            return
+
+        for level_num, level in enumerate(self._levels):
+            if diff < (1 << (self._bits * (level_num + 1))):
+                level[(call.deadline >> (self._bits * level_num)) & self._mask].append(call)
+                return
+
+        self._overflow.append(call)
+
+
+    def _cascade(self) -> None:
+        """
+        Moves the calls of the upper levels that are now closer
+        to their deadline into the lower ones.
+        """
+
+        for level_num in range(1, len(self._levels)):
+            slot_num = (self.tick >> (self._bits * level_num)) & self._mask
+            calls = self._levels[level_num][slot_num]
+            self._levels[level_num][slot_num] = []
+
+            for call in calls:
+                if not call.cancelled:
+                    self._place(call)
+
+            if slot_num != 0:
+                return
+
+        overflow = self._overflow
+        self._overflow = []
+
+        for call in overflow:
+            if not call.cancelled:
+                self._place(call)
+
+
+    def advance(self) -> None:
+        """
+        Advances the wheel by one tick, calling whatever is due.
+        """
+
+        self.tick += 1
+
+        if not self.tick & self._mask:
+            self._cascade()
+
+        slot_num = self.tick & self._mask
+        calls = self._levels[0][slot_num]
+        self._levels[0][slot_num] = []
+
+        for call in calls:
+            if not call.cancelled:
+                call.callback()
+
+
+class WheelTimer(Timer):
+    """
+    Timer whose countdown is driven by a timer wheel, so it does not
+    need to be counted every tick.
+
+    If 'on_expire' is given, it is called by the wheel when the time is up.
+    If 'repeat' is 'True', the timer restarts on its own after being up for
+    one tick, as a 'Timer' counted with 'reset=True' would.
+
+    A paused timer keeps its current time, as a 'Timer' nobody counts would,
+    until it is resumed.
+    """
+
+    def __init__(self,
+                 base_time: float,
+                 *,
+                 wheel: Optional[TimerWheel]=None,
+                 on_expire: Optional[WheelCallback]=None,
+                 repeat: bool=False,
+                 **kwargs) -> None:
+        """
+        Initializes an instance of type 'WheelTimer'.
+
+        Bound methods given as 'on_expire' are only weakly referenced,
+        so the timer does not keep their owner alive.
+        """
+
+        self.wheel: TimerWheel = (wheel if wheel is not None else get_timer_wheel())
+        self.repeat: bool = repeat
+        self.deadline: int = self.wheel.tick
+        self.paused_time: Optional[float] = None
+        self._on_expire: Optional[Callable[[], Optional[WheelCallback]]] = None
+        self._scheduled: Optional[ScheduledCall] = None
+
+        self._set_on_expire(on_expire)
+
+        super().__init__(base_time, **kwargs)
+
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Returns the state of the timer to be pickled, with the
+        expiration callback strongly referenced.
+        """
+
+        state = self.__dict__.copy()
+        state["_on_expire"] = (self._on_expire() if self._on_expire is not None else None)
+
+        return state
+
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restores the state of an unpickled timer.
+        """
+
+        on_expire = state.pop("_on_expire")
+        super().__setstate__(state)
+        self._on_expire = None
+        self._set_on_expire(on_expire)
+
+
+    def _set_on_expire(self, on_expire: Optional[WheelCallback]) -> None:
+        """
+        Keeps the expiration callback, weakly if it is a bound method.
+        """
+
+        if on_expire is not None:
+            self._on_expire = (WeakMethod(on_expire)
+                               if hasattr(on_expire, "__self__")
+                               else lambda: on_expire)
+
+
+    @property
+    def period(self) -> int:
+        """
+        Returns how many ticks it takes for a repeating timer to be up again.
+        """
+
+        return ceil(self.base_time - self.goal_time) + 1
+
+
+    @property
+    def current_time(self) -> float:
+        """
+        Returns the current time of the countdown.
+        """
+
+        if self.paused_time is not None:
+            return self.paused_time
+
+        self._wrap_deadline()
+        return self.goal_time + max(0, self.deadline - self.wheel.tick)
+
+
+    @current_time.setter
+    def current_time(self, new_time: float) -> None:
+        """
+        Moves the deadline so that the countdown is at 'new_time'.
+        """
+
+        if self.paused_time is not None:
+            self.paused_time = float(new_time)
+            return
+
+        self.deadline = self.wheel.tick + ceil(new_time - self.goal_time)
+        self._schedule()
+
+
+    def pause(self) -> None:
+        """
+        Stops the countdown where it is, until the timer is resumed.
+        """
+
+        if self.paused_time is not None:
+            return
+
+        self.paused_time = self.current_time
+
+        if self._scheduled is not None:
+            self._scheduled.cancel()
+            self._scheduled = None
+
+
+    def resume(self) -> None:
+        """
+        Goes on with the countdown from where it was paused.
+        """
+
+        if self.paused_time is None:
+            return
+
+        paused_time = self.paused_time
+        self.paused_time = None
+        self.current_time = paused_time
+
+
+    def _wrap_deadline(self) -> None:
+        """
+        Moves the deadline of a repeating timer to its next cycle, if
+        it has already passed.
+        """
+
+        overdue = self.wheel.tick - self.deadline
+        if self.repeat and overdue > 0:
+            self.deadline += ceil(overdue / self.period) * self.period
+
+
+    def _schedule(self) -> None:
+        """
+        Schedules the expiration callback, if any, at the current deadline.
+        """
+
+        if self._on_expire is None:
+            return
+
+        if self._scheduled is not None:
+            self._scheduled.cancel()
+
+        self._scheduled = self.wheel.schedule(self.deadline - self.wheel.tick, self._expire)
+
+
+    def _expire(self) -> None:
+        """
+        Calls the expiration callback, restarting the timer if it repeats.
+        """
+
+        self._scheduled = None
+        callback = self._on_expire()
+
+        if callback is None: # its owner no longer exists
+            return
+
+        callback()
+
+        if self.repeat:
+            self.deadline += self.period
+            self._schedule()
+
+
+    def deduct(self, how_much: float) -> None:
+        """
+        Brings the deadline 'how_much' ticks closer.
+        """
+
+        self.current_time = self.current_time - float(how_much)
+
+
+    def time_is_up(self) -> bool:
+        """
+        Returns 'True' if the deadline was reached, or 'False' otherwise.
+        """
+
+        if self.paused_time is not None:
+            return self.paused_time <= self.goal_time
+
+        self._wrap_deadline()
+        return self.wheel.tick >= self.deadline
+
+
+_timer_wheel = TimerWheel()
+
+
+def get_timer_wheel() -> TimerWheel:
+    """
+    Returns the timer wheel new timers are bound to.
+    """
+
+    return _timer_wheel
+
+
+def set_timer_wheel(new_wheel: TimerWheel) -> TimerWheel:
+    """
+    Changes the timer wheel new timers are bound to, and returns the old one.
+    """
+
+    global _timer_wheel # pylint: disable=global-statement
+
+    old_wheel = _timer_wheel
+    _timer_wheel = new_wheel
+
+    return old_wheel
+
+
+@contextmanager
+def use_timer_wheel(wheel: TimerWheel) -> Generator[TimerWheel, None, None]:
+    """
+    Binds the timers created inside the block to 'wheel'.
+    """
+
+    old_wheel = set_timer_wheel(wheel)
+
+    try:
+        yield wheel
+
+    finally:
+        set_timer_wheel(old_wheel)
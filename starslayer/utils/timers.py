@@ -3,7 +3,9 @@ Timers Module. Contains simple timers to
 handle event timing.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+
+from ..telemetry import track
 
 
 class Timer:
@@ -29,6 +31,16 @@ class Timer:
         self.goal_time: float = dest_time
         self.current_time: float = init_time or base_time
         self.msg: str = message
+        track(self)
+
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restores the state of an unpickled timer, counting it as a live one.
+        """
+
+        self.__dict__.update(state)
+        track(self)
 
 
     def __str__(self) -> str:
@@ -124,6 +136,16 @@ class SpringTimer:
         self.ceil: float = ceiling
         self.current_time: float = where_to_start
         self.adding: bool = is_it_adding
+        track(self)
+
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restores the state of an unpickled timer, counting it as a live one.
+        """
+
+        self.__dict__.update(state)
+        track(self)
 
 
     def __str__(self) -> str:
@@ -186,6 +208,16 @@ class Chronometer:
         self.current_time: float = self.initial_time
         self.splits: List[float] = []
         self.can_count: bool = can_count
+        track(self)
+
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restores the state of an unpickled timer, counting it as a live one.
+        """
+
+        self.__dict__.update(state)
+        track(self)
 
 
     def __str__(self) -> str: